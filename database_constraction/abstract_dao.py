@@ -23,6 +23,24 @@ Usage:
             # INSERT INTO ...
 2) `create_table(conn)` can be called to ensure the table schema is created.
 3) `insert(conn, *args, **kwargs)` handles inserting row(s) specific to that table.
+4) `insert_many(conn, rows)` inserts many pre-built row tuples in one transaction,
+   using the class-level `_INSERT_SQL` statement.
+5) `bulk_load(conn, rows)` drops the table's secondary indexes, inserts all rows,
+   then rebuilds the indexes once. Subclasses list their index DDL in `_INDEXES`.
+6) `insert_chunked(conn, rows, chunk_size=10_000)` streams an arbitrarily large
+   iterable in fixed-size transactions so each commit's dirty pages fit in cache.
+7) `insert_values_expanded(conn, rows, group=100)` packs `group` rows into one
+   multi-row `INSERT ... VALUES (..), (..), ...` statement for small rows.
+8) `SomeTableDAO.connect(path)` opens a connection with the performance PRAGMAs
+   (WAL, synchronous=NORMAL, large page cache, mmap) already applied; use it
+   in place of a bare `sqlite3.connect(path)`.
+9) A DAO constructed with a database path (`SomeTableDAO("data/patent.db")`)
+   keeps one such connection per thread; pass `conn=None` to the provided
+   methods to use it instead of opening a connection per call.
+10) Under concurrent writers, `dao.submit(rows)` queues rows for a single
+    writer thread and `dao.read(sql, params)` queries a read-only pool.
+11) `dao.insert_many(conn, dao.preprocess(frame))` cleans input in bulk first;
+    mix in NumpyDAOMixin for a vectorized pandas implementation.
 
 Production-Level Considerations:
 -------------------------------
@@ -33,12 +51,715 @@ Production-Level Considerations:
   for robust error handling in production.
 """
 
-from abc import ABC, abstractmethod
+from abc import ABC
+import csv
+from concurrent.futures import Future
+from dataclasses import dataclass
+import hashlib
+import itertools
+import keyword
+import logging
+import operator
+import queue
+import re
 import sqlite3
-from typing import Any
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache, wraps
+from typing import (
+    Any, Callable, ClassVar, Dict, Generator, Iterable, List, Optional, Protocol, Sequence, Tuple, runtime_checkable
+)
+
+# Connection-level tuning applied by AbstractTableDAO.connect():
+#   page_size=65536       -> 64 KiB pages for new databases: fewer, shallower B-tree pages.
+#                            Must precede journal_mode=WAL; a no-op on existing files.
+#   journal_mode=WAL      -> one sequential append per commit; readers never block writers
+#   synchronous=NORMAL    -> fsync only at checkpoints instead of on every commit (safe in WAL)
+#   wal_autocheckpoint    -> 10000 pages instead of 1000, so bulk loads are not stalled
+#                            by frequent automatic checkpoints (see AbstractTableDAO.checkpoint)
+#   temp_store=MEMORY     -> temp b-trees (sorts, index builds) stay in RAM
+#   cache_size=-65536     -> 64 MiB page cache (negative values are KiB)
+#   mmap_size=268435456   -> 256 MiB memory-mapped I/O, avoiding read() syscalls for hot pages
+_WRITE_PRAGMAS = """
+PRAGMA page_size = 65536;
+PRAGMA journal_mode = WAL;
+PRAGMA synchronous = NORMAL;
+PRAGMA wal_autocheckpoint = 10000;
+"""
+_CACHE_PRAGMAS = """
+PRAGMA temp_store = MEMORY;
+PRAGMA cache_size = -65536;
+PRAGMA mmap_size = 268435456;
+"""
+
+# How long SQLite's own busy handler waits for a lock before raising
+# "database is locked" (passed as sqlite3.connect(timeout=...)).
+_BUSY_TIMEOUT_S = 5.0
+
+# Page size requested for new databases created through a TableSpec.
+_SPEC_PAGE_SIZE = 65536
+
+_CHECKPOINT_MODES = ("PASSIVE", "FULL", "RESTART", "TRUNCATE")
+
+# Size of sqlite3's per-connection prepared-statement cache (the default is 128 on
+# recent Pythons but only 100 on older ones). It must cover every distinct SQL
+# string a DAO workload issues, or statements get evicted and re-parsed.
+# The cache is disabled on CPython 3.11.0-3.11.3, whose sqlite3 statement cache
+# has a known defect fixed in 3.11.4; upgrade to get statement reuse back.
+_STATEMENT_CACHE_BROKEN = (3, 11, 0) <= sys.version_info[:3] < (3, 11, 4)
+_CACHED_STATEMENTS = 0 if _STATEMENT_CACHE_BROKEN else 256
+if _STATEMENT_CACHE_BROKEN:
+    logging.getLogger(__name__).warning(
+        "Python %d.%d.%d: sqlite3 statement cache disabled; use 3.11.4 or newer.",
+        *sys.version_info[:3]
+    )
+
+# Extracts the index name from "CREATE [UNIQUE] INDEX [IF NOT EXISTS] name ON ..."
+_INDEX_NAME_RE = re.compile(
+    r"CREATE\s+(?:UNIQUE\s+)?INDEX\s+(?:IF\s+NOT\s+EXISTS\s+)?([\w.]+)",
+    re.IGNORECASE
+)
+
+# Splits "INSERT ... VALUES (?, ?)" into the statement prefix and one row placeholder.
+_VALUES_SPLIT_RE = re.compile(r"^(.*\bVALUES\s*)(\(.*\))\s*;?\s*$", re.IGNORECASE | re.DOTALL)
+
+# Splits "INSERT [OR ...] INTO table (cols) ..." into verb, table and column list.
+_INSERT_TARGET_RE = re.compile(
+    r"^\s*(INSERT(?:\s+OR\s+\w+)?)\s+INTO\s+(\w+)\s*\(([^)]*)\)", re.IGNORECASE
+)
+
+# Schema name for the in-memory staging database used by bulk_load_via_memory.
+_STAGE_SCHEMA = "_stage"
+
+# SQLITE_MAX_VARIABLE_NUMBER before SQLite 3.32; used if the runtime limit cannot be read.
+_DEFAULT_MAX_VARIABLES = 999
+
+
+def configure_connection(conn: sqlite3.Connection, *, read_only: bool = False) -> None:
+    """
+    Apply the performance PRAGMAs to an already-open connection.
+
+    Call once per connection, before the first statement (in particular before
+    the first CREATE TABLE, so page_size still applies to a new file). Use it
+    for connections not opened through `AbstractTableDAO.connect`;
+    `db_context.db_connection` already calls it for the connections it yields.
+
+    Parameters
+    ----------
+    conn : sqlite3.Connection
+        The connection to configure. Any pending implicit transaction is
+        committed first (executescript semantics).
+    read_only : bool
+        Skip the PRAGMAs that write the database header (page_size, journal_mode).
+
+    Notes
+    -----
+    journal_mode=WAL, synchronous=NORMAL, temp_store=MEMORY, a 64 MiB page cache,
+    256 MiB mmap and a 5 s busy timeout; see the comment on `_WRITE_PRAGMAS`.
+    """
+    if not read_only:
+        conn.executescript(_WRITE_PRAGMAS)
+    conn.executescript(_CACHE_PRAGMAS)
+    conn.execute(f"PRAGMA busy_timeout = {int(_BUSY_TIMEOUT_S * 1000)}")
+
+
+def connect_apsw(path: str) -> Any:
+    """
+    Open an `apsw.Connection` with the same PRAGMAs as `configure_connection`.
+
+    apsw is a thinner wrapper over the SQLite C API than the stdlib module and
+    has lower per-call overhead for many small statements. The DAOs' write
+    paths only use `conn.execute` / `conn.executemany`, and `transaction()`
+    accepts apsw connections, so an apsw connection can be passed wherever the
+    insert helpers take a connection. apsw is optional and imported lazily.
+
+    Parameters
+    ----------
+    path : str
+        Filesystem path to the SQLite database.
+
+    Returns
+    -------
+    apsw.Connection
+        A configured connection (autocommit until `BEGIN`, like apsw's default).
+
+    Raises
+    ------
+    ImportError
+        If apsw is not installed.
+    """
+    import apsw
+
+    conn = apsw.Connection(path)
+    conn.setbusytimeout(int(_BUSY_TIMEOUT_S * 1000))
+    conn.execute(_WRITE_PRAGMAS)
+    conn.execute(_CACHE_PRAGMAS)
+    return conn
+
+
+@contextmanager
+def transaction(conn: sqlite3.Connection) -> Generator[sqlite3.Connection, None, None]:
+    """
+    Run a block of statements inside one explicit transaction.
+
+    If the connection is already inside a transaction (e.g. an outer
+    `db_connection` block that has executed DML), the block simply joins it,
+    and commit/rollback is left to the owner of the outer transaction.
+    Otherwise BEGIN is issued here and the block is committed on success or
+    rolled back on any exception.
+
+    Parameters
+    ----------
+    conn : sqlite3.Connection or apsw.Connection
+        The database connection to run the transaction on.
+
+    Yields
+    ------
+    sqlite3.Connection
+        The same connection, for convenience.
+    """
+    if hasattr(conn, "commit"):
+        in_transaction = conn.in_transaction
+        commit, rollback = conn.commit, conn.rollback
+    else:  # apsw.Connection: no commit()/rollback(), autocommit flag instead
+        in_transaction = not conn.getautocommit()
+        commit = lambda: conn.execute("COMMIT")
+        rollback = lambda: conn.execute("ROLLBACK")
+
+    if in_transaction:
+        yield conn
+        return
+
+    conn.execute("BEGIN")
+    try:
+        yield conn
+    except Exception:
+        rollback()
+        raise
+    else:
+        commit()
+
+
+@dataclass(frozen=True)
+class TableSpec:
+    """
+    Declarative table description from which AbstractTableDAO can generate DDL.
+
+    Fields:
+    -------
+    name : str
+        Table name.
+    columns : Sequence[Tuple[str, str]]
+        (column_name, declaration) pairs, e.g. ("patent_id", "TEXT NOT NULL").
+        A column declared "INTEGER PRIMARY KEY" is a rowid alias and is left out
+        of the generated INSERT.
+    primary_key : Tuple[str, ...]
+        Table-level primary key columns. Required when without_rowid is True.
+    without_rowid : bool
+        Emit WITHOUT ROWID. Worth it when the primary key is a natural key: the
+        row is stored once, in the primary-key B-tree, instead of in a rowid
+        table plus a separate unique index.
+    indexes : Sequence[str]
+        Secondary index DDL, used as the DAO's `_INDEXES`.
+    constraints : Sequence[str]
+        Extra table constraints, e.g. FOREIGN KEY clauses.
+    """
+    name: str
+    columns: Sequence[Tuple[str, str]]
+    primary_key: Tuple[str, ...] = ()
+    without_rowid: bool = False
+    indexes: Sequence[str] = ()
+    constraints: Sequence[str] = ()
+
+    def __post_init__(self):
+        if self.without_rowid and not self.primary_key:
+            raise ValueError(f"WITHOUT ROWID table '{self.name}' needs a primary_key")
+
+    @property
+    def insert_columns(self) -> Tuple[str, ...]:
+        """
+        Columns supplied by INSERT statements (everything except a rowid alias).
+        """
+        return tuple(
+            col for col, decl in self.columns
+            if not decl.upper().startswith("INTEGER PRIMARY KEY")
+        )
+
+    def create_sql(self) -> str:
+        """
+        Build the CREATE TABLE IF NOT EXISTS statement.
+        """
+        parts = [f"{col} {decl}" for col, decl in self.columns]
+        if self.primary_key:
+            parts.append(f"PRIMARY KEY ({', '.join(self.primary_key)})")
+        parts.extend(self.constraints)
+        body = ",\n    ".join(parts)
+        suffix = " WITHOUT ROWID" if self.without_rowid else ""
+        return f"CREATE TABLE IF NOT EXISTS {self.name} (\n    {body}\n){suffix}"
+
+    def insert_sql(self, verb: str = "INSERT") -> str:
+        """
+        Build the parameterized single-row INSERT statement.
+        """
+        cols = self.insert_columns
+        placeholders = ", ".join("?" * len(cols))
+        return f"{verb} INTO {self.name} ({', '.join(cols)}) VALUES ({placeholders})"
+
+
+def retry_on_busy(fn: Optional[Callable] = None, *, tries: int = 5, base_delay: float = 0.01) -> Callable:
+    """
+    Retry a write on "database is locked" with exponential backoff.
+
+    The connection's busy timeout already waits inside SQLite for most lock
+    conflicts. What it cannot absorb is SQLITE_BUSY returned immediately, e.g.
+    when a WAL read transaction tries to upgrade to a write after another
+    writer committed; the only fix there is to run the statement again.
+
+    Arguments are passed through untouched, so only decorate functions whose
+    arguments can be consumed twice (not generators of rows). No retry is
+    attempted while the connection is still inside a transaction: the failed
+    call joined an outer transaction whose earlier writes would be repeated,
+    so the error goes to the caller that owns it. For a ConnectionProvider
+    method called with `conn=None`, the thread-local connection is checked.
+
+    Usage: `@retry_on_busy` or `@retry_on_busy(tries=8)`.
+    """
+    def decorate(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            for attempt in range(tries):
+                try:
+                    return func(*args, **kwargs)
+                except sqlite3.OperationalError as e:
+                    if "locked" not in str(e) or attempt == tries - 1:
+                        raise
+                    if in_transaction(args, kwargs):
+                        raise
+                    time.sleep(base_delay * 2 ** attempt)
+        return wrapper
+
+    def in_transaction(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> bool:
+        conns = [a for a in (*args, *kwargs.values()) if isinstance(a, sqlite3.Connection)]
+        if not conns and args and isinstance(args[0], ConnectionProvider):
+            conns.append(args[0]._resolve(None))
+        return any(c.in_transaction for c in conns)
+
+    return decorate(fn) if fn is not None else decorate
+
+
+def blank_to_none(value: Any) -> Any:
+    """
+    Column adapter: map "" to NULL, pass everything else through.
+    """
+    return None if value == "" else value
+
+
+def as_int(value: Any) -> Optional[int]:
+    """
+    Column adapter: bind numeric text ("123") as INTEGER; ""/None become NULL.
+    """
+    return None if value is None or value == "" else int(value)
+
+
+def as_float(value: Any) -> Optional[float]:
+    """
+    Column adapter: bind decimal text ("1.5") as REAL; ""/None become NULL.
+    """
+    return None if value is None or value == "" else float(value)
+
+
+def hex_to_blob(value: Any) -> Optional[bytes]:
+    """
+    Column adapter: store a hex ID string as a BLOB of half the size.
+    """
+    return None if value is None or value == "" else bytes.fromhex(value)
 
 
-class AbstractTableDAO(ABC):
+def _ddl_hash(ddl: str) -> int:
+    """
+    32-bit positive, non-zero hash of DDL text, suitable for PRAGMA user_version.
+    """
+    value = int(hashlib.blake2b(ddl.encode("utf-8"), digest_size=4).hexdigest(), 16) & 0x7FFFFFFF
+    return value or 1
+
+
+def ensure_schema(conn: sqlite3.Connection, daos: Iterable["AbstractTableDAO"]) -> bool:
+    """
+    Run `create_table` for every DAO unless the database already has this schema.
+
+    `PRAGMA user_version` is a single integer per database file, so the check
+    covers the whole set of tables: the DAOs' `_SCHEMA_HASH` values are
+    combined into one fingerprint, and on a match (the usual warm restart) no
+    DDL is parsed at all, provided every index declared in the DAOs' `_INDEXES`
+    is present (one read of sqlite_master); a missing index reruns the
+    idempotent DDL. After creating the tables the fingerprint is stored, but
+    only once every declared index exists.
+    If any DAO has no `_SCHEMA_HASH` (hand-written create_table with no
+    `_CREATE_SQL`), the tables are always (idempotently) created and
+    user_version is left untouched.
+
+    When every DAO relies on the inherited create_table with `_CREATE_SQL`,
+    all CREATE TABLE / CREATE INDEX statements are joined and run with a
+    single `executescript` inside one BEGIN/COMMIT; otherwise each DAO's
+    create_table is called in turn. executescript commits any pending
+    transaction on `conn` first.
+
+    Parameters
+    ----------
+    conn : sqlite3.Connection
+        The database connection to use.
+    daos : Iterable[AbstractTableDAO]
+        Every DAO that belongs to the database.
+
+    Returns
+    -------
+    bool
+        True if the DDL was executed, False if it was skipped.
+    """
+    daos = list(daos)
+    hashes = [dao._SCHEMA_HASH for dao in daos]
+    fingerprint = None
+    if all(h is not None for h in hashes):
+        fingerprint = _ddl_hash(",".join(map(str, hashes)))
+        if conn.execute("PRAGMA user_version").fetchone()[0] == fingerprint and not _missing_indexes(conn, daos):
+            return False
+    if all(type(dao).create_table is AbstractTableDAO.create_table and dao._CREATE_SQL for dao in daos):
+        # Every table is plain `_CREATE_SQL` + `_INDEXES`: send all of it as one
+        # script in one transaction instead of a prepare/step per statement.
+        ddl = ";\n".join(
+            stmt
+            for dao in daos
+            for stmt in (dao._CREATE_SQL.strip().rstrip(";"), *dao._INDEXES)
+        )
+        conn.executescript(f"BEGIN;\n{ddl};\nCOMMIT;")
+    else:
+        for dao in daos:
+            dao.create_table(conn)
+    missing = _missing_indexes(conn, daos)
+    if missing:
+        logging.getLogger(__name__).warning("Declared indexes missing after schema creation: %s", ", ".join(missing))
+    elif fingerprint is not None:
+        conn.execute(f"PRAGMA user_version = {fingerprint}")
+    return True
+
+
+def _missing_indexes(conn: sqlite3.Connection, daos: Sequence["AbstractTableDAO"]) -> List[str]:
+    """
+    Names of indexes declared in the DAOs' `_INDEXES` that sqlite_master lacks.
+    """
+    declared = [m.group(1) for dao in daos for m in map(_INDEX_NAME_RE.search, dao._INDEXES) if m]
+    if not declared:
+        return []
+    present = {name for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    return [name for name in declared if name not in present]
+
+
+@runtime_checkable
+class DAOProtocol(Protocol):
+    """
+    Structural type of a table DAO: anything with create_table and insert.
+
+    Use it in annotations for code that only needs the DAO interface (e.g. a
+    list of heterogeneous DAOs), so callers are not tied to AbstractTableDAO.
+    """
+
+    def create_table(self, conn: sqlite3.Connection) -> None: ...
+
+    def insert(self, conn: Optional[sqlite3.Connection], *args: Any, **kwargs: Any) -> Any: ...
+
+
+@lru_cache(maxsize=256)
+def _values_width(sql: str) -> Optional[int]:
+    """Placeholder count of a single-row `INSERT ... VALUES (?, ..)`, or None."""
+    match = _VALUES_SPLIT_RE.match(sql)
+    return match.group(2).count("?") if match else None
+
+
+@lru_cache(maxsize=1024)
+def _expanded_insert_sql(sql: str, group: int) -> str:
+    """`sql` with its VALUES row repeated `group` times (see insert_values_expanded)."""
+    match = _VALUES_SPLIT_RE.match(sql)
+    return match.group(1) + ", ".join([match.group(2)] * group)
+
+
+def _compile_insert(sql: str, columns: Sequence[str]) -> Optional[Callable[..., None]]:
+    """
+    Generate a straight-line `insert(self, conn, col1, col2, ...)` for `sql`.
+
+    The SQL text and arity are baked into the function body as constants, so a
+    call does no *args packing and no `self._INSERT_SQL` lookup. Returns None
+    when a column name is not a usable Python parameter name.
+    """
+    if not all(c.isidentifier() and not keyword.iskeyword(c) for c in columns):
+        return None
+    params = ", ".join(columns)
+    src = (
+        f"def insert(self, conn, {params}):\n"
+        f"    if conn is None:\n"
+        f"        conn = self.connection()\n"
+        f"    conn.execute(_SQL, ({params},))\n"
+    )
+    namespace: dict = {"_SQL": sql}
+    exec(src, namespace)
+    fn = namespace["insert"]
+    fn.__doc__ = f"Insert one row: {sql}"
+    fn._generated = True
+    return fn
+
+
+class _TLPool:
+    """
+    Per-thread cache of one configured connection to a single database file.
+
+    Each thread lazily opens its own connection through `factory` on first use
+    and reuses it afterwards, so the connect + PRAGMA cost is paid once per
+    thread instead of once per call. Writers still serialize on SQLite's own
+    database lock, so sharing the file across threads loses no correctness.
+    """
+
+    def __init__(self, factory: Callable[[], sqlite3.Connection]):
+        self._local = threading.local()
+        self._factory = factory
+
+    def get(self) -> sqlite3.Connection:
+        """
+        Return this thread's connection, opening it on first use.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._factory()
+            self._local.conn = conn
+        return conn
+
+    def close(self) -> None:
+        """
+        Close this thread's connection, if one was opened.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+class WriterQueue:
+    """
+    Single background writer thread owning the only write connection to a file.
+
+    Producers call `submit(rows)` from any thread; batches are applied in order
+    by the writer thread, one `executemany` per batch inside its own
+    transaction. Because exactly one connection ever writes, producers never
+    contend for SQLite's write lock and never see SQLITE_BUSY.
+
+    Parameters
+    ----------
+    dao : AbstractTableDAO
+        DAO whose `_INSERT_SQL` and `connect()` are used.
+    path : str
+        Filesystem path to the SQLite database.
+    """
+
+    def __init__(self, dao: "AbstractTableDAO", path: str):
+        self._sql = dao._INSERT_SQL
+        self._connect = lambda: type(dao).connect(path)
+        self.q: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        self.t = threading.Thread(target=self._run, name=f"{type(dao).__name__}-writer", daemon=True)
+        self.t.start()
+
+    def _run(self) -> None:
+        conn = self._connect()
+        try:
+            while True:
+                item = self.q.get()
+                if item is None:
+                    break
+                rows, future = item
+                try:
+                    with transaction(conn):
+                        conn.executemany(self._sql, rows)
+                    future.set_result(None)
+                except Exception as e:
+                    future.set_exception(e)
+        finally:
+            conn.close()
+
+    def submit(self, rows: Iterable[Sequence[Any]]) -> Future:
+        """
+        Queue `rows` for insertion and return a Future resolved after commit.
+
+        The iterable is consumed on the writer thread, so pass a materialized
+        list if the source is not safe to read from another thread.
+        """
+        future: Future = Future()
+        self.q.put((rows, future))
+        return future
+
+    def close(self) -> None:
+        """
+        Drain the queue, then stop the writer thread and close its connection.
+        """
+        self.q.put(None)
+        self.t.join()
+
+
+class ReaderPool:
+    """
+    Bounded pool of read-only connections to one database file.
+
+    In WAL mode each reader works on its own snapshot and is never blocked by
+    the writer, so N readers can run queries concurrently with a WriterQueue.
+
+    Parameters
+    ----------
+    path : str
+        Filesystem path to the SQLite database.
+    size : int
+        Number of connections to open.
+    connect : Callable[..., sqlite3.Connection]
+        Connection factory, called as `connect(path, read_only=True)`.
+
+    Note:
+    -----
+    Connections are opened with `mode=ro` but without `cache=shared`: a shared
+    cache serializes its users on table-level locks, which would undo the
+    snapshot isolation that WAL gives separate connections.
+    """
+
+    def __init__(self, path: str, size: int, connect: Callable[..., sqlite3.Connection]):
+        self._pool: "queue.Queue[sqlite3.Connection]" = queue.Queue(maxsize=size)
+        for _ in range(size):
+            self._pool.put(connect(path, read_only=True))
+
+    @contextmanager
+    def acquire(self) -> Generator[sqlite3.Connection, None, None]:
+        """
+        Borrow a connection, blocking until one is free.
+        """
+        conn = self._pool.get()
+        try:
+            yield conn
+        finally:
+            self._pool.put(conn)
+
+    def read(self, sql: str, params: Sequence[Any] = ()) -> list:
+        """
+        Run one query on a pooled connection and return all rows.
+        """
+        with self.acquire() as conn:
+            return conn.execute(sql, params).fetchall()
+
+    def close(self) -> None:
+        """
+        Close every pooled connection (waits for borrowed ones to be returned).
+        """
+        for _ in range(self._pool.maxsize):
+            self._pool.get().close()
+
+
+class InsertBatcher:
+    """
+    Buffer single-row inserts for one DAO and flush them as multi-row INSERTs.
+
+    Obtained from `dao.batch(conn)`. Inside the `with` block call `add(*row)`
+    wherever `dao.insert(conn, *row)` would have been called; every
+    `flush_every` rows, and once more on exit, the buffer is written with
+    `insert_values_expanded`, i.e. one parse/plan per group of rows instead of
+    one statement execution per row. On an exception the unflushed buffer is
+    discarded so the caller's rollback stays consistent.
+
+    Parameters
+    ----------
+    dao : AbstractTableDAO
+        DAO whose `_INSERT_SQL` describes a row.
+    conn : sqlite3.Connection or None
+        Connection to flush on (None uses the DAO's thread-local connection).
+    flush_every : int
+        Number of buffered rows that triggers an intermediate flush.
+    """
+
+    def __init__(self, dao: "AbstractTableDAO", conn: Optional[sqlite3.Connection], flush_every: int = 1000):
+        self.dao = dao
+        self.conn = conn
+        self.flush_every = flush_every
+        self._buffer: list = []
+
+    def add(self, *row: Any) -> None:
+        """
+        Buffer one row, flushing if the buffer is full.
+        """
+        self._buffer.append(row)
+        if len(self._buffer) >= self.flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Write and clear the buffered rows.
+        """
+        if self._buffer:
+            rows, self._buffer = self._buffer, []
+            self.dao.insert_values_expanded(self.conn, rows)
+
+    def __enter__(self) -> "InsertBatcher":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.flush()
+        else:
+            self._buffer = []
+
+
+class ConnectionProvider:
+    """
+    Mixin giving an object a reusable, thread-local database connection.
+
+    Constructed with `db_path=None` (the default) the mixin is inert and every
+    call must pass an explicit connection. With a path, `connection()` returns
+    the calling thread's cached connection, opened via `cls.connect(db_path)`.
+
+    Note:
+    -----
+    Run the initial CREATE TABLE statements on one shared connection before
+    worker threads start inserting, otherwise two threads can race on the
+    first schema change.
+    """
+
+    __slots__ = ("db_path", "_pool")
+
+    def __init__(self, db_path: Optional[str] = None):
+        self.db_path = db_path
+        self._pool = _TLPool(lambda: self.connect(db_path)) if db_path else None
+
+    @classmethod
+    def connect(cls, path: str) -> sqlite3.Connection:
+        return sqlite3.connect(path, check_same_thread=False)
+
+    def connection(self) -> sqlite3.Connection:
+        """
+        Return the calling thread's cached connection.
+
+        Raises
+        ------
+        RuntimeError
+            If this object was created without a db_path.
+        """
+        if self._pool is None:
+            raise RuntimeError(f"{type(self).__name__} was created without a db_path")
+        return self._pool.get()
+
+    def close_connection(self) -> None:
+        """
+        Close the calling thread's cached connection, if any.
+        """
+        if self._pool is not None:
+            self._pool.close()
+
+    def _resolve(self, conn: Optional[sqlite3.Connection]) -> sqlite3.Connection:
+        return conn if conn is not None else self.connection()
+
+
+class AbstractTableDAO(ConnectionProvider, ABC):
     """
     Abstract base class for a Table DAO (Data Access Object).
 
@@ -46,9 +767,55 @@ class AbstractTableDAO(ABC):
     ---------------------
     create_table(conn: sqlite3.Connection) -> None
         Create the corresponding database table if it does not already exist.
+        Not needed when the subclass sets `_CREATE_SQL`, or declares a `spec`
+        (TableSpec): the DDL, `_INSERT_SQL` and `_INDEXES` are then generated
+        from it. Use `ensure_schema(conn, daos)` at startup to skip all DDL when
+        the database already matches.
     insert(conn: sqlite3.Connection, *args: Any, **kwargs: Any) -> None
         Insert data into the table. Method signature can be flexible for 
-        different table schemas.
+        different table schemas. The default executes `_INSERT_SQL` with `args`
+        as one row; override it when the input needs parsing. DAOs with a
+        `spec` get a generated `insert(conn, <column>, ...)` instead.
+
+    Provided Methods:
+    -----------------
+    Each accepts `conn=None` to use the DAO's thread-local connection (requires
+    the DAO to have been constructed with a db_path).
+
+    insert_many(conn, rows) -> None
+        Insert many rows with a single `executemany` inside one transaction.
+        Requires the subclass to define `_INSERT_SQL`, the parameterized
+        `INSERT INTO t (...) VALUES (?, ...)` statement for its table.
+        Rows are passed through `_ADAPTERS`, then pre-sorted by `sort_key` or
+        by the `_PK_INDEX` fields.
+    batch(conn, flush_every=1000) -> InsertBatcher
+        Collect rows with `add(*row)`; they are written as multi-row INSERTs.
+    preprocess(rows) -> rows
+        Hook to clean caller input in bulk before insert_many (default no-op).
+    insert_columns(conn, *columns) -> None
+        insert_many for column-oriented input; rows are zipped on the fly.
+    create_indexes(conn) / drop_indexes(conn) -> None
+        Create or drop the secondary indexes declared in `_INDEXES`. No-ops for
+        tables without secondary indexes.
+    bulk_load(conn, rows) -> None
+        drop_indexes -> one executemany -> create_indexes. One sorted index
+        build over N rows is cheaper than N incremental B-tree updates.
+    bulk_load_via_memory(conn, rows, order_by=None) -> None
+        Insert into an attached `:memory:` staging table, then copy to the
+        real table in one `INSERT ... SELECT ... ORDER BY`.
+    bulk_load_csv(conn, path) -> None
+        Load a CSV file via SQLite's csv virtual table when available, else via
+        the csv module and insert_many.
+    insert_chunked(conn, rows, chunk_size=10_000) -> None
+        Like insert_many, but commits every `chunk_size` rows and checkpoints
+        the WAL periodically.
+    checkpoint(conn, mode="PASSIVE") -> None
+        Run `PRAGMA wal_checkpoint(mode)`.
+    insert_values_expanded(conn, rows, group=100) -> None
+        Multi-row VALUES expansion: one statement step per `group` rows.
+    submit(rows) -> Future / read(sql, params=()) -> list
+        Route writes through one background writer thread and reads through a
+        pool of read-only connections (requires a db_path).
 
     Example:
     --------
@@ -71,16 +838,172 @@ class AbstractTableDAO(ABC):
 
     Production Recommendations:
     ---------------------------
+    - Prefer `insert_many` for bulk loads: one transaction and one prepared
+      statement replace a BEGIN/COMMIT (and fsync) per row.
     - Wrap operations in transactions or context managers for atomicity.
     - Consider unique constraints or indexes if needed.
     - Add additional error handling/logging as appropriate.
     """
 
-    @abstractmethod
+    # Parameterized INSERT statement for this table, e.g.
+    # "INSERT INTO patents (patent_id, title) VALUES (?, ?)".
+    # Kept as one class-level constant so every call passes the same SQL text
+    # and hits the connection's prepared-statement cache.
+    _INSERT_SQL: ClassVar[str] = ""
+
+    # Secondary index DDL, e.g.
+    # ["CREATE INDEX IF NOT EXISTS idx_t_patent_id ON t (patent_id)"].
+    # Kept out of create_table so bulk_load can defer index maintenance.
+    _INDEXES: ClassVar[Sequence[str]] = ()
+
+    # CREATE TABLE statement for DAOs that are not spec-based; when set, the
+    # default create_table executes it.
+    _CREATE_SQL: ClassVar[str] = ""
+
+    # When True, batch writers that hold many rows for this table (e.g.
+    # daos.insert_records) use insert_values_expanded instead of executemany.
+    _MULTI_VALUES: ClassVar[bool] = False
+
+    # Hash of this table's DDL (`_CREATE_SQL` or `spec`, plus `_INDEXES`),
+    # derived automatically; consumed by `ensure_schema`.
+    _SCHEMA_HASH: ClassVar[Optional[int]] = None
+
+    # Optional per-column adapters, one per `_INSERT_SQL` placeholder (None = as-is).
+    # insert_many applies them so numeric text is bound as INTEGER/REAL: 1-8
+    # bytes per value instead of a TEXT payload, i.e. fewer pages per table.
+    _ADAPTERS: ClassVar[Tuple[Optional[Callable[[Any], Any]], ...]] = ()
+
+    # Positions (within an `_INSERT_SQL` row) of the primary-key fields.
+    # insert_many sorts by them; derived from `spec` when it has a primary_key.
+    _PK_INDEX: ClassVar[Tuple[int, ...]] = ()
+
+    # Optional declarative schema. When set, create_table, _INSERT_SQL and
+    # _INDEXES are derived from it (unless the subclass sets them explicitly).
+    spec: ClassVar[Optional[TableSpec]] = None
+
+    # No per-instance __dict__: DAOs are created once per table per worker and
+    # carry only these fields. Subclasses declare `__slots__ = ()` (or their
+    # own extra fields) to keep it that way.
+    __slots__ = ("_writer", "_readers", "_workers_lock")
+
+    # Connections opened by the ReaderPool behind `read()`.
+    read_pool_size: ClassVar[int] = 4
+
+    def __init__(self, db_path: Optional[str] = None):
+        super().__init__(db_path)
+        self._writer: Optional[WriterQueue] = None
+        self._readers: Optional[ReaderPool] = None
+        self._workers_lock = threading.Lock()
+
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+        spec = cls.__dict__.get("spec")
+        if spec is not None:
+            if "_INSERT_SQL" not in cls.__dict__:
+                cls._INSERT_SQL = spec.insert_sql()
+            if "_INDEXES" not in cls.__dict__:
+                cls._INDEXES = tuple(spec.indexes)
+            if "_PK_INDEX" not in cls.__dict__ and spec.primary_key:
+                cols = spec.insert_columns
+                cls._PK_INDEX = tuple(cols.index(c) for c in spec.primary_key if c in cols)
+            # Replace the generic *args insert with a specialized one, unless
+            # the subclass wrote its own.
+            inherited = cls.insert
+            if "insert" not in cls.__dict__ and (
+                inherited is AbstractTableDAO.insert or getattr(inherited, "_generated", False)
+            ):
+                fast = _compile_insert(cls._INSERT_SQL, spec.insert_columns)
+                if fast is not None:
+                    cls.insert = fast
+        if "_SCHEMA_HASH" not in cls.__dict__:
+            ddl = cls.spec.create_sql() if cls.spec is not None else cls._CREATE_SQL
+            cls._SCHEMA_HASH = _ddl_hash("\n".join([ddl, *cls._INDEXES])) if ddl else None
+
+    @classmethod
+    def connect(cls, path: str, *, read_only: bool = False) -> sqlite3.Connection:
+        """
+        Open a SQLite connection tuned for DAO workloads.
+
+        The connection runs in autocommit mode (isolation_level=None); use
+        `transaction(conn)` or `insert_many` to group writes explicitly.
+
+        Parameters
+        ----------
+        path : str
+            Filesystem path to the SQLite database.
+        read_only : bool
+            If True, open the file via a `mode=ro` URI and skip the PRAGMAs that
+            would need to write the database header (journal_mode).
+
+        Returns
+        -------
+        sqlite3.Connection
+            A connection with the WAL/synchronous/cache/mmap PRAGMAs applied.
+
+        Notes
+        -----
+        - journal_mode=WAL is persistent in the database file. `page_size` can only
+          be changed while the database is *not* in WAL mode, so any page_size
+          change must happen before this is first applied (or after switching
+          back to journal_mode=DELETE, which requires a checkpointed WAL).
+        - cached_statements keeps up to 256 prepared statements per connection,
+          so repeated `_INSERT_SQL` executions skip sqlite3_prepare.
+        - timeout=5.0 sets SQLite's busy timeout (same as PRAGMA busy_timeout=5000),
+          so lock waits happen inside SQLite rather than as exceptions; the
+          default `insert` additionally uses `retry_on_busy`.
+        - `register_functions(conn)` is called last, so user functions are
+          registered once per connection rather than per query.
+        - check_same_thread=False lets a connection be handed between threads;
+          callers remain responsible for not using it from two threads at once.
+        """
+        options = dict(
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=_CACHED_STATEMENTS,
+            timeout=_BUSY_TIMEOUT_S
+        )
+        if read_only:
+            conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True, **options)
+        else:
+            conn = sqlite3.connect(path, **options)
+        configure_connection(conn, read_only=read_only)
+        cls.register_functions(conn)
+        return conn
+
+    @classmethod
+    def register_functions(cls, conn: sqlite3.Connection) -> None:
+        """
+        Register SQL user functions on a freshly opened connection.
+
+        Called once per connection by `connect()`; the default registers nothing.
+        Override to add UDFs, marking pure ones deterministic so SQLite may
+        evaluate them once per distinct argument instead of per row:
+
+            conn.create_function("norm", 1, _norm, deterministic=True)
+
+        Parameters
+        ----------
+        conn : sqlite3.Connection
+            The connection being configured.
+
+        Notes
+        -----
+        For UDF-heavy `INSERT ... SELECT` pipelines, `apsw`'s
+        `Connection.createscalarfunction` has lower per-call overhead than the
+        stdlib module, but would mean replacing sqlite3 throughout.
+        """
+        pass
+
     def create_table(self, conn: sqlite3.Connection) -> None:
         """
         Create the table if it does not already exist.
 
+        The default implementation executes `_CREATE_SQL` if set, otherwise
+        the DDL generated from `spec`, followed by the `_INDEXES` DDL. In the spec case, on a brand-new
+        database file it first sets `PRAGMA page_size = 65536`; page_size only
+        takes effect before the first table is written (and never in WAL mode),
+        so existing databases keep their page size.
+
         Parameters
         ----------
         conn : sqlite3.Connection
@@ -88,19 +1011,38 @@ class AbstractTableDAO(ABC):
 
         Raises
         ------
+        NotImplementedError
+            If the subclass defines neither `_CREATE_SQL`, `spec` nor its own
+            create_table.
         sqlite3.Error
             If any SQL execution fails during table creation.
         """
-        pass
+        if self._CREATE_SQL:
+            conn.execute(self._CREATE_SQL)
+            self.create_indexes(conn)
+            return
+        if self.spec is None:
+            raise NotImplementedError(f"{type(self).__name__} must define _CREATE_SQL or spec, or override create_table")
+        if conn.execute("PRAGMA page_count").fetchone()[0] == 0:
+            conn.execute(f"PRAGMA page_size = {_SPEC_PAGE_SIZE}")
+        conn.execute(self.spec.create_sql())
+        self.create_indexes(conn)
 
-    @abstractmethod
-    def insert(self, conn: sqlite3.Connection, *args: Any, **kwargs: Any) -> None:
+    @retry_on_busy
+    def insert(self, conn: Optional[sqlite3.Connection], *args: Any, **kwargs: Any) -> None:
         """
         Insert data into the table.
 
+        The default implementation executes `_INSERT_SQL` with `args` as a
+        single row. Because the SQL is the same class-level string on every
+        call, sqlite3's statement cache (see `cached_statements` in
+        `connect`) returns the already-prepared statement instead of
+        re-parsing it. DAOs whose input is not a plain row (e.g. a nested
+        SerpAPI record) override this method.
+
         Parameters
         ----------
-        conn : sqlite3.Connection
+        conn : sqlite3.Connection or None
             The database connection to use for inserting records.
         *args, **kwargs : Any
             Flexible parameters depending on the specific DAO/table fields.
@@ -110,4 +1052,614 @@ class AbstractTableDAO(ABC):
         sqlite3.Error
             If SQL insertion fails.
         """
-        pass
\ No newline at end of file
+        self._resolve(conn).execute(self._INSERT_SQL, args)
+
+    def insert_many(
+        self,
+        conn: Optional[sqlite3.Connection],
+        rows: Iterable[Sequence[Any]],
+        *,
+        sort_key: Optional[Callable[[Sequence[Any]], Any]] = None
+    ) -> None:
+        """
+        Insert many rows with one `executemany` call inside a single transaction.
+
+        When the rows are sorted by primary key first, each B-tree leaf page is
+        dirtied roughly once (append-mostly) instead of being revisited by
+        randomly ordered keys. `rows` is consumed exactly once, so unlike
+        `insert` this method is not wrapped in `retry_on_busy`; the busy
+        timeout still absorbs ordinary lock waits.
+
+        Parameters
+        ----------
+        conn : sqlite3.Connection or None
+            The database connection to use for inserting records.
+        rows : Iterable[Sequence[Any]]
+            Row tuples whose values line up with the placeholders of `_INSERT_SQL`.
+        sort_key : Callable, optional
+            If given, rows are materialized and sorted (stably) by this key before
+            insertion. Defaults to `itemgetter(*_PK_INDEX)` when the DAO declares
+            `_PK_INDEX`; otherwise rows are inserted in the order given.
+
+        Raises
+        ------
+        NotImplementedError
+            If the subclass has not defined `_INSERT_SQL`.
+        sqlite3.Error
+            If SQL insertion fails; the whole batch is rolled back.
+        """
+        if not self._INSERT_SQL:
+            raise NotImplementedError(f"{type(self).__name__} does not define _INSERT_SQL")
+        rows = self._adapt(rows)
+        if sort_key is None and self._PK_INDEX:
+            sort_key = operator.itemgetter(*self._PK_INDEX)
+        if sort_key is not None:
+            rows = sorted(rows, key=sort_key)
+        conn = self._resolve(conn)
+        with transaction(conn):
+            conn.executemany(self._INSERT_SQL, rows)
+
+    def _adapt(self, rows: Iterable[Sequence[Any]]) -> Iterable[Sequence[Any]]:
+        """
+        Lazily apply `_ADAPTERS` to each row (identity when none are declared).
+        """
+        adapters = self._ADAPTERS
+        if not adapters:
+            return rows
+        pairs = [(i, fn) for i, fn in enumerate(adapters) if fn is not None]
+
+        def adapt(row: Sequence[Any]) -> Sequence[Any]:
+            row = list(row)
+            for i, fn in pairs:
+                row[i] = fn(row[i])
+            return row
+
+        return map(adapt, rows)
+
+    def batch(self, conn: Optional[sqlite3.Connection], flush_every: int = 1000) -> InsertBatcher:
+        """
+        Return an InsertBatcher that merges buffered rows into multi-row INSERTs.
+
+        Example
+        -------
+        with transaction(conn), dao.batch(conn) as b:
+            for row in rows:
+                b.add(*row)
+        """
+        return InsertBatcher(self, conn, flush_every)
+
+    def preprocess(self, rows: Any) -> Iterable[Sequence[Any]]:
+        """
+        Turn caller input into row tuples for `_INSERT_SQL`.
+
+        The default returns `rows` unchanged. Override it to move per-row
+        cleansing (strip, float coercion, date normalization) out of the insert
+        loop, ideally vectorized; see NumpyDAOMixin. Typical use:
+        `dao.insert_many(conn, dao.preprocess(frame))`.
+        """
+        return rows
+
+    def insert_columns(self, conn: Optional[sqlite3.Connection], *columns: Sequence[Any]) -> None:
+        """
+        Insert column-oriented data: one sequence per `_INSERT_SQL` placeholder.
+
+        The columns are zipped lazily straight into `executemany`, so callers
+        holding columnar data (lists, `array.array`, numpy arrays, DataFrame
+        columns) never build an intermediate list of row tuples.
+
+        Parameters
+        ----------
+        conn : sqlite3.Connection or None
+            The database connection to use for inserting records.
+        *columns : Sequence[Any]
+            Equal-length sequences, in placeholder order. Objects exposing
+            `tolist()` (numpy arrays, `array.array`) are converted once per
+            column, because sqlite3 cannot bind numpy scalar types.
+
+        Raises
+        ------
+        ValueError
+            If the columns differ in length.
+        sqlite3.Error
+            If SQL insertion fails; the whole batch is rolled back.
+        """
+        columns = tuple(c.tolist() if hasattr(c, "tolist") else c for c in columns)
+        if len({len(c) for c in columns}) > 1:
+            raise ValueError("insert_columns requires columns of equal length")
+        self.insert_many(conn, zip(*columns))
+
+    def submit(self, rows: Iterable[Sequence[Any]]) -> Future:
+        """
+        Hand rows to this DAO's single writer thread (started on first use).
+
+        Use this instead of insert_many when many threads write to the same
+        database: all writes funnel through one connection, so no writer ever
+        waits on or retries against SQLite's lock.
+
+        Parameters
+        ----------
+        rows : Iterable[Sequence[Any]]
+            Row tuples matching `_INSERT_SQL`.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Resolves once the batch is committed; carries any sqlite3.Error.
+
+        Raises
+        ------
+        RuntimeError
+            If the DAO was created without a db_path.
+        """
+        if self._writer is None:
+            with self._workers_lock:
+                if self._writer is None:
+                    self._writer = WriterQueue(self, self._require_path())
+        return self._writer.submit(rows)
+
+    def read(self, sql: str, params: Sequence[Any] = ()) -> list:
+        """
+        Run a query on one of `read_pool_size` read-only connections.
+
+        Raises
+        ------
+        RuntimeError
+            If the DAO was created without a db_path.
+        """
+        if self._readers is None:
+            with self._workers_lock:
+                if self._readers is None:
+                    self._readers = ReaderPool(self._require_path(), self.read_pool_size, self.connect)
+        return self._readers.read(sql, params)
+
+    def close_workers(self) -> None:
+        """
+        Flush and stop the writer thread and close the reader pool, if started.
+        """
+        with self._workers_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+            if self._readers is not None:
+                self._readers.close()
+                self._readers = None
+
+    def _require_path(self) -> str:
+        if not self.db_path:
+            raise RuntimeError(f"{type(self).__name__} was created without a db_path")
+        return self.db_path
+
+    def create_indexes(self, conn: Optional[sqlite3.Connection]) -> None:
+        """
+        Create every secondary index listed in `_INDEXES`.
+
+        Parameters
+        ----------
+        conn : sqlite3.Connection or None
+            The database connection to use for executing SQL statements.
+        """
+        conn = self._resolve(conn)
+        for ddl in self._INDEXES:
+            conn.execute(ddl)
+
+    def drop_indexes(self, conn: Optional[sqlite3.Connection]) -> None:
+        """
+        Drop every secondary index listed in `_INDEXES`.
+
+        The DROP statements are generated from the index names parsed out of
+        the CREATE INDEX DDL, so subclasses only maintain one list.
+
+        Parameters
+        ----------
+        conn : sqlite3.Connection or None
+            The database connection to use for executing SQL statements.
+        """
+        conn = self._resolve(conn)
+        for ddl in self._INDEXES:
+            match = _INDEX_NAME_RE.search(ddl)
+            if match:
+                conn.execute(f"DROP INDEX IF EXISTS {match.group(1)}")
+
+    def bulk_load(self, conn: Optional[sqlite3.Connection], rows: Iterable[Sequence[Any]]) -> None:
+        """
+        Load many rows with index maintenance deferred until the end.
+
+        Steps:
+        ------
+        1) drop_indexes(conn)
+        2) insert_many(conn, rows) -> one transaction, one executemany
+        3) create_indexes(conn)   -> one sorted build per index
+
+        Parameters
+        ----------
+        conn : sqlite3.Connection or None
+            The database connection to use for inserting records.
+        rows : Iterable[Sequence[Any]]
+            Row tuples matching the placeholders of `_INSERT_SQL`.
+
+        Notes
+        -----
+        If the insert fails, the indexes are still rebuilt so the table is never
+        left without them.
+        """
+        conn = self._resolve(conn)
+        self.drop_indexes(conn)
+        try:
+            self.insert_many(conn, rows)
+        finally:
+            self.create_indexes(conn)
+
+    def bulk_load_via_memory(
+        self,
+        conn: Optional[sqlite3.Connection],
+        rows: Iterable[Sequence[Any]],
+        order_by: Optional[str] = None
+    ) -> None:
+        """
+        Stage rows in an attached `:memory:` database, then copy them in one ordered pass.
+
+        Inserting into the staging table touches no disk pages and no indexes.
+        The final `INSERT INTO main.t SELECT ... ORDER BY` then appends to the
+        on-disk B-tree in key order (pages written once, densely packed), with
+        secondary indexes dropped and rebuilt around it as in `bulk_load`.
+
+        Parameters
+        ----------
+        conn : sqlite3.Connection or None
+            The database connection to use. Must not have an open transaction,
+            since SQLite cannot ATTACH inside one.
+        rows : Iterable[Sequence[Any]]
+            Row tuples matching `_INSERT_SQL`.
+        order_by : str, optional
+            ORDER BY expression for the copy. Defaults to the spec's primary key;
+            without either, rows are copied in arrival order.
+
+        Raises
+        ------
+        NotImplementedError
+            If `_INSERT_SQL` is not an `INSERT INTO table (cols) ...` statement.
+        RuntimeError
+            If `conn` is inside a transaction.
+        sqlite3.Error
+            If SQL execution fails; the copy into the main table is rolled back.
+        """
+        match = _INSERT_TARGET_RE.match(self._INSERT_SQL)
+        if not match:
+            raise NotImplementedError(
+                f"{type(self).__name__}._INSERT_SQL does not name its table and columns"
+            )
+        verb, table, columns = match.group(1), match.group(2), match.group(3)
+        if order_by is None and self.spec is not None and self.spec.primary_key:
+            order_by = ", ".join(self.spec.primary_key)
+
+        conn = self._resolve(conn)
+        if conn.in_transaction:
+            raise RuntimeError("bulk_load_via_memory cannot run inside an open transaction")
+
+        staged = f"{_STAGE_SCHEMA}.{table}"
+        stage_sql = self._INSERT_SQL[:match.start(2)] + staged + self._INSERT_SQL[match.end(2):]
+        conn.execute(f"ATTACH DATABASE ':memory:' AS {_STAGE_SCHEMA}")
+        try:
+            conn.execute(f"CREATE TABLE {staged} AS SELECT {columns} FROM main.{table} WHERE 0")
+            with transaction(conn):
+                conn.executemany(stage_sql, rows)
+
+            copy_sql = f"{verb} INTO main.{table} ({columns}) SELECT {columns} FROM {staged}"
+            if order_by:
+                copy_sql += f" ORDER BY {order_by}"
+            self.drop_indexes(conn)
+            try:
+                with transaction(conn):
+                    conn.execute(copy_sql)
+            finally:
+                self.create_indexes(conn)
+        finally:
+            conn.execute(f"DETACH DATABASE {_STAGE_SCHEMA}")
+
+    def copy_from_attached(self, conn: Optional[sqlite3.Connection], schema: str) -> None:
+        """
+        Copy every row of this table from an attached database into `main`.
+
+        Runs one `INSERT [OR ...] INTO main.t (cols) SELECT cols FROM schema.t`
+        with the verb and column list of `_INSERT_SQL`, in the source's rowid
+        order. Columns not named by `_INSERT_SQL` (e.g. an `id` rowid alias)
+        are not copied, so rows get fresh ids in `main` and copies from several
+        databases never collide.
+
+        Parameters
+        ----------
+        conn : sqlite3.Connection or None
+            The database connection; `schema` must already be attached to it.
+        schema : str
+            Name the source database was attached under.
+
+        Raises
+        ------
+        NotImplementedError
+            If `_INSERT_SQL` is not an `INSERT INTO table (cols) ...` statement.
+        """
+        match = _INSERT_TARGET_RE.match(self._INSERT_SQL)
+        if not match:
+            raise NotImplementedError(
+                f"{type(self).__name__}._INSERT_SQL does not name its table and columns"
+            )
+        verb, table, columns = match.group(1), match.group(2), match.group(3)
+        conn = self._resolve(conn)
+        conn.execute(
+            f"{verb} INTO main.{table} ({columns}) "
+            f"SELECT {columns} FROM {schema}.{table} ORDER BY rowid"
+        )
+
+    def bulk_load_csv(
+        self,
+        conn: Optional[sqlite3.Connection],
+        path: str,
+        *,
+        header: bool = True,
+        extension: str = "csv"
+    ) -> None:
+        """
+        Load a CSV file whose columns match `_INSERT_SQL`'s column list, in order.
+
+        If SQLite's `csv` virtual-table extension can be loaded, the whole load
+        is one `INSERT INTO t (...) SELECT * FROM temp.<vtab>` statement, parsed
+        and inserted in C with no per-row Python calls. Otherwise (the common
+        case for stock Python builds, which disable extension loading) the file
+        is streamed through the C-implemented `csv` module into `insert_many`.
+
+        Parameters
+        ----------
+        conn : sqlite3.Connection or None
+            The database connection to use.
+        path : str
+            Path to the CSV file.
+        header : bool
+            Whether the first line is a header row to skip.
+        extension : str
+            Name or path of the loadable csv extension.
+
+        Raises
+        ------
+        NotImplementedError
+            If `_INSERT_SQL` does not name its table and columns.
+        sqlite3.Error
+            If SQL insertion fails; the load is rolled back.
+
+        Notes
+        -----
+        Values arrive as text either way; declare `_ADAPTERS` for numeric
+        columns (applied on the fallback path only; the virtual-table path
+        relies on column affinity).
+        """
+        match = _INSERT_TARGET_RE.match(self._INSERT_SQL)
+        if not match:
+            raise NotImplementedError(
+                f"{type(self).__name__}._INSERT_SQL does not name its table and columns"
+            )
+        verb, table, columns = match.group(1), match.group(2), match.group(3)
+        conn = self._resolve(conn)
+
+        try:
+            conn.enable_load_extension(True)
+            try:
+                conn.load_extension(extension)
+            finally:
+                conn.enable_load_extension(False)
+        except (AttributeError, sqlite3.OperationalError):
+            with open(path, newline="", encoding="utf-8") as f:
+                reader = csv.reader(f)
+                if header:
+                    next(reader, None)
+                self.insert_many(conn, reader)
+            return
+
+        vtab = f"temp._csv_{table}"
+        quoted = path.replace("'", "''")
+        conn.execute(
+            f"CREATE VIRTUAL TABLE {vtab} USING csv(filename='{quoted}', header={'YES' if header else 'NO'})"
+        )
+        try:
+            with transaction(conn):
+                conn.execute(f"{verb} INTO {table} ({columns}) SELECT * FROM {vtab}")
+        finally:
+            conn.execute(f"DROP TABLE {vtab}")
+
+    def insert_chunked(
+        self,
+        conn: Optional[sqlite3.Connection],
+        rows: Iterable[Sequence[Any]],
+        chunk_size: int = 10_000,
+        checkpoint_every_chunks: int = 16
+    ) -> None:
+        """
+        Insert rows in fixed-size batches, one transaction per batch.
+
+        A single huge transaction can push dirty pages past the page cache and
+        force random-page spills; one transaction per row pays a commit per row.
+        Batches sized so that "the page cache can fit all these rows" keep each
+        commit a sequential flush and bound how much work a crash can lose.
+
+        Parameters
+        ----------
+        conn : sqlite3.Connection or None
+            The database connection to use for inserting records, or None for
+            this DAO's thread-local connection. Must not be inside an open
+            transaction, otherwise the batches simply join it.
+        rows : Iterable[Sequence[Any]]
+            Row tuples matching `_INSERT_SQL`; consumed lazily, so generators
+            over very large inputs are fine.
+        chunk_size : int
+            Rows per transaction. Tune together with `PRAGMA cache_size`.
+        checkpoint_every_chunks : int
+            Run a PASSIVE WAL checkpoint after this many committed chunks, and a
+            TRUNCATE checkpoint once the load finishes, so the -wal file stays
+            small instead of growing until the auto-checkpoint threshold.
+            0 disables checkpointing. No effect outside WAL mode.
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+
+        conn = self._resolve(conn)
+        it = iter(rows)
+        chunks = 0
+        while True:
+            batch = list(itertools.islice(it, chunk_size))
+            if not batch:
+                break
+            self.insert_many(conn, batch)
+            chunks += 1
+            if checkpoint_every_chunks and chunks % checkpoint_every_chunks == 0:
+                self.checkpoint(conn)
+
+        if checkpoint_every_chunks and chunks:
+            self.checkpoint(conn, mode="TRUNCATE")
+
+    def checkpoint(self, conn: Optional[sqlite3.Connection], mode: str = "PASSIVE") -> None:
+        """
+        Checkpoint the write-ahead log into the main database file.
+
+        PASSIVE copies as many frames as possible without waiting on readers or
+        writers; TRUNCATE additionally waits and then resets the -wal file to
+        zero bytes. Skipped while a transaction is open on `conn`, since a
+        checkpoint cannot run inside one.
+
+        Parameters
+        ----------
+        conn : sqlite3.Connection or None
+            The database connection to checkpoint through.
+        mode : str
+            One of "PASSIVE", "FULL", "RESTART", "TRUNCATE".
+        """
+        mode = mode.upper()
+        if mode not in _CHECKPOINT_MODES:
+            raise ValueError(f"Invalid checkpoint mode: {mode}")
+        conn = self._resolve(conn)
+        if conn.in_transaction:
+            return
+        conn.execute(f"PRAGMA wal_checkpoint({mode})").fetchall()
+
+    def insert_values_expanded(
+        self,
+        conn: Optional[sqlite3.Connection],
+        rows: Iterable[Sequence[Any]],
+        group: int = 100
+    ) -> None:
+        """
+        Insert rows using multi-row `VALUES (?, ..), (?, ..), ...` statements.
+
+        `executemany` still runs one statement step per row; for narrow rows the
+        per-step overhead dominates. Here `group` rows share a single statement
+        (one VDBE program, one bind/reset cycle), and the remaining
+        `len(rows) % group` rows go through the plain single-row statement.
+        The expanded SQL is memoized per (statement, group), so repeated calls
+        pass the identical string and hit the statement cache.
+
+        Parameters
+        ----------
+        conn : sqlite3.Connection or None
+            The database connection to use for inserting records.
+        rows : Iterable[Sequence[Any]]
+            Row tuples matching `_INSERT_SQL`. Materialized into a list.
+        group : int
+            Rows per expanded statement. Clamped so that
+            `group * columns` stays within SQLITE_LIMIT_VARIABLE_NUMBER
+            (32766 since SQLite 3.32, 999 before).
+        """
+        width = _values_width(self._INSERT_SQL)
+        if width is None:
+            raise NotImplementedError(
+                f"{type(self).__name__}._INSERT_SQL is not a single-row INSERT ... VALUES statement"
+            )
+
+        rows = list(rows)
+        if not rows:
+            return
+
+        conn = self._resolve(conn)
+        try:
+            max_vars = conn.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER)
+        except AttributeError:  # Python < 3.11
+            max_vars = _DEFAULT_MAX_VARIABLES
+        group = max(1, min(group, max_vars // max(width, 1), len(rows)))
+
+        full = len(rows) - len(rows) % group
+        expanded_sql = _expanded_insert_sql(self._INSERT_SQL, group)
+        with transaction(conn):
+            if full:
+                conn.executemany(
+                    expanded_sql,
+                    (
+                        [value for row in rows[i:i + group] for value in row]
+                        for i in range(0, full, group)
+                    )
+                )
+            if full < len(rows):
+                conn.executemany(self._INSERT_SQL, rows[full:])
+
+
+class NumpyDAOMixin:
+    """
+    Vectorized `preprocess` for DAOs fed from a pandas DataFrame.
+
+    Place it before AbstractTableDAO in the bases
+    (`class FooDAO(NumpyDAOMixin, AbstractTableDAO)`) and list the columns to
+    clean; every transform runs once per column in pandas/numpy C code instead
+    of once per row in Python. pandas is imported lazily, so the module itself
+    has no hard dependency on it.
+
+    Class Attributes:
+    -----------------
+    strip_columns : text columns to whitespace-strip
+    float_columns : columns coerced with `pd.to_numeric(errors="coerce")`
+    date_columns : columns normalized to the "YYYY-MM-DD HH:MM:SS" text used by the
+        existing tables; unparseable values become NULL
+    insert_order : column order of `_INSERT_SQL`; defaults to `spec.insert_columns`
+        when the DAO has a spec, else the frame's own order
+
+    Note:
+    -----
+    For per-row logic that cannot be expressed as column operations, a Numba
+    `@njit` or Cython kernel over the underlying numpy arrays is the next step;
+    keep it inside an overridden `preprocess` so callers are unaffected.
+    """
+
+    __slots__ = ()
+
+    strip_columns: ClassVar[Sequence[str]] = ()
+    float_columns: ClassVar[Sequence[str]] = ()
+    date_columns: ClassVar[Sequence[str]] = ()
+    insert_order: ClassVar[Sequence[str]] = ()
+
+    def preprocess(self, rows: Any) -> Iterable[Sequence[Any]]:
+        """
+        Clean a DataFrame column-wise and yield plain row tuples (NaN -> None).
+
+        Parameters
+        ----------
+        rows : pandas.DataFrame
+            Input frame; a copy is modified, the caller's frame is untouched.
+
+        Returns
+        -------
+        Iterable[tuple]
+            Tuples ready for `insert_many`.
+        """
+        import pandas as pd
+
+        df = pd.DataFrame(rows).copy()
+        for col in self.strip_columns:
+            df[col] = df[col].str.strip()
+        for col in self.float_columns:
+            df[col] = pd.to_numeric(df[col], errors="coerce")
+        for col in self.date_columns:
+            df[col] = pd.to_datetime(df[col], errors="coerce").dt.strftime("%Y-%m-%d %H:%M:%S")
+
+        order = self.insert_order
+        spec = getattr(self, "spec", None)
+        if not order and spec is not None:
+            order = spec.insert_columns
+        if order:
+            df = df[list(order)]
+
+        df = df.astype(object).where(df.notna(), None)
+        return df.itertuples(index=False, name=None)
@@ -5,8 +5,12 @@ Purpose:
 --------
 Houses DAO (Data Access Object) classes for each table in the SQLite database.
 Each class implements:
-  1) create_table(conn): Create the table schema if it does not already exist.
+  1) create_table(conn): Create the table schema if it does not already exist
+     (inherited; runs the class-level `_CREATE_SQL` DDL, then `_INDEXES`).
   2) insert(...): Insert records into the table, reading from a SerpAPI "data" structure.
+  3) build_rows(patent_id_str, data_sub) / PatentsDAO.build_row(record): the row
+     tuples `insert` writes, so many records can be flattened into one
+     `executemany` per table (see insert_records).
 
 Why This Matters:
 -----------------
@@ -24,6 +28,8 @@ with db_connection("data/patent.db") as conn:
     # Insert a patent record:
     record = {...}  # structure from SerpAPI
     patent_id_str = dao_patents.insert(conn, record)
+    # Or write the patent and all of its child rows in one transaction:
+    insert_full_record(conn, record)
 
 Production-Level Considerations:
 -------------------------------
@@ -31,18 +37,179 @@ Production-Level Considerations:
 - 'INSERT OR IGNORE' is used in some DAOs to prevent duplicates, but may need adjusting 
   depending on your deduplication strategy.
 - The data structure from SerpAPI can be large and nested; ensure you handle missing/extra fields.
+- The insert paths only call `conn.execute` / `conn.executemany`, so an apsw
+  connection from `abstract_dao.connect_apsw` can be used in place of sqlite3
+  for lower per-call overhead (apsw is optional and not required otherwise).
+- Flag columns are bound as Python bools; sqlite3 stores them as INTEGER 0/1.
+- Child tables use a plain `id INTEGER PRIMARY KEY` (rowid alias) without
+  AUTOINCREMENT, which would add a sqlite_sequence update to every insert.
+  Databases created before this change keep their original schema.
+- Every child table has an index on its `patent_id` foreign key (declared in
+  `_INDEXES`, created by create_table), so per-patent lookups, joins and
+  ON DELETE CASCADE do not scan the whole table.
+- Child DAOs take the record's 'data' sub-dict (`data_sub`) rather than the
+  whole record; PatentsDAO.split_record extracts it once per record and the
+  caller hands the same dict to every child DAO.
+- Child-table DAOs build all of a record's rows first and write them with one
+  `executemany` call, instead of one `execute` per child row. DAOs with
+  `_MULTI_VALUES` (priority applications, non-patent citations, similar
+  documents) instead pack many rows into each multi-row VALUES statement. Records with no
+  rows for a table (empty inventors, images, ...) skip the call entirely.
 - Consider adding more CRUD operations (update/delete) if needed.
 - For error logging, some DAO references "ErrorLogsDAO" or similar pattern to store error info 
   if the rest of the system lacks a robust error-capturing strategy.
 """
 
 import sqlite3
+import calendar
 import datetime
 import json
-from typing import Optional, Dict, Any, List
+import re
+from functools import lru_cache
+from typing import Optional, Dict, Any, Callable, Iterator, List, Sequence, Tuple
+
+from .abstract_dao import AbstractTableDAO, transaction
+
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+except ImportError:  # pragma: no cover - orjson is optional
+    def _json_dumps(obj: Any) -> str:
+        # Same compact, non-ASCII-escaped output as orjson.
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+# Stand-in for a record without a 'data' key. Shared by every lookup and never
+# mutated, so a missing key costs no allocation.
+_EMPTY: Dict[str, Any] = {}
+
+# Parameterized INSERT statements, one per table. Defined once at import time;
+# the identical string objects also hit sqlite3's per-connection statement cache.
+_INSERT_PATENTS_SQL = """
+INSERT OR IGNORE INTO patents (
+    patent_id, title, type, pdf_link, publication_number, country,
+    application_number, priority_date, filing_date, publication_date,
+    prior_art_date, family_id, abstract, description_link
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_INVENTORS_SQL = """
+INSERT INTO inventors (patent_id, inventor_name, link, serpapi_link)
+VALUES (?, ?, ?, ?)
+"""
+
+_INSERT_ASSIGNEES_SQL = "INSERT INTO assignees (patent_id, name) VALUES (?, ?)"
+
+_INSERT_PRIOR_ART_KEYWORDS_SQL = "INSERT INTO prior_art_keywords (patent_id, keyword) VALUES (?, ?)"
+
+_INSERT_EVENTS_SQL = """
+INSERT INTO events (
+    patent_id, event_date, title, type, critical, assignee_search, description
+) VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_EXTERNAL_LINKS_SQL = "INSERT INTO external_links (patent_id, text, link) VALUES (?, ?, ?)"
+
+_INSERT_IMAGES_SQL = "INSERT INTO images (patent_id, image_url) VALUES (?, ?)"
+
+_INSERT_CLASSIFICATIONS_SQL = """
+INSERT INTO classifications (
+    patent_id, code, description, leaf, first_code, is_cpc, additional
+) VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_CLAIMS_SQL = "INSERT INTO claims (patent_id, claim_no, claim_txt) VALUES (?, ?, ?)"
+
+_INSERT_APPLICATIONS_CLAIMING_PRIORITY_SQL = """
+INSERT INTO applications_claiming_priority (
+    patent_id, application_number, priority_date, filing_date,
+    representative_publication, primary_language, title
+) VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_WORLDWIDE_APPLICATIONS_SQL = """
+INSERT INTO worldwide_applications (
+    patent_id, year, application_number, country_code, document_id,
+    filing_date, legal_status, legal_status_cat, this_app
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_PATENT_CITATIONS_SQL = """
+INSERT INTO patent_citations (
+    patent_id, is_family_to_family, publication_number, primary_language, examiner_cited,
+    priority_date, publication_date, assignee_original, title, serpapi_link, patent_id_ref
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_CITED_BY_SQL = """
+INSERT INTO cited_by (
+    patent_id, is_family_to_family, publication_number, primary_language, examiner_cited,
+    priority_date, publication_date, assignee_original, title, serpapi_link, patent_id_ref
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_LEGAL_EVENTS_SQL = """
+INSERT INTO legal_events (
+    patent_id, date, code, title, attributes_json
+) VALUES (?, ?, ?, ?, ?)
+"""
+
+_INSERT_CONCEPTS_SQL = """
+INSERT INTO concepts (
+    patent_id, concept_id, domain, name, similarity, sections,
+    count, inchi_key, smiles
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_CHILD_APPLICATIONS_SQL = """
+INSERT INTO child_applications (
+    patent_id, application_number, relation_type,
+    representative_publication, primary_language,
+    priority_date, filing_date, title
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_PARENT_APPLICATIONS_SQL = """
+INSERT INTO parent_applications (
+    patent_id, application_number, relation_type,
+    representative_publication, primary_language,
+    priority_date, filing_date, title
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_PRIORITY_APPLICATIONS_SQL = """
+INSERT INTO priority_applications (
+    patent_id, application_number, representative_publication, primary_language,
+    priority_date, filing_date, title
+) VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_NON_PATENT_CITATIONS_SQL = """
+INSERT INTO non_patent_citations (
+    patent_id, citation_title, examiner_cited
+) VALUES (?, ?, ?)
+"""
+
+_INSERT_SIMILAR_DOCUMENTS_SQL = """
+INSERT INTO similar_documents (
+    patent_id, is_patent, doc_patent_id, serpapi_link,
+    publication_number, primary_language, publication_date, title
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_ERROR_LOGS_SQL = """
+INSERT INTO error_logs (error_message, stack_trace, created_at)
+VALUES (?, ?, CURRENT_TIMESTAMP)
+"""
+
 
-from .abstract_dao import AbstractTableDAO
+# 'YYYY-MM-DD' (ASCII digits only), and the looser shape strptime's %Y-%m-%d accepts.
+_DATE_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})", re.ASCII)
+_LOOSE_DATE_RE = re.compile(r"\d{1,4}-\d{1,2}-\d{1,2}", re.ASCII)
 
+
+@lru_cache(maxsize=1 << 16)
 def _parse_date_to_utc(date_str: Optional[str]) -> Optional[str]:
     """
     Convert a date string in YYYY-MM-DD format into 'YYYY-MM-DD 00:00:00' UTC format.
@@ -61,9 +228,26 @@ def _parse_date_to_utc(date_str: Optional[str]) -> Optional[str]:
     ---------------
     - This approach zeroes out the time component to '00:00:00'. For advanced 
       time-zone handling, you may want to store the offset or pass actual times.
+    - Results are memoized (LRU, 65536 entries): the same dates recur across
+      citations, events and applications, so most calls are a dict lookup.
+      The input must be hashable (str or None, as in SerpAPI JSON);
+      PatentService clears the cache after each JSONL file.
     """
     if not date_str:
         return None
+    # Canonical zero-padded form: the regex validates the shape, the calendar
+    # check the values, and the result is the input plus the constant time
+    # suffix, without building a datetime or raising.
+    m = _DATE_RE.fullmatch(date_str)
+    if m is not None:
+        year, month, day = int(m[1]), int(m[2]), int(m[3])
+        if year < 1 or not 1 <= month <= 12 or not 1 <= day <= calendar.monthrange(year, month)[1]:
+            return None
+        return date_str + " 00:00:00"
+    # Non-padded forms (e.g. '2023-5-1') still go through strptime as before;
+    # anything that cannot be a date is rejected without the try/except.
+    if _LOOSE_DATE_RE.fullmatch(date_str) is None:
+        return None
     try:
         dt = datetime.datetime.strptime(date_str, "%Y-%m-%d")
         return dt.strftime("%Y-%m-%d 00:00:00")
@@ -71,6 +255,68 @@ def _parse_date_to_utc(date_str: Optional[str]) -> Optional[str]:
         return None
 
 
+@lru_cache(maxsize=256)
+def _parse_year(year_str: str) -> Optional[int]:
+    """
+    Convert a 'worldwide_applications' year key (e.g. '2019') to int, or None
+    if it is not numeric. Memoized: the same few dozen years recur across
+    every record, so repeat calls are a dict lookup instead of int().
+    """
+    try:
+        return int(year_str)
+    except ValueError:
+        return None
+
+
+def _attrs_to_json(attrs: Any) -> Optional[str]:
+    """
+    JSON-encode a legal event's 'attributes' list.
+
+    Empty attributes return None without encoding. Results are deliberately
+    not memoized: equal-hashing values such as True, 1 and 1.0 would share a
+    cache entry and be serialized as whichever was seen first. Encoding uses
+    orjson when installed (compact separators; the stdlib fallback emits the
+    identical format).
+    """
+    if not attrs:
+        return None
+    return _json_dumps(attrs)
+
+
+def _iter_citation_rows(patent_id_str: str, cit_dict: Dict[str, Any]) -> Iterator[tuple]:
+    """
+    Yield patent_citations / cited_by rows for both the 'original' and the
+    'family_to_family' lists (the two tables share one layout).
+
+    Parameters
+    ----------
+    patent_id_str : str
+        The citing (or cited) patent.
+    cit_dict : dict
+        The SerpAPI 'patent_citations' or 'cited_by' object.
+
+    Yields
+    ------
+    tuple
+        Rows in the column order of _INSERT_PATENT_CITATIONS_SQL / _INSERT_CITED_BY_SQL.
+    """
+    for key, is_ftf in (("original", 0), ("family_to_family", 1)):
+        for c in cit_dict.get(key, ()):
+            yield (
+                patent_id_str,
+                is_ftf,
+                c.get("publication_number"),
+                c.get("primary_language"),
+                bool(c.get("examiner_cited")),
+                _parse_date_to_utc(c.get("priority_date")),
+                _parse_date_to_utc(c.get("publication_date")),
+                c.get("assignee_original"),
+                c.get("title"),
+                c.get("serpapi_link"),
+                c.get("patent_id")
+            )
+
+
 class PatentsDAO(AbstractTableDAO):
     """
     Manages the 'patents' table schema and insert logic.
@@ -94,29 +340,58 @@ class PatentsDAO(AbstractTableDAO):
         description_link TEXT
     )
     """
+    __slots__ = ()
+
+    _INSERT_SQL = _INSERT_PATENTS_SQL
+
+    # SerpAPI keys in _INSERT_SQL column order, fetched with one C-level map each
+    # (missing keys -> None, like dict.get). 'pdf' feeds pdf_link.
+    _TEXT_KEYS = ("title", "type", "pdf", "publication_number", "country", "application_number")
+    _DATE_KEYS = ("priority_date", "filing_date", "publication_date", "prior_art_date")
+    _TAIL_KEYS = ("family_id", "abstract", "description_link")
+
+    _CREATE_SQL = """
+    CREATE TABLE IF NOT EXISTS patents (
+        patent_id TEXT PRIMARY KEY,
+        title TEXT,
+        type TEXT,
+        pdf_link TEXT,
+        publication_number TEXT,
+        country TEXT,
+        application_number TEXT,
+        priority_date DATETIME,
+        filing_date DATETIME,
+        publication_date DATETIME,
+        prior_art_date DATETIME,
+        family_id TEXT,
+        abstract TEXT,
+        description_link TEXT
+    );
+    """
 
-    def create_table(self, conn: sqlite3.Connection) -> None:
+    @staticmethod
+    def split_record(record: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
         """
-        Creates the patents table if it does not exist.
+        Returns (patent_id_str, data_sub) for a SerpAPI record.
+
+        This is the one place the 'data' sub-dict is pulled out; the result is
+        passed to every child DAO. A missing 'data' key yields the shared
+        read-only `_EMPTY` dict instead of a fresh `{}` per lookup.
         """
-        conn.execute("""
-        CREATE TABLE IF NOT EXISTS patents (
-            patent_id TEXT PRIMARY KEY,
-            title TEXT,
-            type TEXT,
-            pdf_link TEXT,
-            publication_number TEXT,
-            country TEXT,
-            application_number TEXT,
-            priority_date DATETIME,
-            filing_date DATETIME,
-            publication_date DATETIME,
-            prior_art_date DATETIME,
-            family_id TEXT,
-            abstract TEXT,
-            description_link TEXT
-        );
-        """)
+        return record.get("patent_id", ""), record.get("data", _EMPTY)
+
+    def build_row(self, record: Dict[str, Any]) -> tuple:
+        """
+        Builds the 'patents' row (in `_INSERT_SQL` column order) for one record.
+        """
+        patent_id_str, data_sub = self.split_record(record)
+        get = data_sub.get
+        return (
+            patent_id_str,
+            *map(get, self._TEXT_KEYS),
+            *map(_parse_date_to_utc, map(get, self._DATE_KEYS)),
+            *map(get, self._TAIL_KEYS)
+        )
 
     def insert(self, conn: sqlite3.Connection, record: Dict[str, Any]) -> str:
         """
@@ -140,554 +415,548 @@ class PatentsDAO(AbstractTableDAO):
         - INSERT OR IGNORE ensures that if the same 'patent_id' is re-inserted, 
           it will be ignored.
         """
-        patent_id_str = record.get("patent_id", "")
-        data_sub = record.get("data", {})
-
-        title = data_sub.get("title")
-        patent_type = data_sub.get("type")
-        pdf_link = data_sub.get("pdf")
-        publication_number = data_sub.get("publication_number")
-        country = data_sub.get("country")
-        application_number = data_sub.get("application_number")
-
-        priority_date = _parse_date_to_utc(data_sub.get("priority_date"))
-        filing_date = _parse_date_to_utc(data_sub.get("filing_date"))
-        publication_date = _parse_date_to_utc(data_sub.get("publication_date"))
-        prior_art_date = _parse_date_to_utc(data_sub.get("prior_art_date"))
-
-        family_id = data_sub.get("family_id")
-        abstract_ = data_sub.get("abstract")
-        description_link = data_sub.get("description_link")
-
-        sql = """
-        INSERT OR IGNORE INTO patents (
-            patent_id, title, type, pdf_link, publication_number, country,
-            application_number, priority_date, filing_date, publication_date,
-            prior_art_date, family_id, abstract, description_link
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """
-        conn.execute(sql, (
-            patent_id_str,
-            title,
-            patent_type,
-            pdf_link,
-            publication_number,
-            country,
-            application_number,
-            priority_date,
-            filing_date,
-            publication_date,
-            prior_art_date,
-            family_id,
-            abstract_,
-            description_link
-        ))
-        return patent_id_str
+        row = self.build_row(record)
+        conn.execute(self._INSERT_SQL, row)
+        return row[0]
 
 
 class InventorsDAO(AbstractTableDAO):
     """
     Manages the 'inventors' table.
     """
-    def create_table(self, conn: sqlite3.Connection) -> None:
-        """
-        Creates 'inventors' table with a foreign key referencing 'patents'.
-        """
-        conn.execute("""
-        CREATE TABLE IF NOT EXISTS inventors (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            patent_id TEXT NOT NULL,
-            inventor_name TEXT,
-            link TEXT,
-            serpapi_link TEXT,
-            FOREIGN KEY (patent_id) REFERENCES patents (patent_id) ON DELETE CASCADE
-        );
-        """)
-
-    def insert(self, conn: sqlite3.Connection, patent_id_str: str, record: Dict[str, Any]) -> None:
+    __slots__ = ()
+
+    _INSERT_SQL = _INSERT_INVENTORS_SQL
+    _INDEXES = ("CREATE INDEX IF NOT EXISTS idx_inventors_patent_id ON inventors (patent_id)",)
+
+    _CREATE_SQL = """
+    CREATE TABLE IF NOT EXISTS inventors (
+        id INTEGER PRIMARY KEY,
+        patent_id TEXT NOT NULL,
+        inventor_name TEXT,
+        link TEXT,
+        serpapi_link TEXT,
+        FOREIGN KEY (patent_id) REFERENCES patents (patent_id) ON DELETE CASCADE
+    );
+    """
+
+    def build_rows(self, patent_id_str: str, data_sub: Dict[str, Any]) -> List[tuple]:
         """
-        Inserts multiple inventor records from 'inventors' array in the SerpAPI data.
+        Builds one row per entry of the 'inventors' array in the SerpAPI data.
         """
-        data_sub = record.get("data", {})
         inventors_list = data_sub.get("inventors", [])
-        sql = """
-        INSERT INTO inventors (patent_id, inventor_name, link, serpapi_link)
-        VALUES (?, ?, ?, ?)
-        """
-        for inv in inventors_list:
-            name = inv.get("name")
-            link = inv.get("link")
-            serpapi = inv.get("serpapi_link")
-            conn.execute(sql, (patent_id_str, name, link, serpapi))
+        rows = [
+            (patent_id_str, inv.get("name"), inv.get("link"), inv.get("serpapi_link"))
+            for inv in inventors_list
+        ]
+        return rows
+
+    def insert(self, conn: sqlite3.Connection, patent_id_str: str, data_sub: Dict[str, Any]) -> None:
+        rows = self.build_rows(patent_id_str, data_sub)
+        if rows:
+            conn.executemany(self._INSERT_SQL, rows)
 
 
 class AssigneesDAO(AbstractTableDAO):
     """
     Manages the 'assignees' table.
     """
-    def create_table(self, conn: sqlite3.Connection) -> None:
-        conn.execute("""
-        CREATE TABLE IF NOT EXISTS assignees (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            patent_id TEXT NOT NULL,
-            name TEXT,
-            FOREIGN KEY (patent_id) REFERENCES patents (patent_id) ON DELETE CASCADE
-        );
-        """)
-
-    def insert(self, conn: sqlite3.Connection, patent_id_str: str, record: Dict[str, Any]) -> None:
-        data_sub = record.get("data", {})
-        assignees = data_sub.get("assignees", [])
-        sql = "INSERT INTO assignees (patent_id, name) VALUES (?, ?)"
-        for a in assignees:
-            if isinstance(a, dict):
-                name = a.get("name")
-            else:
-                name = a
-            if name:
-                conn.execute(sql, (patent_id_str, name))
+    __slots__ = ()
+
+    _INSERT_SQL = _INSERT_ASSIGNEES_SQL
+    _INDEXES = ("CREATE INDEX IF NOT EXISTS idx_assignees_patent_id ON assignees (patent_id)",)
+
+    _CREATE_SQL = """
+    CREATE TABLE IF NOT EXISTS assignees (
+        id INTEGER PRIMARY KEY,
+        patent_id TEXT NOT NULL,
+        name TEXT,
+        FOREIGN KEY (patent_id) REFERENCES patents (patent_id) ON DELETE CASCADE
+    );
+    """
+
+    def _assignee_names(self, assignees: List[Any]) -> List[Any]:
+        """
+        Normalize the SerpAPI 'assignees' array to a list of names.
+
+        Entries are usually plain strings, occasionally dicts with a 'name'
+        key. The element types are collected once (C-level `map`/`set`); only
+        when a dict is present is the per-entry isinstance branch taken, so the
+        common all-strings case passes through untouched, order preserved.
+        """
+        if dict not in set(map(type, assignees)):
+            return assignees
+        return [a.get("name") if isinstance(a, dict) else a for a in assignees]
+
+    def build_rows(self, patent_id_str: str, data_sub: Dict[str, Any]) -> List[tuple]:
+        names = self._assignee_names(data_sub.get("assignees", []))
+        rows = [(patent_id_str, name) for name in filter(None, names)]
+        return rows
+
+    def insert(self, conn: sqlite3.Connection, patent_id_str: str, data_sub: Dict[str, Any]) -> None:
+        rows = self.build_rows(patent_id_str, data_sub)
+        if rows:
+            conn.executemany(self._INSERT_SQL, rows)
 
 
 class PriorArtKeywordsDAO(AbstractTableDAO):
     """
     Stores prior art keywords associated with a patent.
     """
-    def create_table(self, conn: sqlite3.Connection) -> None:
-        conn.execute("""
-        CREATE TABLE IF NOT EXISTS prior_art_keywords (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            patent_id TEXT NOT NULL,
-            keyword TEXT,
-            FOREIGN KEY (patent_id) REFERENCES patents (patent_id) ON DELETE CASCADE
-        );
-        """)
-
-    def insert(self, conn: sqlite3.Connection, patent_id_str: str, record: Dict[str, Any]) -> None:
-        data_sub = record.get("data", {})
+    __slots__ = ()
+
+    _INSERT_SQL = _INSERT_PRIOR_ART_KEYWORDS_SQL
+    _INDEXES = ("CREATE INDEX IF NOT EXISTS idx_prior_art_keywords_patent_id ON prior_art_keywords (patent_id)",)
+
+    _CREATE_SQL = """
+    CREATE TABLE IF NOT EXISTS prior_art_keywords (
+        id INTEGER PRIMARY KEY,
+        patent_id TEXT NOT NULL,
+        keyword TEXT,
+        FOREIGN KEY (patent_id) REFERENCES patents (patent_id) ON DELETE CASCADE
+    );
+    """
+
+    def build_rows(self, patent_id_str: str, data_sub: Dict[str, Any]) -> List[tuple]:
         kw_list = data_sub.get("prior_art_keywords", [])
-        sql = "INSERT INTO prior_art_keywords (patent_id, keyword) VALUES (?, ?)"
-        for kw in kw_list:
-            conn.execute(sql, (patent_id_str, kw))
+        return [(patent_id_str, kw) for kw in kw_list]
+
+    def insert(self, conn: sqlite3.Connection, patent_id_str: str, data_sub: Dict[str, Any]) -> None:
+        rows = self.build_rows(patent_id_str, data_sub)
+        if rows:
+            conn.executemany(self._INSERT_SQL, rows)
 
 
 class EventsDAO(AbstractTableDAO):
     """
     Manages 'events' table, storing event metadata from SerpAPI data.
     """
-    def create_table(self, conn: sqlite3.Connection) -> None:
-        conn.execute("""
-        CREATE TABLE IF NOT EXISTS events (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            patent_id TEXT NOT NULL,
-            event_date DATETIME,
-            title TEXT,
-            type TEXT,
-            critical INTEGER,
-            assignee_search TEXT,
-            description TEXT,
-            FOREIGN KEY (patent_id) REFERENCES patents (patent_id) ON DELETE CASCADE
-        );
-        """)
-
-    def insert(self, conn: sqlite3.Connection, patent_id_str: str, record: Dict[str, Any]) -> None:
-        data_sub = record.get("data", {})
+    __slots__ = ()
+
+    _INSERT_SQL = _INSERT_EVENTS_SQL
+    _INDEXES = ("CREATE INDEX IF NOT EXISTS idx_events_patent_id ON events (patent_id)",)
+
+    _CREATE_SQL = """
+    CREATE TABLE IF NOT EXISTS events (
+        id INTEGER PRIMARY KEY,
+        patent_id TEXT NOT NULL,
+        event_date DATETIME,
+        title TEXT,
+        type TEXT,
+        critical INTEGER,
+        assignee_search TEXT,
+        description TEXT,
+        FOREIGN KEY (patent_id) REFERENCES patents (patent_id) ON DELETE CASCADE
+    );
+    """
+
+    def build_rows(self, patent_id_str: str, data_sub: Dict[str, Any]) -> List[tuple]:
         events_list = data_sub.get("events", [])
-        sql = """
-        INSERT INTO events (
-            patent_id, event_date, title, type, critical, assignee_search, description
-        ) VALUES (?, ?, ?, ?, ?, ?, ?)
-        """
+        rows = []
         for ev in events_list:
             date_ = _parse_date_to_utc(ev.get("date"))
             etitle = ev.get("title")
             etype = ev.get("type")
-            ecrit = 1 if ev.get("critical") else 0
+            ecrit = bool(ev.get("critical"))
             assignee_search = ev.get("assignee_search")
 
             desc_data = ev.get("description")
-            if isinstance(desc_data, list):
-                desc_str = "; ".join(desc_data)
-            elif isinstance(desc_data, str):
-                desc_str = desc_data
-            else:
-                desc_str = None
+            desc_str = (
+                "; ".join(desc_data) if isinstance(desc_data, list)
+                else desc_data if isinstance(desc_data, str)
+                else None
+            )
 
-            conn.execute(sql, (
+            rows.append((
                 patent_id_str, date_, etitle, etype, ecrit, assignee_search, desc_str
             ))
+        return rows
+
+    def insert(self, conn: sqlite3.Connection, patent_id_str: str, data_sub: Dict[str, Any]) -> None:
+        rows = self.build_rows(patent_id_str, data_sub)
+        if rows:
+            conn.executemany(self._INSERT_SQL, rows)
 
 
 class ExternalLinksDAO(AbstractTableDAO):
     """
     Stores external links related to a patent (text + link).
     """
-    def create_table(self, conn: sqlite3.Connection) -> None:
-        conn.execute("""
-        CREATE TABLE IF NOT EXISTS external_links (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            patent_id TEXT NOT NULL,
-            text TEXT,
-            link TEXT,
-            FOREIGN KEY (patent_id) REFERENCES patents (patent_id) ON DELETE CASCADE
-        );
-        """)
-
-    def insert(self, conn: sqlite3.Connection, patent_id_str: str, record: Dict[str, Any]) -> None:
-        data_sub = record.get("data", {})
+    __slots__ = ()
+
+    _INSERT_SQL = _INSERT_EXTERNAL_LINKS_SQL
+    _INDEXES = ("CREATE INDEX IF NOT EXISTS idx_external_links_patent_id ON external_links (patent_id)",)
+
+    _CREATE_SQL = """
+    CREATE TABLE IF NOT EXISTS external_links (
+        id INTEGER PRIMARY KEY,
+        patent_id TEXT NOT NULL,
+        text TEXT,
+        link TEXT,
+        FOREIGN KEY (patent_id) REFERENCES patents (patent_id) ON DELETE CASCADE
+    );
+    """
+
+    def build_rows(self, patent_id_str: str, data_sub: Dict[str, Any]) -> List[tuple]:
         elist = data_sub.get("external_links", [])
-        sql = "INSERT INTO external_links (patent_id, text, link) VALUES (?, ?, ?)"
-        for e in elist:
-            txt = e.get("text")
-            lnk = e.get("link")
-            conn.execute(sql, (patent_id_str, txt, lnk))
+        return [(patent_id_str, e.get("text"), e.get("link")) for e in elist]
+
+    def insert(self, conn: sqlite3.Connection, patent_id_str: str, data_sub: Dict[str, Any]) -> None:
+        rows = self.build_rows(patent_id_str, data_sub)
+        if rows:
+            conn.executemany(self._INSERT_SQL, rows)
 
 
 class ImagesDAO(AbstractTableDAO):
     """
     Stores image URLs associated with the patent.
     """
-    def create_table(self, conn: sqlite3.Connection) -> None:
-        conn.execute("""
-        CREATE TABLE IF NOT EXISTS images (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            patent_id TEXT NOT NULL,
-            image_url TEXT,
-            FOREIGN KEY (patent_id) REFERENCES patents (patent_id) ON DELETE CASCADE
-        );
-        """)
-
-    def insert(self, conn: sqlite3.Connection, patent_id_str: str, record: Dict[str, Any]) -> None:
-        data_sub = record.get("data", {})
+    __slots__ = ()
+
+    _INSERT_SQL = _INSERT_IMAGES_SQL
+    _INDEXES = ("CREATE INDEX IF NOT EXISTS idx_images_patent_id ON images (patent_id)",)
+
+    _CREATE_SQL = """
+    CREATE TABLE IF NOT EXISTS images (
+        id INTEGER PRIMARY KEY,
+        patent_id TEXT NOT NULL,
+        image_url TEXT,
+        FOREIGN KEY (patent_id) REFERENCES patents (patent_id) ON DELETE CASCADE
+    );
+    """
+
+    def build_rows(self, patent_id_str: str, data_sub: Dict[str, Any]) -> List[tuple]:
         ilist = data_sub.get("images", [])
-        sql = "INSERT INTO images (patent_id, image_url) VALUES (?, ?)"
-        for url in ilist:
-            conn.execute(sql, (patent_id_str, url))
+        return [(patent_id_str, url) for url in ilist]
+
+    def insert(self, conn: sqlite3.Connection, patent_id_str: str, data_sub: Dict[str, Any]) -> None:
+        rows = self.build_rows(patent_id_str, data_sub)
+        if rows:
+            conn.executemany(self._INSERT_SQL, rows)
 
 
 class ClassificationsDAO(AbstractTableDAO):
     """
     Stores classification info for patents, possibly CPC or other codes.
     """
-    def create_table(self, conn: sqlite3.Connection) -> None:
-        conn.execute("""
-        CREATE TABLE IF NOT EXISTS classifications (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            patent_id TEXT NOT NULL,
-            code TEXT,
-            description TEXT,
-            leaf INTEGER,
-            first_code INTEGER,
-            is_cpc INTEGER,
-            additional INTEGER,
-            FOREIGN KEY (patent_id) REFERENCES patents (patent_id) ON DELETE CASCADE
-        );
-        """)
-
-    def insert(self, conn: sqlite3.Connection, patent_id_str: str, record: Dict[str, Any]) -> None:
-        data_sub = record.get("data", {})
+    __slots__ = ()
+
+    _INSERT_SQL = _INSERT_CLASSIFICATIONS_SQL
+    _INDEXES = ("CREATE INDEX IF NOT EXISTS idx_classifications_patent_id ON classifications (patent_id)",)
+    # Boolean columns, in _INSERT_SQL order after code/description.
+    _FLAG_KEYS = ("leaf", "first_code", "is_cpc", "additional")
+
+    _CREATE_SQL = """
+    CREATE TABLE IF NOT EXISTS classifications (
+        id INTEGER PRIMARY KEY,
+        patent_id TEXT NOT NULL,
+        code TEXT,
+        description TEXT,
+        leaf INTEGER,
+        first_code INTEGER,
+        is_cpc INTEGER,
+        additional INTEGER,
+        FOREIGN KEY (patent_id) REFERENCES patents (patent_id) ON DELETE CASCADE
+    );
+    """
+
+    def build_rows(self, patent_id_str: str, data_sub: Dict[str, Any]) -> List[tuple]:
         c_list = data_sub.get("classifications", [])
-        sql = """
-        INSERT INTO classifications (
-            patent_id, code, description, leaf, first_code, is_cpc, additional
-        ) VALUES (?, ?, ?, ?, ?, ?, ?)
-        """
-        for c in c_list:
-            code = c.get("code")
-            desc = c.get("description")
-            leaf = 1 if c.get("leaf") else 0
-            first_code = 1 if c.get("first_code") else 0
-            is_cpc = 1 if c.get("is_cpc") else 0
-            additional = 1 if c.get("additional") else 0
-            conn.execute(sql, (patent_id_str, code, desc, leaf, first_code, is_cpc, additional))
+        rows = [
+            (
+                patent_id_str,
+                c.get("code"),
+                c.get("description"),
+                *map(bool, map(c.get, self._FLAG_KEYS))
+            )
+            for c in c_list
+        ]
+        return rows
+
+    def insert(self, conn: sqlite3.Connection, patent_id_str: str, data_sub: Dict[str, Any]) -> None:
+        rows = self.build_rows(patent_id_str, data_sub)
+        if rows:
+            conn.executemany(self._INSERT_SQL, rows)
 
 
 class ClaimsDAO(AbstractTableDAO):
     """
     Stores textual claims from the patent.
     """
-    def create_table(self, conn: sqlite3.Connection) -> None:
-        conn.execute("""
-        CREATE TABLE IF NOT EXISTS claims (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            patent_id TEXT NOT NULL,
-            claim_no INTEGER,
-            claim_txt TEXT,
-            FOREIGN KEY (patent_id) REFERENCES patents (patent_id) ON DELETE CASCADE
-        );
-        """)
-
-    def insert(self, conn: sqlite3.Connection, patent_id_str: str, record: Dict[str, Any]) -> None:
-        data_sub = record.get("data", {})
+    __slots__ = ()
+
+    _INSERT_SQL = _INSERT_CLAIMS_SQL
+    _INDEXES = ("CREATE INDEX IF NOT EXISTS idx_claims_patent_id ON claims (patent_id)",)
+
+    _CREATE_SQL = """
+    CREATE TABLE IF NOT EXISTS claims (
+        id INTEGER PRIMARY KEY,
+        patent_id TEXT NOT NULL,
+        claim_no INTEGER,
+        claim_txt TEXT,
+        FOREIGN KEY (patent_id) REFERENCES patents (patent_id) ON DELETE CASCADE
+    );
+    """
+
+    def build_rows(self, patent_id_str: str, data_sub: Dict[str, Any]) -> List[tuple]:
         c_list = data_sub.get("claims", [])
-        sql = "INSERT INTO claims (patent_id, claim_no, claim_txt) VALUES (?, ?, ?)"
-        for i, claim_txt in enumerate(c_list, start=1):
-            conn.execute(sql, (patent_id_str, i, claim_txt))
+        return [
+            (patent_id_str, i, claim_txt) for i, claim_txt in enumerate(c_list, start=1)
+        ]
+
+    def insert(self, conn: sqlite3.Connection, patent_id_str: str, data_sub: Dict[str, Any]) -> None:
+        rows = self.build_rows(patent_id_str, data_sub)
+        if rows:
+            conn.executemany(self._INSERT_SQL, rows)
 
 
 class ApplicationsClaimingPriorityDAO(AbstractTableDAO):
     """
     Manages 'applications_claiming_priority' table, referencing future continuations or expansions.
     """
-    def create_table(self, conn: sqlite3.Connection) -> None:
-        conn.execute("""
-        CREATE TABLE IF NOT EXISTS applications_claiming_priority (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            patent_id TEXT NOT NULL,
-            application_number TEXT,
-            priority_date DATETIME,
-            filing_date DATETIME,
-            representative_publication TEXT,
-            primary_language TEXT,
-            title TEXT,
-            FOREIGN KEY (patent_id) REFERENCES patents (patent_id) ON DELETE CASCADE
-        );
-        """)
-
-    def insert(self, conn: sqlite3.Connection, patent_id_str: str, record: Dict[str, Any]) -> None:
-        data_sub = record.get("data", {})
+    __slots__ = ()
+
+    _INSERT_SQL = _INSERT_APPLICATIONS_CLAIMING_PRIORITY_SQL
+    _INDEXES = ("CREATE INDEX IF NOT EXISTS idx_applications_claiming_priority_patent_id ON applications_claiming_priority (patent_id)",)
+
+    _CREATE_SQL = """
+    CREATE TABLE IF NOT EXISTS applications_claiming_priority (
+        id INTEGER PRIMARY KEY,
+        patent_id TEXT NOT NULL,
+        application_number TEXT,
+        priority_date DATETIME,
+        filing_date DATETIME,
+        representative_publication TEXT,
+        primary_language TEXT,
+        title TEXT,
+        FOREIGN KEY (patent_id) REFERENCES patents (patent_id) ON DELETE CASCADE
+    );
+    """
+
+    def build_rows(self, patent_id_str: str, data_sub: Dict[str, Any]) -> List[tuple]:
         acp_list = data_sub.get("applications_claiming_priority", [])
-        sql = """
-        INSERT INTO applications_claiming_priority (
-            patent_id, application_number, priority_date, filing_date,
-            representative_publication, primary_language, title
-        ) VALUES (?, ?, ?, ?, ?, ?, ?)
-        """
-        for acp in acp_list:
-            app_no = acp.get("application_number")
-            pd = _parse_date_to_utc(acp.get("priority_date"))
-            fd = _parse_date_to_utc(acp.get("filing_date"))
-            repub = acp.get("representative_publication")
-            lang = acp.get("primary_language")
-            ttl = acp.get("title")
-            conn.execute(sql, (patent_id_str, app_no, pd, fd, repub, lang, ttl))
+        rows = [
+            (
+                patent_id_str,
+                acp.get("application_number"),
+                _parse_date_to_utc(acp.get("priority_date")),
+                _parse_date_to_utc(acp.get("filing_date")),
+                acp.get("representative_publication"),
+                acp.get("primary_language"),
+                acp.get("title")
+            )
+            for acp in acp_list
+        ]
+        return rows
+
+    def insert(self, conn: sqlite3.Connection, patent_id_str: str, data_sub: Dict[str, Any]) -> None:
+        rows = self.build_rows(patent_id_str, data_sub)
+        if rows:
+            conn.executemany(self._INSERT_SQL, rows)
 
 
 class WorldwideApplicationsDAO(AbstractTableDAO):
     """
     Manages 'worldwide_applications', which can hold multi-year app data by region or year.
     """
-    def create_table(self, conn: sqlite3.Connection) -> None:
-        conn.execute("""
-        CREATE TABLE IF NOT EXISTS worldwide_applications (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            patent_id TEXT NOT NULL,
-            year INTEGER,
-            application_number TEXT,
-            country_code TEXT,
-            document_id TEXT,
-            filing_date DATETIME,
-            legal_status TEXT,
-            legal_status_cat TEXT,
-            this_app INTEGER,
-            FOREIGN KEY (patent_id) REFERENCES patents (patent_id) ON DELETE CASCADE
-        );
-        """)
-
-    def insert(self, conn: sqlite3.Connection, patent_id_str: str, record: Dict[str, Any]) -> None:
-        data_sub = record.get("data", {})
+    __slots__ = ()
+
+    _INSERT_SQL = _INSERT_WORLDWIDE_APPLICATIONS_SQL
+    _INDEXES = ("CREATE INDEX IF NOT EXISTS idx_worldwide_applications_patent_id ON worldwide_applications (patent_id)",)
+
+    _CREATE_SQL = """
+    CREATE TABLE IF NOT EXISTS worldwide_applications (
+        id INTEGER PRIMARY KEY,
+        patent_id TEXT NOT NULL,
+        year INTEGER,
+        application_number TEXT,
+        country_code TEXT,
+        document_id TEXT,
+        filing_date DATETIME,
+        legal_status TEXT,
+        legal_status_cat TEXT,
+        this_app INTEGER,
+        FOREIGN KEY (patent_id) REFERENCES patents (patent_id) ON DELETE CASCADE
+    );
+    """
+
+    def build_rows(self, patent_id_str: str, data_sub: Dict[str, Any]) -> List[tuple]:
         wwa = data_sub.get("worldwide_applications", {})
-        sql = """
-        INSERT INTO worldwide_applications (
-            patent_id, year, application_number, country_code, document_id,
-            filing_date, legal_status, legal_status_cat, this_app
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """
+        rows = []
         for year_str, wlist in wwa.items():
-            try:
-                year_int = int(year_str)
-            except ValueError:
-                year_int = None
+            year_int = _parse_year(year_str)
             if not isinstance(wlist, list):
                 continue
-            for wapp in wlist:
-                app_no = wapp.get("application_number")
-                ccode = wapp.get("country_code")
-                doc_id = wapp.get("document_id")
-                fd = _parse_date_to_utc(wapp.get("filing_date"))
-                ls = wapp.get("legal_status")
-                lsc = wapp.get("legal_status_cat")
-                tapp = 1 if wapp.get("this_app") else 0
-                conn.execute(sql, (
-                    patent_id_str, year_int, app_no, ccode, doc_id,
-                    fd, ls, lsc, tapp
-                ))
+            rows.extend(
+                (
+                    patent_id_str, year_int,
+                    wapp.get("application_number"),
+                    wapp.get("country_code"),
+                    wapp.get("document_id"),
+                    _parse_date_to_utc(wapp.get("filing_date")),
+                    wapp.get("legal_status"),
+                    wapp.get("legal_status_cat"),
+                    bool(wapp.get("this_app"))
+                )
+                for wapp in wlist
+            )
+        return rows
+
+    def insert(self, conn: sqlite3.Connection, patent_id_str: str, data_sub: Dict[str, Any]) -> None:
+        rows = self.build_rows(patent_id_str, data_sub)
+        if rows:
+            conn.executemany(self._INSERT_SQL, rows)
 
 
 class PatentCitationsDAO(AbstractTableDAO):
     """
     Manages 'patent_citations' table, storing references to other patents cited.
     """
-    def create_table(self, conn: sqlite3.Connection) -> None:
-        conn.execute("""
-        CREATE TABLE IF NOT EXISTS patent_citations (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            patent_id TEXT NOT NULL,
-            is_family_to_family INTEGER,
-            publication_number TEXT,
-            primary_language TEXT,
-            examiner_cited INTEGER,
-            priority_date DATETIME,
-            publication_date DATETIME,
-            assignee_original TEXT,
-            title TEXT,
-            serpapi_link TEXT,
-            patent_id_ref TEXT,
-            FOREIGN KEY (patent_id) REFERENCES patents (patent_id) ON DELETE CASCADE
-        );
-        """)
-
-    def insert(self, conn: sqlite3.Connection, patent_id_str: str, record: Dict[str, Any]) -> None:
+    __slots__ = ()
+
+    _INSERT_SQL = _INSERT_PATENT_CITATIONS_SQL
+    _INDEXES = ("CREATE INDEX IF NOT EXISTS idx_patent_citations_patent_id ON patent_citations (patent_id)",)
+
+    _CREATE_SQL = """
+    CREATE TABLE IF NOT EXISTS patent_citations (
+        id INTEGER PRIMARY KEY,
+        patent_id TEXT NOT NULL,
+        is_family_to_family INTEGER,
+        publication_number TEXT,
+        primary_language TEXT,
+        examiner_cited INTEGER,
+        priority_date DATETIME,
+        publication_date DATETIME,
+        assignee_original TEXT,
+        title TEXT,
+        serpapi_link TEXT,
+        patent_id_ref TEXT,
+        FOREIGN KEY (patent_id) REFERENCES patents (patent_id) ON DELETE CASCADE
+    );
+    """
+
+    def build_rows(self, patent_id_str: str, data_sub: Dict[str, Any]) -> List[tuple]:
         """
-        For each 'original' or 'family_to_family' list, insert references to other patents.
+        For each 'original' or 'family_to_family' list, build rows referencing other patents.
         """
-        data_sub = record.get("data", {})
         pc = data_sub.get("patent_citations", {})
-        sql = """
-        INSERT INTO patent_citations (
-            patent_id, is_family_to_family, publication_number, primary_language, examiner_cited,
-            priority_date, publication_date, assignee_original, title, serpapi_link, patent_id_ref
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """
-        for key in ["original", "family_to_family"]:
-            cit_list = pc.get(key, [])
-            is_ftf = 1 if key == "family_to_family" else 0
-            for c in cit_list:
-                pub_no = c.get("publication_number")
-                plang = c.get("primary_language")
-                exam_cited = 1 if c.get("examiner_cited") else 0
-                pdate = _parse_date_to_utc(c.get("priority_date"))
-                pub_date = _parse_date_to_utc(c.get("publication_date"))
-                assign_orig = c.get("assignee_original")
-                ttl = c.get("title")
-                link = c.get("serpapi_link")
-                pid_ref = c.get("patent_id")
-                conn.execute(sql, (
-                    patent_id_str, is_ftf, pub_no, plang, exam_cited,
-                    pdate, pub_date, assign_orig, ttl, link, pid_ref
-                ))
+        return list(_iter_citation_rows(patent_id_str, pc))
+
+    def insert(self, conn: sqlite3.Connection, patent_id_str: str, data_sub: Dict[str, Any]) -> None:
+        rows = self.build_rows(patent_id_str, data_sub)
+        if rows:
+            conn.executemany(self._INSERT_SQL, rows)
 
 
 class CitedByDAO(AbstractTableDAO):
     """
     Stores patents that cite the current patent (the inverse of patent_citations).
     """
-    def create_table(self, conn: sqlite3.Connection) -> None:
-        conn.execute("""
-        CREATE TABLE IF NOT EXISTS cited_by (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            patent_id TEXT NOT NULL,
-            is_family_to_family INTEGER,
-            publication_number TEXT,
-            primary_language TEXT,
-            examiner_cited INTEGER,
-            priority_date DATETIME,
-            publication_date DATETIME,
-            assignee_original TEXT,
-            title TEXT,
-            serpapi_link TEXT,
-            patent_id_ref TEXT,
-            FOREIGN KEY (patent_id) REFERENCES patents (patent_id) ON DELETE CASCADE
-        );
-        """)
-
-    def insert(self, conn: sqlite3.Connection, patent_id_str: str, record: Dict[str, Any]) -> None:
-        data_sub = record.get("data", {})
+    __slots__ = ()
+
+    _INSERT_SQL = _INSERT_CITED_BY_SQL
+    _INDEXES = ("CREATE INDEX IF NOT EXISTS idx_cited_by_patent_id ON cited_by (patent_id)",)
+
+    _CREATE_SQL = """
+    CREATE TABLE IF NOT EXISTS cited_by (
+        id INTEGER PRIMARY KEY,
+        patent_id TEXT NOT NULL,
+        is_family_to_family INTEGER,
+        publication_number TEXT,
+        primary_language TEXT,
+        examiner_cited INTEGER,
+        priority_date DATETIME,
+        publication_date DATETIME,
+        assignee_original TEXT,
+        title TEXT,
+        serpapi_link TEXT,
+        patent_id_ref TEXT,
+        FOREIGN KEY (patent_id) REFERENCES patents (patent_id) ON DELETE CASCADE
+    );
+    """
+
+    def build_rows(self, patent_id_str: str, data_sub: Dict[str, Any]) -> List[tuple]:
         cb = data_sub.get("cited_by", {})
-        sql = """
-        INSERT INTO cited_by (
-            patent_id, is_family_to_family, publication_number, primary_language, examiner_cited,
-            priority_date, publication_date, assignee_original, title, serpapi_link, patent_id_ref
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """
-        for key in ["original", "family_to_family"]:
-            cit_list = cb.get(key, [])
-            is_ftf = 1 if key == "family_to_family" else 0
-            for c in cit_list:
-                pub_no = c.get("publication_number")
-                plang = c.get("primary_language")
-                exam_cited = 1 if c.get("examiner_cited") else 0
-                pdate = _parse_date_to_utc(c.get("priority_date"))
-                pub_date = _parse_date_to_utc(c.get("publication_date"))
-                assign_orig = c.get("assignee_original")
-                ttl = c.get("title")
-                link = c.get("serpapi_link")
-                pid_ref = c.get("patent_id")
-                conn.execute(sql, (
-                    patent_id_str, is_ftf, pub_no, plang, exam_cited,
-                    pdate, pub_date, assign_orig, ttl, link, pid_ref
-                ))
+        return list(_iter_citation_rows(patent_id_str, cb))
+
+    def insert(self, conn: sqlite3.Connection, patent_id_str: str, data_sub: Dict[str, Any]) -> None:
+        rows = self.build_rows(patent_id_str, data_sub)
+        if rows:
+            conn.executemany(self._INSERT_SQL, rows)
 
 
 class LegalEventsDAO(AbstractTableDAO):
     """
     Stores legal event data (like assignments, status changes).
     """
-    def create_table(self, conn: sqlite3.Connection) -> None:
-        conn.execute("""
-        CREATE TABLE IF NOT EXISTS legal_events (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            patent_id TEXT NOT NULL,
-            date DATETIME,
-            code TEXT,
-            title TEXT,
-            attributes_json TEXT,
-            FOREIGN KEY (patent_id) REFERENCES patents (patent_id) ON DELETE CASCADE
-        );
-        """)
-
-    def insert(self, conn: sqlite3.Connection, patent_id_str: str, record: Dict[str, Any]) -> None:
-        data_sub = record.get("data", {})
+    __slots__ = ()
+
+    _INSERT_SQL = _INSERT_LEGAL_EVENTS_SQL
+    _INDEXES = ("CREATE INDEX IF NOT EXISTS idx_legal_events_patent_id ON legal_events (patent_id)",)
+
+    _CREATE_SQL = """
+    CREATE TABLE IF NOT EXISTS legal_events (
+        id INTEGER PRIMARY KEY,
+        patent_id TEXT NOT NULL,
+        date DATETIME,
+        code TEXT,
+        title TEXT,
+        attributes_json TEXT,
+        FOREIGN KEY (patent_id) REFERENCES patents (patent_id) ON DELETE CASCADE
+    );
+    """
+
+    def build_rows(self, patent_id_str: str, data_sub: Dict[str, Any]) -> List[tuple]:
         le_list = data_sub.get("legal_events", [])
-        sql = """
-        INSERT INTO legal_events (
-            patent_id, date, code, title, attributes_json
-        ) VALUES (?, ?, ?, ?, ?)
-        """
+        rows = []
         for le in le_list:
             date_ = _parse_date_to_utc(le.get("date"))
             code = le.get("code")
             ttl = le.get("title")
-            attrs = le.get("attributes", [])
-            attrs_str = json.dumps(attrs, ensure_ascii=False) if attrs else None
+            attrs_str = _attrs_to_json(le.get("attributes", []))
+
+            rows.append((patent_id_str, date_, code, ttl, attrs_str))
+        return rows
 
-            conn.execute(sql, (patent_id_str, date_, code, ttl, attrs_str))
+    def insert(self, conn: sqlite3.Connection, patent_id_str: str, data_sub: Dict[str, Any]) -> None:
+        rows = self.build_rows(patent_id_str, data_sub)
+        if rows:
+            conn.executemany(self._INSERT_SQL, rows)
 
 
 class ConceptsDAO(AbstractTableDAO):
     """
     Stores entity or concept matches (chemical, domain-specific, etc.).
     """
-    def create_table(self, conn: sqlite3.Connection) -> None:
-        conn.execute("""
-        CREATE TABLE IF NOT EXISTS concepts (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            patent_id TEXT NOT NULL,
-            concept_id TEXT,
-            domain TEXT,
-            name TEXT,
-            similarity REAL,
-            sections TEXT,
-            count INTEGER,
-            inchi_key TEXT,
-            smiles TEXT,
-            FOREIGN KEY (patent_id) REFERENCES patents (patent_id) ON DELETE CASCADE
-        );
-        """)
-
-    def insert(self, conn: sqlite3.Connection, patent_id_str: str, record: Dict[str, Any]) -> None:
-        data_sub = record.get("data", {})
+    __slots__ = ()
+
+    _INSERT_SQL = _INSERT_CONCEPTS_SQL
+    _INDEXES = ("CREATE INDEX IF NOT EXISTS idx_concepts_patent_id ON concepts (patent_id)",)
+
+    _CREATE_SQL = """
+    CREATE TABLE IF NOT EXISTS concepts (
+        id INTEGER PRIMARY KEY,
+        patent_id TEXT NOT NULL,
+        concept_id TEXT,
+        domain TEXT,
+        name TEXT,
+        similarity REAL,
+        sections TEXT,
+        count INTEGER,
+        inchi_key TEXT,
+        smiles TEXT,
+        FOREIGN KEY (patent_id) REFERENCES patents (patent_id) ON DELETE CASCADE
+    );
+    """
+
+    def build_rows(self, patent_id_str: str, data_sub: Dict[str, Any]) -> List[tuple]:
         c_dict = data_sub.get("concepts", {})
         match_list = c_dict.get("match", [])
 
         if isinstance(match_list, dict):
             match_list = [match_list]
 
-        sql = """
-        INSERT INTO concepts (
-            patent_id, concept_id, domain, name, similarity, sections,
-            count, inchi_key, smiles
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """
+        rows = []
         for m in match_list:
             cid = m.get("id")
             domain = m.get("domain")
@@ -699,224 +968,440 @@ class ConceptsDAO(AbstractTableDAO):
             ikey = m.get("inchi_key")
             sm = m.get("smiles")
 
-            conn.execute(sql, (
+            rows.append((
                 patent_id_str, cid, domain, name_, sim, sections_str,
                 cnt, ikey, sm
             ))
+        return rows
+
+    def insert(self, conn: sqlite3.Connection, patent_id_str: str, data_sub: Dict[str, Any]) -> None:
+        rows = self.build_rows(patent_id_str, data_sub)
+        if rows:
+            conn.executemany(self._INSERT_SQL, rows)
 
 
 class ChildApplicationsDAO(AbstractTableDAO):
     """
     Child applications that reference this patent (continuations).
     """
-    def create_table(self, conn: sqlite3.Connection) -> None:
-        conn.execute("""
-        CREATE TABLE IF NOT EXISTS child_applications (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            patent_id TEXT NOT NULL,
-            application_number TEXT,
-            relation_type TEXT,
-            representative_publication TEXT,
-            primary_language TEXT,
-            priority_date DATETIME,
-            filing_date DATETIME,
-            title TEXT,
-            FOREIGN KEY (patent_id) REFERENCES patents (patent_id) ON DELETE CASCADE
-        );
-        """)
-
-    def insert(self, conn: sqlite3.Connection, patent_id_str: str, record: Dict[str, Any]) -> None:
-        data_sub = record.get("data", {})
+    __slots__ = ()
+
+    _INSERT_SQL = _INSERT_CHILD_APPLICATIONS_SQL
+    _INDEXES = ("CREATE INDEX IF NOT EXISTS idx_child_applications_patent_id ON child_applications (patent_id)",)
+
+    _CREATE_SQL = """
+    CREATE TABLE IF NOT EXISTS child_applications (
+        id INTEGER PRIMARY KEY,
+        patent_id TEXT NOT NULL,
+        application_number TEXT,
+        relation_type TEXT,
+        representative_publication TEXT,
+        primary_language TEXT,
+        priority_date DATETIME,
+        filing_date DATETIME,
+        title TEXT,
+        FOREIGN KEY (patent_id) REFERENCES patents (patent_id) ON DELETE CASCADE
+    );
+    """
+
+    def build_rows(self, patent_id_str: str, data_sub: Dict[str, Any]) -> List[tuple]:
         child_apps = data_sub.get("child_applications", [])
-        sql = """
-        INSERT INTO child_applications (
-            patent_id, application_number, relation_type,
-            representative_publication, primary_language,
-            priority_date, filing_date, title
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """
-        for ch in child_apps:
-            app_no = ch.get("application_number")
-            relation = ch.get("relation_type")
-            repub = ch.get("representative_publication")
-            lang = ch.get("primary_language")
-            pd = _parse_date_to_utc(ch.get("priority_date"))
-            fd = _parse_date_to_utc(ch.get("filing_date"))
-            tl = ch.get("title")
-            conn.execute(sql, (patent_id_str, app_no, relation, repub, lang, pd, fd, tl))
+        rows = [
+            (
+                patent_id_str,
+                ch.get("application_number"),
+                ch.get("relation_type"),
+                ch.get("representative_publication"),
+                ch.get("primary_language"),
+                _parse_date_to_utc(ch.get("priority_date")),
+                _parse_date_to_utc(ch.get("filing_date")),
+                ch.get("title")
+            )
+            for ch in child_apps
+        ]
+        return rows
+
+    def insert(self, conn: sqlite3.Connection, patent_id_str: str, data_sub: Dict[str, Any]) -> None:
+        rows = self.build_rows(patent_id_str, data_sub)
+        if rows:
+            conn.executemany(self._INSERT_SQL, rows)
 
 
 class ParentApplicationsDAO(AbstractTableDAO):
     """
     Parent applications from which this patent claims priority or is derived.
     """
-    def create_table(self, conn: sqlite3.Connection) -> None:
-        conn.execute("""
-        CREATE TABLE IF NOT EXISTS parent_applications (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            patent_id TEXT NOT NULL,
-            application_number TEXT,
-            relation_type TEXT,
-            representative_publication TEXT,
-            primary_language TEXT,
-            priority_date DATETIME,
-            filing_date DATETIME,
-            title TEXT,
-            FOREIGN KEY (patent_id) REFERENCES patents (patent_id) ON DELETE CASCADE
-        );
-        """)
-
-    def insert(self, conn: sqlite3.Connection, patent_id_str: str, record: Dict[str, Any]) -> None:
-        data_sub = record.get("data", {})
+    __slots__ = ()
+
+    _INSERT_SQL = _INSERT_PARENT_APPLICATIONS_SQL
+    _INDEXES = ("CREATE INDEX IF NOT EXISTS idx_parent_applications_patent_id ON parent_applications (patent_id)",)
+
+    _CREATE_SQL = """
+    CREATE TABLE IF NOT EXISTS parent_applications (
+        id INTEGER PRIMARY KEY,
+        patent_id TEXT NOT NULL,
+        application_number TEXT,
+        relation_type TEXT,
+        representative_publication TEXT,
+        primary_language TEXT,
+        priority_date DATETIME,
+        filing_date DATETIME,
+        title TEXT,
+        FOREIGN KEY (patent_id) REFERENCES patents (patent_id) ON DELETE CASCADE
+    );
+    """
+
+    def build_rows(self, patent_id_str: str, data_sub: Dict[str, Any]) -> List[tuple]:
         parent_apps = data_sub.get("parent_applications", [])
-        sql = """
-        INSERT INTO parent_applications (
-            patent_id, application_number, relation_type,
-            representative_publication, primary_language,
-            priority_date, filing_date, title
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """
-        for pa in parent_apps:
-            app_no = pa.get("application_number")
-            relation = pa.get("relation_type")
-            repub = pa.get("representative_publication")
-            lang = pa.get("primary_language")
-            pd = _parse_date_to_utc(pa.get("priority_date"))
-            fd = _parse_date_to_utc(pa.get("filing_date"))
-            ttl = pa.get("title")
-            conn.execute(sql, (patent_id_str, app_no, relation, repub, lang, pd, fd, ttl))
+        rows = [
+            (
+                patent_id_str,
+                pa.get("application_number"),
+                pa.get("relation_type"),
+                pa.get("representative_publication"),
+                pa.get("primary_language"),
+                _parse_date_to_utc(pa.get("priority_date")),
+                _parse_date_to_utc(pa.get("filing_date")),
+                pa.get("title")
+            )
+            for pa in parent_apps
+        ]
+        return rows
+
+    def insert(self, conn: sqlite3.Connection, patent_id_str: str, data_sub: Dict[str, Any]) -> None:
+        rows = self.build_rows(patent_id_str, data_sub)
+        if rows:
+            conn.executemany(self._INSERT_SQL, rows)
 
 
 class PriorityApplicationsDAO(AbstractTableDAO):
     """
     Priority applications which established the earliest priority date for the patent.
     """
-    def create_table(self, conn: sqlite3.Connection) -> None:
-        conn.execute("""
-        CREATE TABLE IF NOT EXISTS priority_applications (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            patent_id TEXT NOT NULL,
-            application_number TEXT,
-            representative_publication TEXT,
-            primary_language TEXT,
-            priority_date DATETIME,
-            filing_date DATETIME,
-            title TEXT,
-            FOREIGN KEY (patent_id) REFERENCES patents (patent_id) ON DELETE CASCADE
-        );
-        """)
-
-    def insert(self, conn: sqlite3.Connection, patent_id_str: str, record: Dict[str, Any]) -> None:
-        data_sub = record.get("data", {})
-        pa_list = data_sub.get("priority_applications", [])
-        sql = """
-        INSERT INTO priority_applications (
-            patent_id, application_number, representative_publication, primary_language,
-            priority_date, filing_date, title
-        ) VALUES (?, ?, ?, ?, ?, ?, ?)
-        """
-        for pa in pa_list:
-            app_no = pa.get("application_number")
-            repub = pa.get("representative_publication")
-            lang = pa.get("primary_language")
-            pd = _parse_date_to_utc(pa.get("priority_date"))
-            fd = _parse_date_to_utc(pa.get("filing_date"))
-            ttl = pa.get("title")
-            conn.execute(sql, (patent_id_str, app_no, repub, lang, pd, fd, ttl))
+    __slots__ = ()
+
+    _INSERT_SQL = _INSERT_PRIORITY_APPLICATIONS_SQL
+    _MULTI_VALUES = True
+    _INDEXES = ("CREATE INDEX IF NOT EXISTS idx_priority_applications_patent_id ON priority_applications (patent_id)",)
+
+    _CREATE_SQL = """
+    CREATE TABLE IF NOT EXISTS priority_applications (
+        id INTEGER PRIMARY KEY,
+        patent_id TEXT NOT NULL,
+        application_number TEXT,
+        representative_publication TEXT,
+        primary_language TEXT,
+        priority_date DATETIME,
+        filing_date DATETIME,
+        title TEXT,
+        FOREIGN KEY (patent_id) REFERENCES patents (patent_id) ON DELETE CASCADE
+    );
+    """
+
+    def build_rows(self, patent_id_str: str, data_sub: Dict[str, Any]) -> List[tuple]:
+        pa_list = data_sub.get("priority_applications")
+        if not pa_list:
+            return []
+        return [
+            (
+                patent_id_str,
+                pa.get("application_number"),
+                pa.get("representative_publication"),
+                pa.get("primary_language"),
+                _parse_date_to_utc(pa.get("priority_date")),
+                _parse_date_to_utc(pa.get("filing_date")),
+                pa.get("title")
+            )
+            for pa in pa_list
+        ]
+
+    def insert(self, conn: sqlite3.Connection, patent_id_str: str, data_sub: Dict[str, Any]) -> None:
+        rows = self.build_rows(patent_id_str, data_sub)
+        if rows:
+            self.insert_values_expanded(conn, rows)
 
 
 class NonPatentCitationsDAO(AbstractTableDAO):
     """
     Stores references to non-patent literature cited in the application.
     """
-    def create_table(self, conn: sqlite3.Connection) -> None:
-        conn.execute("""
-        CREATE TABLE IF NOT EXISTS non_patent_citations (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            patent_id TEXT NOT NULL,
-            citation_title TEXT,
-            examiner_cited INTEGER,
-            FOREIGN KEY (patent_id) REFERENCES patents (patent_id) ON DELETE CASCADE
-        );
-        """)
-
-    def insert(self, conn: sqlite3.Connection, patent_id_str: str, record: Dict[str, Any]) -> None:
-        data_sub = record.get("data", {})
-        npc_list = data_sub.get("non_patent_citations", [])
-        sql = """
-        INSERT INTO non_patent_citations (
-            patent_id, citation_title, examiner_cited
-        ) VALUES (?, ?, ?)
-        """
-        for c in npc_list:
-            ttl = c.get("title")
-            exam_cited = 1 if c.get("examiner_cited") else 0
-            conn.execute(sql, (patent_id_str, ttl, exam_cited))
+    __slots__ = ()
+
+    _INSERT_SQL = _INSERT_NON_PATENT_CITATIONS_SQL
+    _MULTI_VALUES = True
+    _INDEXES = ("CREATE INDEX IF NOT EXISTS idx_non_patent_citations_patent_id ON non_patent_citations (patent_id)",)
+
+    _CREATE_SQL = """
+    CREATE TABLE IF NOT EXISTS non_patent_citations (
+        id INTEGER PRIMARY KEY,
+        patent_id TEXT NOT NULL,
+        citation_title TEXT,
+        examiner_cited INTEGER,
+        FOREIGN KEY (patent_id) REFERENCES patents (patent_id) ON DELETE CASCADE
+    );
+    """
+
+    def build_rows(self, patent_id_str: str, data_sub: Dict[str, Any]) -> List[tuple]:
+        npc_list = data_sub.get("non_patent_citations")
+        if not npc_list:
+            return []
+        return [
+            (patent_id_str, c.get("title"), bool(c.get("examiner_cited")))
+            for c in npc_list
+        ]
+
+    def insert(self, conn: sqlite3.Connection, patent_id_str: str, data_sub: Dict[str, Any]) -> None:
+        rows = self.build_rows(patent_id_str, data_sub)
+        if rows:
+            self.insert_values_expanded(conn, rows)
 
 
 class SimilarDocumentsDAO(AbstractTableDAO):
     """
     Similar documents or references found by the search engine (not strictly citations).
     """
-    def create_table(self, conn: sqlite3.Connection) -> None:
-        conn.execute("""
-        CREATE TABLE IF NOT EXISTS similar_documents (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            patent_id TEXT NOT NULL,
-            is_patent INTEGER,
-            doc_patent_id TEXT,
-            serpapi_link TEXT,
-            publication_number TEXT,
-            primary_language TEXT,
-            publication_date DATETIME,
-            title TEXT,
-            FOREIGN KEY (patent_id) REFERENCES patents (patent_id) ON DELETE CASCADE
-        );
-        """)
-
-    def insert(self, conn: sqlite3.Connection, patent_id_str: str, record: Dict[str, Any]) -> None:
-        data_sub = record.get("data", {})
-        sd_list = data_sub.get("similar_documents", [])
-        sql = """
-        INSERT INTO similar_documents (
-            patent_id, is_patent, doc_patent_id, serpapi_link,
-            publication_number, primary_language, publication_date, title
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """
-        for sd in sd_list:
-            is_pt = 1 if sd.get("is_patent") else 0
-            doc_pid = sd.get("patent_id")
-            link = sd.get("serpapi_link")
-            pub_no = sd.get("publication_number")
-            plang = sd.get("primary_language")
-            pub_date = _parse_date_to_utc(sd.get("publication_date"))
-            ttl = sd.get("title")
-            conn.execute(sql, (
-                patent_id_str, is_pt, doc_pid, link, pub_no, plang, pub_date, ttl
-            ))
+    __slots__ = ()
+
+    _INSERT_SQL = _INSERT_SIMILAR_DOCUMENTS_SQL
+    _MULTI_VALUES = True
+    _INDEXES = ("CREATE INDEX IF NOT EXISTS idx_similar_documents_patent_id ON similar_documents (patent_id)",)
+
+    _CREATE_SQL = """
+    CREATE TABLE IF NOT EXISTS similar_documents (
+        id INTEGER PRIMARY KEY,
+        patent_id TEXT NOT NULL,
+        is_patent INTEGER,
+        doc_patent_id TEXT,
+        serpapi_link TEXT,
+        publication_number TEXT,
+        primary_language TEXT,
+        publication_date DATETIME,
+        title TEXT,
+        FOREIGN KEY (patent_id) REFERENCES patents (patent_id) ON DELETE CASCADE
+    );
+    """
+
+    def build_rows(self, patent_id_str: str, data_sub: Dict[str, Any]) -> List[tuple]:
+        sd_list = data_sub.get("similar_documents")
+        if not sd_list:
+            return []
+        return [
+            (
+                patent_id_str,
+                bool(sd.get("is_patent")),
+                sd.get("patent_id"),
+                sd.get("serpapi_link"),
+                sd.get("publication_number"),
+                sd.get("primary_language"),
+                _parse_date_to_utc(sd.get("publication_date")),
+                sd.get("title")
+            )
+            for sd in sd_list
+        ]
+
+    def insert(self, conn: sqlite3.Connection, patent_id_str: str, data_sub: Dict[str, Any]) -> None:
+        rows = self.build_rows(patent_id_str, data_sub)
+        if rows:
+            self.insert_values_expanded(conn, rows)
 
 
 class ErrorLogsDAO(AbstractTableDAO):
     """
     Stores error messages and stack traces for troubleshooting database operations.
     """
-    def create_table(self, conn: sqlite3.Connection) -> None:
-        conn.execute("""
-        CREATE TABLE IF NOT EXISTS error_logs (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            error_message TEXT,
-            stack_trace TEXT,
-            created_at DATETIME
-        );
-        """)
+    __slots__ = ()
+
+    _INSERT_SQL = _INSERT_ERROR_LOGS_SQL
+
+    _CREATE_SQL = """
+    CREATE TABLE IF NOT EXISTS error_logs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        error_message TEXT,
+        stack_trace TEXT,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    );
+    """
 
     def insert(self, conn: sqlite3.Connection, error_message: str, stack: str) -> None:
         """
         Logs an error message and stack trace with a UTC timestamp.
+
+        The timestamp is SQLite's CURRENT_TIMESTAMP ('YYYY-MM-DD HH:MM:SS',
+        UTC), the same format the Python-side strftime produced.
         """
-        now_str = datetime.datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
-        sql = """
-        INSERT INTO error_logs (error_message, stack_trace, created_at)
-        VALUES (?, ?, ?)
-        """
-        conn.execute(sql, (error_message, stack, now_str))
\ No newline at end of file
+        conn.execute(self._INSERT_SQL, (error_message, stack))
+
+
+# Child-table DAOs in ingest order, used by insert_full_record when the caller
+# does not supply its own instances. DAOs are stateless, so sharing is safe.
+DEFAULT_CHILD_DAOS = (
+    InventorsDAO(),
+    AssigneesDAO(),
+    PriorArtKeywordsDAO(),
+    EventsDAO(),
+    ExternalLinksDAO(),
+    ImagesDAO(),
+    ClassificationsDAO(),
+    ClaimsDAO(),
+    ApplicationsClaimingPriorityDAO(),
+    WorldwideApplicationsDAO(),
+    PatentCitationsDAO(),
+    CitedByDAO(),
+    LegalEventsDAO(),
+    ConceptsDAO(),
+    ChildApplicationsDAO(),
+    ParentApplicationsDAO(),
+    PriorityApplicationsDAO(),
+    NonPatentCitationsDAO(),
+    SimilarDocumentsDAO(),
+)
+
+
+@lru_cache(maxsize=8)
+def compile_child_writer(child_daos: Tuple[AbstractTableDAO, ...]) -> Callable[..., None]:
+    """
+    Generate one `write_children(conn, patent_id_str, data_sub)` function for
+    a fixed sequence of child DAOs.
+
+    The generated body is straight-line code: for each DAO, in order, call its
+    `build_rows` and, if any rows came back, `executemany` its `_INSERT_SQL`
+    (or `insert_values_expanded` for DAOs with `_MULTI_VALUES`).
+    Both are bound into the function's globals as constants, so a record costs
+    one Python frame plus the build_rows calls, with no loop and no per-DAO
+    attribute lookups. Memoized on the DAO tuple (DAOs hash by identity).
+
+    Parameters
+    ----------
+    child_daos : Tuple[AbstractTableDAO, ...]
+        Child DAOs providing `build_rows` and `_INSERT_SQL`.
+
+    Returns
+    -------
+    Callable
+        The generated writer.
+    """
+    namespace: Dict[str, Any] = {}
+    lines = ["def write_children(conn, patent_id_str, data_sub):"]
+    for i, dao in enumerate(child_daos):
+        namespace[f"_build_{i}"] = dao.build_rows
+        if dao._MULTI_VALUES:
+            namespace[f"_write_{i}"] = dao.insert_values_expanded
+            write = f"        _write_{i}(conn, rows)"
+        else:
+            namespace[f"_sql_{i}"] = dao._INSERT_SQL
+            write = f"        conn.executemany(_sql_{i}, rows)"
+        lines += [
+            f"    rows = _build_{i}(patent_id_str, data_sub)",
+            "    if rows:",
+            write,
+        ]
+    if not child_daos:
+        lines.append("    pass")
+    exec(compile("\n".join(lines), "<daos.write_children>", "exec"), namespace)
+    return namespace["write_children"]
+
+
+def insert_full_record(
+    conn: sqlite3.Connection,
+    record: Dict[str, Any],
+    patents_dao: Optional[PatentsDAO] = None,
+    child_daos: Optional[Sequence[AbstractTableDAO]] = None
+) -> str:
+    """
+    Insert one SerpAPI record into 'patents' and every child table as a single transaction.
+
+    Parameters
+    ----------
+    conn : sqlite3.Connection
+        Active DB connection.
+    record : dict
+        A dictionary with keys 'patent_id' and 'data'.
+    patents_dao : PatentsDAO, optional
+        DAO for the parent row; a new PatentsDAO if omitted.
+    child_daos : Sequence[AbstractTableDAO], optional
+        Child DAOs providing `build_rows` and `_INSERT_SQL`; DEFAULT_CHILD_DAOS
+        if omitted.
+
+    Returns
+    -------
+    str
+        The 'patent_id' that was inserted or attempted to insert.
+
+    Production Note:
+    ---------------
+    - One BEGIN/COMMIT for the whole record means one journal sync instead of
+      one per table, and a failure in any child table rolls back the parent
+      row too, so a record is never half-ingested.
+    - If `conn` is already inside a transaction, the writes join it and the
+      outer owner decides when to commit.
+    - Each child table is one `build_rows` pass over its section of the
+      record's data followed by at most one `executemany`, the same table
+      walk insert_records does for a whole batch. The walk runs as one
+      generated function (compile_child_writer), compiled once per DAO tuple.
+    """
+    patents_dao = patents_dao or PatentsDAO()
+    write_children = compile_child_writer(
+        DEFAULT_CHILD_DAOS if child_daos is None else tuple(child_daos)
+    )
+    data_sub = patents_dao.split_record(record)[1]
+    with transaction(conn):
+        patent_id_str = patents_dao.insert(conn, record)
+        write_children(conn, patent_id_str, data_sub)
+    return patent_id_str
+
+
+def insert_records(
+    conn: sqlite3.Connection,
+    records: Sequence[Dict[str, Any]],
+    patents_dao: Optional[PatentsDAO] = None,
+    child_daos: Optional[Sequence[AbstractTableDAO]] = None
+) -> List[str]:
+    """
+    Insert many SerpAPI records with one `executemany` per table, in one transaction.
+
+    Instead of walking each record through every DAO (records x tables
+    statement batches), the rows of each table are first flattened across all
+    records, then written with a single `executemany` per table.
+
+    Parameters
+    ----------
+    conn : sqlite3.Connection
+        Active DB connection.
+    records : Sequence[dict]
+        Records with keys 'patent_id' and 'data'.
+    patents_dao : PatentsDAO, optional
+        DAO for the parent rows; a new PatentsDAO if omitted.
+    child_daos : Sequence[AbstractTableDAO], optional
+        Child DAOs providing `build_rows` and `_INSERT_SQL`; DEFAULT_CHILD_DAOS if omitted.
+
+    Returns
+    -------
+    List[str]
+        The 'patent_id' of each record, in input order.
+
+    Production Note:
+    ---------------
+    - A failure anywhere rolls back the whole batch; callers that need
+      per-record error isolation should fall back to insert_full_record.
+    - Rows land in each table in the same order as record-by-record ingestion.
+    """
+    patents_dao = patents_dao or PatentsDAO()
+    child_daos = DEFAULT_CHILD_DAOS if child_daos is None else child_daos
+    patent_rows = [patents_dao.build_row(r) for r in records]
+    patent_ids = [row[0] for row in patent_rows]
+    data_subs = [patents_dao.split_record(r)[1] for r in records]
+    with transaction(conn):
+        conn.executemany(patents_dao._INSERT_SQL, patent_rows)
+        for dao in child_daos:
+            rows = [
+                row
+                for patent_id_str, data_sub in zip(patent_ids, data_subs)
+                for row in dao.build_rows(patent_id_str, data_sub)
+            ]
+            if not rows:
+                continue
+            if dao._MULTI_VALUES:
+                dao.insert_values_expanded(conn, rows)
+            else:
+                conn.executemany(dao._INSERT_SQL, rows)
+    return patent_ids
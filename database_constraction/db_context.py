@@ -10,8 +10,11 @@ Why This Matters:
 -----------------
 - Automatically handles creation of the database folder (if it doesn't exist).
 - Ensures foreign key support is enabled for SQLite.
+- Applies the performance PRAGMAs (WAL, synchronous=NORMAL, in-memory temp
+  store, larger page cache, mmap, busy timeout) via configure_connection.
 - Commits changes upon normal completion or rolls back on exceptions.
-- Closes the connection in a finally block, preventing resource leaks.
+- Returns the connection to a small pool (or closes it) in a finally block,
+  preventing resource leaks.
 
 Usage:
 ------
@@ -29,37 +32,94 @@ Production-Level Notes:
   separate transaction blocks or more granular commit control.
 - For large-scale usage, be mindful of connection overhead. 
   Typically, a single connection can be used across multiple operations.
+- db_connection pools idle connections per database file, so repeated
+  blocks reuse an open, configured connection; close_pool() closes them.
+- Connections keep up to `_CACHED_STATEMENTS` prepared statements (see
+  abstract_dao), enough for every distinct INSERT the DAOs issue.
 - Make sure foreign_keys=ON is required for correct relational integrity 
   (otherwise, SQLite won't enforce foreign keys).
+- One-shot bulk loads can pass extra per-connection PRAGMAs, e.g.
+  `db_connection(path, pragmas={"synchronous": "OFF"})`. They last only as
+  long as the connection, so nothing needs restoring afterwards.
 
 """
 
 import os
+import queue
 import sqlite3
 from contextlib import contextmanager
-from typing import Generator
+from typing import Any, Dict, Generator, Optional, Tuple
+
+from .abstract_dao import _CACHED_STATEMENTS, configure_connection
+
+# Idle connections kept per database file for reuse by db_connection.
+_POOL_SIZE = 4
+
+# (process id, db_path) -> idle connections. Keyed by pid so a forked worker
+# never picks up a connection its parent opened.
+_POOL: Dict[Tuple[int, str], "queue.LifoQueue[sqlite3.Connection]"] = {}
+
+
+def _open_connection(db_path: str) -> sqlite3.Connection:
+    """
+    Open and configure a new connection: performance PRAGMAs, foreign keys,
+    sqlite3.Row rows. check_same_thread=False because a pooled connection may
+    be checked out by a different thread next time (one holder at a time).
+    """
+    # The enlarged statement cache keeps every DAO's INSERT prepared across
+    # the whole ingest
+    conn = sqlite3.connect(db_path, cached_statements=_CACHED_STATEMENTS, check_same_thread=False)
+    configure_connection(conn)
+    conn.execute("PRAGMA foreign_keys = ON;")
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def close_pool() -> None:
+    """
+    Close every idle pooled connection (call once at shutdown).
+    """
+    for idle in _POOL.values():
+        while True:
+            try:
+                idle.get_nowait().close()
+            except queue.Empty:
+                break
+    _POOL.clear()
 
 
 @contextmanager
-def db_connection(db_path: str) -> Generator[sqlite3.Connection, None, None]:
+def db_connection(
+    db_path: str,
+    pragmas: Optional[Dict[str, Any]] = None
+) -> Generator[sqlite3.Connection, None, None]:
     """
     A context manager for managing an SQLite database connection lifecycle.
 
     Steps Performed:
     ---------------
     1) Ensures the directory for `db_path` exists, creating it if necessary.
-    2) Opens a connection to the specified SQLite database file.
-    3) Enables foreign key constraints via PRAGMA foreign_keys=ON.
-    4) Uses sqlite3.Row for row_factory to enable dictionary-like access to columns.
-    5) Yields the connection object for use within the `with` block.
-    6) Commits all changes if the block exits without exception; 
+    2) Takes an idle connection for `db_path` from the pool, or opens a new
+       one: performance PRAGMAs (configure_connection), foreign key
+       constraints via PRAGMA foreign_keys=ON, and sqlite3.Row for row_factory
+       to enable dictionary-like access to columns.
+    3) Applies any extra `pragmas`.
+    4) Yields the connection object for use within the `with` block.
+    5) Commits all changes if the block exits without exception; 
        otherwise rolls them back and re-raises the exception.
-    7) Closes the connection in a finally block.
+    6) Returns the connection to the pool (up to _POOL_SIZE idle connections
+       per database), or closes it if the pool is full or `pragmas` changed
+       its settings.
 
     Parameters
     ----------
     db_path : str
         The filepath to the SQLite database. Parent directories are created if absent.
+    pragmas : dict, optional
+        Extra PRAGMA name -> value pairs applied after the defaults, e.g.
+        {"synchronous": "OFF"} for a one-shot ingest. Names and values are
+        interpolated into the PRAGMA statement, so pass trusted literals only.
+        Such a connection is closed afterwards rather than pooled.
 
     Yields
     ------
@@ -70,28 +130,48 @@ def db_connection(db_path: str) -> Generator[sqlite3.Connection, None, None]:
     ------
     Exception
         Any exception raised inside the `with` block triggers a rollback.
+
+    Production Note:
+    ---------------
+    - Reusing connections skips the connect, PRAGMA setup and close on every
+      block, and keeps each connection's prepared statements warm.
+    - Call close_pool() at shutdown to close the idle connections.
     """
     # 1) Ensure the directory exists
     os.makedirs(os.path.dirname(db_path), exist_ok=True)
 
-    # 2) Open the connection
-    conn = sqlite3.connect(db_path)
+    # 2) Reuse an idle connection or open a new one
+    idle = _POOL.setdefault((os.getpid(), db_path), queue.LifoQueue(maxsize=_POOL_SIZE))
+    try:
+        conn = idle.get_nowait()
+    except queue.Empty:
+        conn = _open_connection(db_path)
 
-    # 3) Enable foreign keys
-    conn.execute("PRAGMA foreign_keys = ON;")
-
-    # 4) Use Row factory for more convenient row access
-    conn.row_factory = sqlite3.Row
+    # 3) Caller overrides
+    for name, value in (pragmas or {}).items():
+        conn.execute(f"PRAGMA {name} = {value}")
 
+    reusable = not pragmas
     try:
-        # 5) Yield the connection for usage
+        # 4) Yield the connection for usage
         yield conn
-        # 6) Commit changes if no exception
+        # 5) Commit changes if no exception
         conn.commit()
     except Exception:
         # Rollback on exception
         conn.rollback()
         raise
+    except BaseException:
+        # e.g. KeyboardInterrupt: don't hand a connection in an unknown state back
+        reusable = False
+        raise
     finally:
-        # 7) Close connection
-        conn.close()
\ No newline at end of file
+        # 6) Back to the pool, or close
+        if reusable and not conn.in_transaction:
+            try:
+                idle.put_nowait(conn)
+                conn = None
+            except queue.Full:
+                pass
+        if conn is not None:
+            conn.close()
@@ -39,7 +39,7 @@ import logging.config
 from pathlib import Path
 
 from .patent_service import PatentService
-from .db_context import db_connection
+from .db_context import close_pool, db_connection
 
 
 def setup_logging():
@@ -113,7 +113,10 @@ def main():
     service.setup_database()
 
     # 5) Read and insert JSONL data
-    service.parse_and_insert_from_jsonl(str(jsonl_path))
+    try:
+        service.parse_and_insert_from_jsonl(str(jsonl_path))
+    finally:
+        service.close()
 
     # 6) Simple verification: log first 5 rows from 'patents' table
     with db_connection(str(db_path)) as conn:
@@ -123,6 +126,9 @@ def main():
         for row in rows:
             logging.info(f"  -> patent_id={row['patent_id']} | title={row['title']} | priority_date={row['priority_date']}")
 
+    # 7) Close the pooled connections
+    close_pool()
+
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -22,14 +22,20 @@ Why This Matters (Production-Level Notes):
 
 import os
 import json
+import shutil
+import sqlite3
+import tempfile
 import traceback
 import logging
-from typing import Dict, Any, Generator, Tuple, Optional
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager, nullcontext
+from typing import Dict, Any, Generator, List, Tuple, Optional
 from dataclasses import dataclass, field
 
 from pathlib import Path  # for path handling
 
 from .db_context import db_connection
+from .abstract_dao import ensure_schema, transaction
 from .daos import (
     PatentsDAO,
     InventorsDAO,
@@ -51,16 +57,50 @@ from .daos import (
     PriorityApplicationsDAO,
     NonPatentCitationsDAO,
     SimilarDocumentsDAO,
-    ErrorLogsDAO
+    ErrorLogsDAO,
+    insert_full_record,
+    insert_records,
+    _parse_date_to_utc
 )
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is optional
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
-def read_jsonl_records(file_path: Path) -> Generator[Tuple[int, Optional[Dict[str, Any]]], None, None]:
+# Read buffer for JSONL input: 1 MiB reads instead of the 8 KiB default, so
+# multi-GB exports are consumed in far fewer read() system calls.
+_READ_BUFFER_SIZE = 1 << 20
+
+# Bytes read_jsonl_records reads and splits into lines at a time.
+_READ_CHUNK_SIZE = 8 << 20
+
+def read_jsonl_records(
+    file_path: Path,
+    start: int = 0,
+    first_line: int = 1,
+    num_lines: Optional[int] = None
+) -> Generator[Tuple[int, Optional[Dict[str, Any]]], None, None]:
     """
     Generator that yields (line_num, record_dict) for each line in the JSONL file.
     If a line is empty or fails JSON parse, yields (line_num, None).
 
+    Parameters
+    ----------
+    file_path : Path
+        The JSONL file.
+    start : int
+        Byte offset to start reading at; must be the start of a line.
+    first_line : int
+        Line number of the line at `start` (for messages and error_logs).
+    num_lines : int, optional
+        Read at most this many lines; None reads to the end of the file.
+        Together with `start`, selects one shard from split_jsonl.
+
     Production Considerations:
     --------------------------
     - If the file is extremely large, line-by-line streaming helps memory usage.
@@ -68,16 +108,104 @@ def read_jsonl_records(file_path: Path) -> Generator[Tuple[int, Optional[Dict[st
       line_num for reprocessing later.
     - Ensure your JSON lines are valid. If there's a risk of multi-line JSON, 
       consider a robust parser or check for potential line breaks in your data.
+    - Lines are read as bytes and handed straight to orjson (when installed),
+      which parses UTF-8 bytes directly: no text-mode decode and no strip,
+      since the parser ignores surrounding whitespace. Without orjson the
+      stdlib json module parses the same bytes.
+    - The file is read in 8 MiB chunks (_READ_CHUNK_SIZE), each split into
+      lines with one bytes.split call, instead of one readline per line; a
+      partial last line is carried over to the next chunk. The generator
+      interface is unchanged.
+    """
+    line_num = first_line - 1
+    remaining = num_lines
+    tail = b""
+    with file_path.open("rb", buffering=0) as f:
+        f.seek(start)
+        while remaining is None or remaining > 0:
+            chunk = f.read(_READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            lines = (tail + chunk).split(b"\n")
+            tail = lines.pop()
+            if remaining is not None:
+                lines = lines[:remaining]
+                remaining -= len(lines)
+            for line in lines:
+                line_num += 1
+                if not line or line.isspace():
+                    continue
+                try:
+                    yield line_num, _json_loads(line)
+                except ValueError:  # JSONDecodeError (both parsers) or invalid UTF-8
+                    yield line_num, None
+    # Last line of the file (or range) without a trailing newline
+    if tail and not tail.isspace() and (remaining is None or remaining > 0):
+        line_num += 1
+        try:
+            yield line_num, _json_loads(tail)
+        except ValueError:
+            yield line_num, None
+
+
+def split_jsonl(file_path: Path, parts: int) -> List[Tuple[int, int, Optional[int]]]:
+    """
+    Split a JSONL file into at most `parts` line-aligned shards of similar byte size.
+
+    Returns
+    -------
+    List[Tuple[int, int, Optional[int]]]
+        One (start, first_line, num_lines) triple per non-empty shard, ready to
+        pass to read_jsonl_records; the last shard has num_lines=None (to EOF).
+
+    Production Note:
+    ---------------
+    - Boundaries are found by seeking, but the line numbers require counting
+      the newlines before each boundary, i.e. one buffered read of the file
+      (bytes.count, so far cheaper than parsing it).
     """
-    with file_path.open("r", encoding="utf-8") as f:
-        for line_num, line in enumerate(f, start=1):
-            line = line.strip()
-            if not line:
+    size = file_path.stat().st_size
+    bounds = [0]
+    with file_path.open("rb", buffering=_READ_BUFFER_SIZE) as f:
+        for k in range(1, parts):
+            target = size * k // parts
+            if target <= bounds[-1]:
                 continue
-            try:
-                yield line_num, json.loads(line)
-            except json.JSONDecodeError:
-                yield line_num, None
+            # Move to the first line starting at or after `target`.
+            f.seek(target - 1)
+            f.readline()
+            if bounds[-1] < f.tell() < size:
+                bounds.append(f.tell())
+
+        shards = []
+        f.seek(0)
+        first_line = 1
+        for start, end in zip(bounds, bounds[1:]):
+            remaining, newlines = end - start, 0
+            while remaining:
+                chunk = f.read(min(remaining, _READ_BUFFER_SIZE))
+                newlines += chunk.count(b"\n")
+                remaining -= len(chunk)
+            shards.append((start, first_line, newlines))
+            first_line += newlines
+        shards.append((bounds[-1], first_line, None))
+    return shards
+
+
+def _ingest_shard(db_path: str, jsonl_path: str, start: int, first_line: int,
+                  num_lines: Optional[int], batch_size: int) -> str:
+    """
+    Worker-process entry point for parse_and_insert_parallel: ingest one
+    shard of `jsonl_path` into its own database `db_path` and return it.
+    """
+    service = PatentService(db_path, batch_size=batch_size)
+    service.setup_database()
+    try:
+        service._ingest_jsonl(Path(jsonl_path), start, first_line, num_lines)
+    finally:
+        service.close()
+    return db_path
+
 
 @dataclass
 class PatentService:
@@ -92,6 +220,8 @@ class PatentService:
        - Insert the main 'patent' record
        - Insert all child records (inventors, events, citations, etc.)
        - Log or store errors if insertion fails
+    4) Optionally parsing in worker processes (parse_and_insert_parallel),
+       each writing a shard database that is then merged (merge_shards).
 
     Production-Level Notes:
     -----------------------
@@ -100,6 +230,7 @@ class PatentService:
     - For high-volume insertion, consider bulk inserts or disabling some constraints 
       then re-enabling them after insertion for performance. 
     - If JSON schema evolves, ensure the DAOs handle missing/extra fields gracefully.
+    - Error rows go through one long-lived connection; call close() when done.
     """
 
     db_path: str
@@ -127,8 +258,17 @@ class PatentService:
     similar_docs_dao: SimilarDocumentsDAO = field(default_factory=SimilarDocumentsDAO)
     error_logs_dao: ErrorLogsDAO = field(default_factory=ErrorLogsDAO)
 
+    # Records written per transaction by parse_and_insert_from_jsonl
+    batch_size: int = 1000
+
+    # Long-lived autocommit connection for error_logs rows, opened on first use
+    _err_conn: Optional[sqlite3.Connection] = field(init=False, default=None, repr=False)
+
     # Collect all DAOs here for one-pass table creation
     all_daos: list = field(init=False)
+    # Child-table DAOs (everything except patents and error_logs), in insert order.
+    # A tuple, so it can key insert_full_record's cache of compiled writers.
+    child_daos: tuple = field(init=False)
 
     def __post_init__(self):
         """
@@ -158,6 +298,7 @@ class PatentService:
             self.similar_docs_dao,
             self.error_logs_dao
         ]
+        self.child_daos = tuple(self.all_daos[1:-1])
         logger.debug("PatentService initialized with all DAOs: %d daos total.", len(self.all_daos))
 
     def __repr__(self) -> str:
@@ -170,7 +311,9 @@ class PatentService:
     def setup_database(self) -> None:
         """
         Create all tables in a single transaction. If tables already exist, 
-        'CREATE TABLE IF NOT EXISTS' ensures no error is raised.
+        'CREATE TABLE IF NOT EXISTS' ensures no error is raised. When every
+        DAO carries a schema hash, ensure_schema skips the DDL entirely if
+        PRAGMA user_version already records this schema.
 
         Production-Level Considerations:
         --------------------------------
@@ -178,14 +321,138 @@ class PatentService:
           or a versioned schema upgrade process.
         - Ensure foreign key constraints are turned ON at connection-level
           (db_context does this).
+        - db_connection applies configure_connection before any DDL, so a new
+          database file is created with the 64 KiB page size and switched to
+          WAL; both settings persist in the file for later connections.
         """
         logger.info("Starting database setup for all tables.")
         with db_connection(self.db_path) as conn:
-            for dao in self.all_daos:
-                dao.create_table(conn)
+            ensure_schema(conn, self.all_daos)
         logger.info("All tables created or ensured to exist successfully.")
 
-    def parse_and_insert_from_jsonl(self, jsonl_path: str) -> None:
+    def ingest_records(self, conn, records: List[Dict[str, Any]]) -> List[str]:
+        """
+        Insert a batch of SerpAPI records with this service's DAOs: one
+        transaction, one `executemany` per table (see daos.insert_records).
+
+        Parameters
+        ----------
+        conn : sqlite3.Connection
+            Active DB connection.
+        records : List[dict]
+            Records with keys 'patent_id' and 'data'.
+
+        Returns
+        -------
+        List[str]
+            The 'patent_id' of each record, in input order.
+        """
+        return insert_records(conn, records, self.patents_dao, self.child_daos)
+
+    def _log_error(self, err_msg: str, stack: str) -> None:
+        """
+        Write one row to error_logs on the service's dedicated error-log
+        connection.
+
+        The connection is opened once (ErrorLogsDAO.connect: autocommit, WAL,
+        busy timeout) and reused, so a malformed export with many bad lines
+        does not pay a connect/PRAGMA/close per error. Being separate from the
+        data connection, each row commits immediately and survives a rollback
+        of the data transaction.
+        """
+        if self._err_conn is None:
+            self._err_conn = self.error_logs_dao.connect(self.db_path)
+        self.error_logs_dao.insert(self._err_conn, err_msg, stack)
+
+    def close(self) -> None:
+        """
+        Close the error-log connection, if one was opened. The service can
+        still be used afterwards; the connection is reopened on demand.
+        """
+        if self._err_conn is not None:
+            self._err_conn.close()
+            self._err_conn = None
+
+    def _flush_batch(self, conn, batch: List[Tuple[int, Dict[str, Any]]]) -> None:
+        """
+        Write a batch of (line_num, record) pairs via ingest_records on `conn`.
+
+        If the batch fails as a whole, its transaction is rolled back and the
+        records are retried one by one inside a single transaction, each under
+        its own SAVEPOINT. A bad record is rolled back to its savepoint and
+        logged to error_logs with its line number; the rest of the batch is
+        still committed.
+        """
+        if not batch:
+            return
+        try:
+            self.ingest_records(conn, [record for _, record in batch])
+            return
+        except Exception:
+            logger.warning("Batch of %d records failed; retrying record by record.", len(batch))
+
+        failures: List[Tuple[str, str]] = []
+        with transaction(conn):
+            for line_num, record in batch:
+                conn.execute("SAVEPOINT rec")
+                try:
+                    # Insert main patent record and sub-entities; joins the batch transaction
+                    insert_full_record(conn, record, self.patents_dao, self.child_daos)
+                except Exception as e:
+                    conn.execute("ROLLBACK TO rec")
+                    logger.exception(f"Error inserting record at line {line_num}")
+                    failures.append((f"[Line {line_num}] {str(e)}", traceback.format_exc()))
+                conn.execute("RELEASE rec")
+
+        # Only one connection can write at a time, so error rows are written
+        # after the batch transaction has committed.
+        for err_msg, stack in failures:
+            self._log_error(err_msg, stack)
+
+    @contextmanager
+    def bulk_load_context(self, conn: sqlite3.Connection) -> Generator[sqlite3.Connection, None, None]:
+        """
+        Put `conn` into bulk-load mode for the duration of the block.
+
+        On entry, foreign-key enforcement and fsyncs are switched off
+        (PRAGMA foreign_keys=OFF, synchronous=OFF) and every child table's
+        secondary indexes (`_INDEXES`) are dropped. On exit the indexes are
+        rebuilt once, in bulk, the PRAGMAs are restored, and
+        PRAGMA foreign_key_check verifies the rows written meanwhile.
+
+        Parameters
+        ----------
+        conn : sqlite3.Connection
+            Connection with no open transaction (foreign_keys cannot change
+            inside one).
+
+        Production Note:
+        ---------------
+        - synchronous=OFF trades durability for speed: an OS crash or power
+          loss mid-load can corrupt the database, so use it for loads that can
+          be rerun from the JSONL source.
+        - journal_mode stays WAL; switching it is persistent and would affect
+          other connections.
+        - Foreign-key violations are logged as warnings, not raised, because
+          the rows are already committed.
+        """
+        conn.execute("PRAGMA foreign_keys = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        for dao in self.child_daos:
+            dao.drop_indexes(conn)
+        try:
+            yield conn
+        finally:
+            for dao in self.child_daos:
+                dao.create_indexes(conn)
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.execute("PRAGMA foreign_keys = ON")
+            violations = conn.execute("PRAGMA foreign_key_check").fetchall()
+            if violations:
+                logger.warning("Bulk load left %d foreign-key violations, e.g. %s",
+                               len(violations), tuple(violations[0]))
+
+    def parse_and_insert_from_jsonl(self, jsonl_path: str, bulk_load: bool = False) -> None:
         """
         Reads a JSONL file line by line, inserting each record's data 
         across the relevant DAO tables.
@@ -195,14 +462,21 @@ class PatentService:
         1) read_jsonl_records -> yield line_num and record (dict or None)
         2) If record is None, log decode error
         3) Otherwise:
-           - Insert into 'patents' (main)
-           - Insert into child tables (inventors, citations, etc.)
-           - On error, log to error_logs and the main logger
+           - Collect up to `batch_size` records
+           - Write the batch with ingest_records ('patents' plus every child
+             table, one executemany per table, one transaction)
+           - If the batch fails, retry its records one by one (one SAVEPOINT
+             each); on error, log to error_logs and the main logger
 
         Parameters
         ----------
         jsonl_path : str
             Path to the JSONL file containing records from SerpAPI.
+        bulk_load : bool
+            Run the load inside bulk_load_context (indexes dropped and rebuilt
+            once, no FK checks or fsyncs during the load). Worth it for large
+            backfills; for small incremental files rebuilding the indexes of
+            an already large database costs more than it saves.
 
         Production Warnings:
         --------------------
@@ -211,6 +485,12 @@ class PatentService:
           you may need to detect conflicts or handle updates differently.
         - If line-based errors occur frequently, consider a more robust logging strategy
           with partial re-ingestion logic.
+        - Batching amortizes statement preparation and the commit's journal sync
+          over `batch_size` records; set batch_size=1 for strictly
+          record-at-a-time ingestion.
+        - The whole file is ingested over one connection, opened once; each
+          batch is its own committed transaction, so the connection is idle
+          between batches and error_logs can be written from a second one.
         """
         jsonl_path_obj = Path(jsonl_path)
         if not jsonl_path_obj.is_file():
@@ -218,47 +498,110 @@ class PatentService:
             return
 
         logger.info(f"Starting to parse JSONL file: {jsonl_path}")
-        for line_num, record in read_jsonl_records(jsonl_path_obj):
-            if record is None:
-                # JSON decode error
-                logger.error(f"JSON decode error at line {line_num}")
-                with db_connection(self.db_path) as conn:
-                    stack = traceback.format_exc()
-                    self.error_logs_dao.insert(conn, f"JSON decode error at line {line_num}", stack)
-                continue
+        self._ingest_jsonl(jsonl_path_obj, bulk_load=bulk_load)
+        logger.info("Finished parsing and inserting data from JSONL.")
 
-            try:
-                with db_connection(self.db_path) as conn:
-                    # Insert main patent record
-                    patent_id_str = self.patents_dao.insert(conn, record)
-
-                    # Insert sub-entities
-                    self.inventors_dao.insert(conn, patent_id_str, record)
-                    self.assignees_dao.insert(conn, patent_id_str, record)
-                    self.prior_art_keywords_dao.insert(conn, patent_id_str, record)
-                    self.events_dao.insert(conn, patent_id_str, record)
-                    self.external_links_dao.insert(conn, patent_id_str, record)
-                    self.images_dao.insert(conn, patent_id_str, record)
-                    self.classifications_dao.insert(conn, patent_id_str, record)
-                    self.claims_dao.insert(conn, patent_id_str, record)
-                    self.acp_dao.insert(conn, patent_id_str, record)
-                    self.wwa_dao.insert(conn, patent_id_str, record)
-                    self.patent_citations_dao.insert(conn, patent_id_str, record)
-                    self.cited_by_dao.insert(conn, patent_id_str, record)
-                    self.legal_events_dao.insert(conn, patent_id_str, record)
-                    self.concepts_dao.insert(conn, patent_id_str, record)
-                    self.child_apps_dao.insert(conn, patent_id_str, record)
-                    self.parent_apps_dao.insert(conn, patent_id_str, record)
-                    self.priority_apps_dao.insert(conn, patent_id_str, record)
-                    self.npc_dao.insert(conn, patent_id_str, record)
-                    self.similar_docs_dao.insert(conn, patent_id_str, record)
-
-            except Exception as e:
-                # Log the exception to both standard logger and DB error_logs
-                logger.exception(f"Error inserting record at line {line_num}")
-                stack = traceback.format_exc()
-                with db_connection(self.db_path) as conn:
-                    err_msg = f"[Line {line_num}] {str(e)}"
-                    self.error_logs_dao.insert(conn, err_msg, stack)
-
-        logger.info("Finished parsing and inserting data from JSONL.")
\ No newline at end of file
+    def _ingest_jsonl(
+        self,
+        jsonl_path: Path,
+        start: int = 0,
+        first_line: int = 1,
+        num_lines: Optional[int] = None,
+        bulk_load: bool = False
+    ) -> None:
+        """
+        Ingest the given line range of a JSONL file over one connection; the
+        loop behind parse_and_insert_from_jsonl and each parallel shard.
+        """
+        batch: List[Tuple[int, Dict[str, Any]]] = []
+        with db_connection(self.db_path) as conn, \
+                (self.bulk_load_context(conn) if bulk_load else nullcontext()):
+            for line_num, record in read_jsonl_records(jsonl_path, start, first_line, num_lines):
+                if record is None:
+                    # JSON decode error
+                    logger.error(f"JSON decode error at line {line_num}")
+                    self._log_error(f"JSON decode error at line {line_num}", traceback.format_exc())
+                    continue
+
+                batch.append((line_num, record))
+                if len(batch) >= self.batch_size:
+                    self._flush_batch(conn, batch)
+                    batch = []
+
+            self._flush_batch(conn, batch)
+
+        # Release this file's memoized dates (up to 65536 strings) once it is done.
+        _parse_date_to_utc.cache_clear()
+
+    def parse_and_insert_parallel(self, jsonl_path: str, workers: Optional[int] = None) -> None:
+        """
+        Ingest a JSONL file with several worker processes, then merge.
+
+        The file is split into line-aligned byte ranges (split_jsonl). Each
+        worker process parses its range and writes it, through a private
+        PatentService, to its own shard database in a temporary directory;
+        JSON decoding and row building thus run on every core instead of one.
+        The shards are then merged into `db_path` (merge_shards) and removed.
+
+        Parameters
+        ----------
+        jsonl_path : str
+            Path to the JSONL file containing records from SerpAPI.
+        workers : int, optional
+            Number of worker processes; defaults to os.cpu_count().
+
+        Production Note:
+        ---------------
+        - Call setup_database first, as for parse_and_insert_from_jsonl.
+        - Line numbers in error_logs refer to the whole file, as in the
+          sequential path. Rows are merged shard by shard in file order.
+        - If a worker or the merge fails, the shard directory is kept (its path
+          is logged) so the shards can be inspected or merged manually.
+        """
+        jsonl_path_obj = Path(jsonl_path)
+        if not jsonl_path_obj.is_file():
+            logger.error(f"File not found: {jsonl_path}")
+            return
+
+        shards = split_jsonl(jsonl_path_obj, workers or os.cpu_count() or 1)
+        shard_dir = tempfile.mkdtemp(prefix="patent_shards_")
+        logger.info(f"Parsing {jsonl_path} in {len(shards)} shards under {shard_dir}")
+        with ProcessPoolExecutor(max_workers=len(shards)) as pool:
+            futures = [
+                pool.submit(
+                    _ingest_shard, os.path.join(shard_dir, f"shard_{k}.db"),
+                    str(jsonl_path_obj), start, first_line, num_lines, self.batch_size
+                )
+                for k, (start, first_line, num_lines) in enumerate(shards)
+            ]
+            shard_paths = [future.result() for future in futures]
+
+        self.merge_shards(shard_paths)
+        shutil.rmtree(shard_dir)
+        logger.info("Finished parallel parsing and inserting data from JSONL.")
+
+    def merge_shards(self, shard_paths: List[str]) -> None:
+        """
+        Copy every table of each shard database into `db_path`, in order.
+
+        Each shard is ATTACHed to one connection and copied with a single
+        INSERT ... SELECT per table (AbstractTableDAO.copy_from_attached) inside
+        one transaction per shard. Child rows get fresh ids, and 'patents'
+        keeps INSERT OR IGNORE semantics, so a patent present in two shards is
+        kept once, as in sequential ingestion.
+
+        Parameters
+        ----------
+        shard_paths : List[str]
+            Shard databases created with this service's schema.
+        """
+        with db_connection(self.db_path) as conn:
+            for shard_path in shard_paths:
+                # ATTACH/DETACH cannot run inside a transaction
+                conn.execute("ATTACH DATABASE ? AS shard", (shard_path,))
+                try:
+                    with transaction(conn):
+                        for dao in self.all_daos:
+                            dao.copy_from_attached(conn, "shard")
+                finally:
+                    conn.execute("DETACH DATABASE shard")
\ No newline at end of file
@@ -26,9 +26,16 @@ import os
 import getpass
 import yaml
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List
 from dotenv import load_dotenv
 
+# libyaml's C loader when PyYAML was built with it; the pure-Python one otherwise.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Set once ensure_serpapi_key has read .env, so later calls skip the file lookup.
+_dotenv_loaded = False
+
 
 @dataclass
 class SerpAPIConfig:
@@ -62,6 +69,10 @@ class SerpAPIConfig:
     skip_if_has_pdf : bool
         If True, skip re-fetching a patent if the existing record in JSONL has a 'pdf' key,
         indicating a successful prior fetch.
+    concurrency : int
+        Number of SerpAPI requests in flight at once.
+    max_qps : float
+        Maximum SerpAPI requests per second across all workers (<= 0: unlimited).
 
     Production Considerations:
     --------------------------
@@ -80,8 +91,11 @@ class SerpAPIConfig:
     max_retries: int
     sleep_seconds: int
     skip_if_has_pdf: bool
+    concurrency: int = 8
+    max_qps: float = 5.0
 
 
+@lru_cache(maxsize=4)
 def load_serpapi_config(config_path: str = "config.yaml") -> SerpAPIConfig:
     """
     Reads a YAML file from the same directory as this script and maps it
@@ -109,13 +123,17 @@ def load_serpapi_config(config_path: str = "config.yaml") -> SerpAPIConfig:
       other config files in the repository.
     - For large or nested configs, you can expand or nest the YAML structure
       and parse accordingly.
+    - The result is cached per config_path, so the YAML is parsed (with the
+      libyaml CSafeLoader when available) only once per process. Callers share
+      the returned instance and should treat it as read-only; call
+      load_serpapi_config.cache_clear() to pick up edits to the file.
     """
     full_path = os.path.join(os.path.dirname(__file__), config_path)
     if not os.path.exists(full_path):
         raise FileNotFoundError(f"Config file not found at {full_path}")
 
     with open(full_path, "r", encoding="utf-8") as f:
-        raw = yaml.safe_load(f)
+        raw = yaml.load(f, Loader=_YAML_LOADER)
 
     return SerpAPIConfig(
         input_folder=raw.get("input_folder", ""),
@@ -127,7 +145,9 @@ def load_serpapi_config(config_path: str = "config.yaml") -> SerpAPIConfig:
         remove_spaces_column=raw.get("remove_spaces_column", ""),
         max_retries=raw.get("max_retries", 3),
         sleep_seconds=raw.get("sleep_seconds", 2),
-        skip_if_has_pdf=raw.get("skip_if_has_pdf", True)
+        skip_if_has_pdf=raw.get("skip_if_has_pdf", True),
+        concurrency=raw.get("concurrency", 8),
+        max_qps=raw.get("max_qps", 5.0)
     )
 
 
@@ -147,8 +167,12 @@ def ensure_serpapi_key():
     - For CI/CD or container deployments, prefer setting SERPAPI_KEY 
       in environment variables or a secure vault instead of prompting.
     - If .env is used, ensure it's .gitignored to avoid committing keys to source control.
+    - .env is read on the first call only; later calls just check os.environ.
     """
-    load_dotenv()
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        load_dotenv()
+        _dotenv_loaded = True
     if not os.environ.get("SERPAPI_KEY"):
         key = getpass.getpass("Enter your SERPAPI_KEY: ")
         os.environ["SERPAPI_KEY"] = key
\ No newline at end of file
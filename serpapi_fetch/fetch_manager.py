@@ -10,9 +10,12 @@ This module defines the SerpAPIFetchManager class, responsible for:
    - Sorting by a certain column (descending),
    - Taking the top N rows.
    - Stripping spaces in a designated column (e.g., 'Document ID').
-3) Checking existing JSONL data to skip patents already fetched (especially if 'pdf' is found).
-4) Fetching patent details from SerpAPI (via serpapi library) with automatic retries on errors.
-5) Appending new records to the output JSONL file.
+3) Checking existing JSONL data (via its sidecar index) to skip patents already fetched
+   (especially if 'pdf' is found).
+4) Fetching patent details from SerpAPI's JSON endpoint over one pooled keep-alive
+   HTTP session, with automatic retries on errors,
+   several requests in flight at once (bounded thread pool, rate-limited).
+5) Appending new records to the output JSONL file as they complete.
 
 Usage in the System:
 --------------------
@@ -27,14 +30,21 @@ Key Functions:
   and applying filter/sort/limit logic.
 - load_existing_records() : loads the existing JSONL to identify which patent_ids 
   are already fetched (and possibly skip them).
+- load_existing_index() : the same answer (patent_id -> has 'pdf') from the
+  small '<output_jsonl>.idx' sidecar, rebuilt from the JSONL only when missing
+  or stale.
 - fetch_patents_in_bulk() : the main entry point to run the entire process.
 
 Production-Level Considerations:
 -------------------------------
 - Logging: errors are recorded in serpapi_fetch_errors.log at ERROR level.
-- If you plan to handle extremely large CSV files, consider chunked reads.
-- If the volume of patents or the concurrency is high, coordinate with 
-  SerpAPI rate limits or schedule the fetch.
+- CSVs are read with only the columns the pipeline uses (usecols) and string
+  dtypes for the text columns, which keeps peak memory proportional to those
+  few columns. If a single file outgrows memory even so, read it with
+  chunksize and apply the row filter per chunk before concatenating.
+- The fetch is network-bound, so `concurrency` worker threads each wait on
+  their own request; `max_qps` caps the combined request rate so the pool
+  stays within the SerpAPI plan's limits.
 - For advanced usage, you may want to store partial results in a DB or handle 
   more sophisticated deduplication or PDF checks.
 """
@@ -44,11 +54,68 @@ import glob
 import json
 import time
 import logging
+import threading
+import numpy as np
 import pandas as pd
-from typing import List
+import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 from tqdm.auto import tqdm
-from serpapi import GoogleSearch
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:  # pragma: no cover - orjson is optional
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # pragma: no cover - pyarrow is optional
+    pa = None
+
+# SerpAPI JSON endpoint (what serpapi.GoogleSearch calls under the hood).
+_SERPAPI_SEARCH_URL = "https://serpapi.com/search.json"
+# (connect, read) timeouts in seconds for one SerpAPI request.
+_REQUEST_TIMEOUT = (10, 60)
+
+# Upper bound on CSV files parsed concurrently by the pandas reader.
+_CSV_READ_WORKERS = 8
+
+# Output JSONL: 1 MiB file buffer, and encoded records are gathered in memory
+# and handed to write() once roughly every 256 KiB instead of once per record.
+_WRITE_BUFFER_SIZE = 1 << 20
+_FLUSH_THRESHOLD = 256 << 10
+
+
+class _RateLimiter:
+    """
+    Spaces calls at least 1/max_qps seconds apart across all threads.
+    A max_qps <= 0 disables throttling.
+    """
+
+    def __init__(self, max_qps: float):
+        self._interval = 1.0 / max_qps if max_qps > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        if not self._interval:
+            return
+        # Reserve the next slot under the lock, sleep outside it
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+        if slot > now:
+            time.sleep(slot - now)
 
 
 @dataclass
@@ -79,6 +146,11 @@ class SerpAPIFetchManager:
         Delay (in seconds) between retries.
     skip_if_has_pdf : bool
         If True, skip re-fetch if existing data in JSONL includes a 'pdf' key.
+    concurrency : int
+        Number of SerpAPI requests in flight at once (worker threads).
+    max_qps : float
+        Upper bound on SerpAPI requests per second across all workers
+        (<= 0 disables throttling).
     logger : logging.Logger
         Logger instance to record errors into serpapi_fetch_errors.log.
     api_key : str (initialized post-init)
@@ -102,9 +174,14 @@ class SerpAPIFetchManager:
     max_retries: int
     sleep_seconds: int
     skip_if_has_pdf: bool
+    concurrency: int = 8
+    max_qps: float = 5.0
 
     logger: logging.Logger = field(default_factory=logging.getLogger)
     api_key: str = field(init=False)
+    _rate_limiter: _RateLimiter = field(init=False, repr=False)
+    _session: requests.Session = field(init=False, repr=False)
+    _base_params: Tuple[Tuple[str, str], ...] = field(init=False, repr=False)
 
     def __post_init__(self):
         """
@@ -121,11 +198,76 @@ class SerpAPIFetchManager:
         if not key:
             raise ValueError("No SERPAPI_KEY found in environment.")
         self.api_key = key
+        # Query parameters shared by every request; only patent_id varies
+        self._base_params = (("engine", "google_patents_details"), ("api_key", key))
+        self._rate_limiter = _RateLimiter(self.max_qps)
+
+        # One keep-alive connection per worker thread, reused across patents
+        pool_size = max(1, self.concurrency)
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0),
+        )
+
+    def _needed_columns(self) -> set:
+        """
+        Columns used downstream: 'Document ID', filter_columns, sort_by and
+        remove_spaces_column (empty names dropped).
+        """
+        return {"Document ID", self.sort_by, self.remove_spaces_column, *self.filter_columns} - {""}
+
+    def _string_columns(self) -> set:
+        """
+        The text columns among _needed_columns(): everything except sort_by
+        (unless it is also a filter/ID column).
+        """
+        return {"Document ID", self.remove_spaces_column, *self.filter_columns} - {""}
+
+    def _read_csvs_arrow(self, csv_files: List[str]) -> pd.DataFrame:
+        """
+        pyarrow path of _read_and_concat_csvs(): each file is parsed by Arrow's
+        multithreaded CSV reader (needed columns only, text columns as string),
+        the tables are concatenated without copying, and the result is converted
+        to pandas once, backed by Arrow (pd.ArrowDtype) columns, so the text
+        filters run on Arrow's C++ string kernels.
+
+        A needed column absent from a file is filled with nulls; a column that
+        is null in every file (i.e. absent everywhere) is dropped, as the pandas
+        path would never have read it.
+        """
+        convert_options = pacsv.ConvertOptions(
+            include_columns=sorted(self._needed_columns()),
+            include_missing_columns=True,
+            column_types={col: pa.string() for col in self._string_columns()},
+        )
+        tables = [pacsv.read_csv(fpath, convert_options=convert_options) for fpath in csv_files]
+        # "permissive" widens types that differ between files (e.g. a score
+        # column inferred as int64 in one CSV and double in another)
+        combined = pa.concat_tables(tables, promote_options="permissive")
+        absent = [
+            f.name for f in combined.schema
+            if pa.types.is_null(f.type)
+            or (combined.num_rows and combined.column(f.name).null_count == combined.num_rows)
+        ]
+        if absent:
+            combined = combined.drop_columns(absent)
+        return combined.to_pandas(types_mapper=pd.ArrowDtype)
 
     def _read_and_concat_csvs(self) -> pd.DataFrame:
         """
         Gathers all CSV files in self.input_folder, concatenates them into a single DataFrame.
 
+        Only the columns from _needed_columns() are parsed; the text columns
+        ('Document ID', filter_columns, remove_spaces_column) are read as
+        strings, while sort_by keeps its inferred (usually numeric) dtype so
+        the descending sort is unchanged.
+
+        With pyarrow installed the files are read and concatenated as Arrow
+        tables (_read_csvs_arrow), avoiding the copy pd.concat makes of every
+        column; otherwise pandas reads the files ("string" dtype) on up to
+        _CSV_READ_WORKERS threads and concats.
+
         Raises
         ------
         NotADirectoryError
@@ -142,10 +284,25 @@ class SerpAPIFetchManager:
         if not csv_files:
             raise FileNotFoundError(f"No CSV files found in '{self.input_folder}'")
 
-        dfs = []
-        for fpath in csv_files:
-            df = pd.read_csv(fpath)
-            dfs.append(df)
+        if pa is not None:
+            return self._read_csvs_arrow(csv_files)
+
+        needed = self._needed_columns()
+        string_dtypes = {col: "string" for col in self._string_columns()}
+
+        def read_one(fpath: str) -> pd.DataFrame:
+            return pd.read_csv(
+                fpath,
+                usecols=lambda c: c in needed,
+                dtype=string_dtypes,
+                engine="c",
+                memory_map=True,
+            )
+
+        # The C parser releases the GIL, so several files parse at once;
+        # map() keeps the file order of the concatenated result.
+        with ThreadPoolExecutor(max_workers=min(_CSV_READ_WORKERS, len(csv_files))) as pool:
+            dfs = list(pool.map(read_one, csv_files))
 
         if not dfs:
             raise ValueError("No CSV data read.")
@@ -160,9 +317,12 @@ class SerpAPIFetchManager:
         Steps:
         ------
         1) If filter_condition is set, keep rows where filter_columns have 
-           case-insensitive substring matches.
+           case-insensitive substring matches (a literal substring, not a
+           regular expression; no row matches if none of the columns exist).
         2) If sort_by is set and valid, sort descending.
-        3) If limit > 0, take the top 'limit' rows.
+        3) If limit > 0, take the top 'limit' rows. When limit is small
+           relative to the frame and sort_by is numeric, only the top
+           'limit' rows are selected (np.argpartition) and sorted.
         4) If remove_spaces_column is set, remove spaces in that column.
 
         Returns
@@ -172,20 +332,34 @@ class SerpAPIFetchManager:
         """
         # (1) Filter
         if self.filter_condition and self.filter_columns:
-            mask = False
-            for col in self.filter_columns:
-                if col in df.columns:
-                    col_mask = df[col].str.contains(self.filter_condition, case=False, na=False)
-                    mask = mask | col_mask
-            df = df[mask]
-
-        # (2) Sort descending if requested
-        if self.sort_by and self.sort_by in df.columns:
-            df = df.sort_values(by=self.sort_by, ascending=False)
-
-        # (3) Limit
-        if self.limit > 0:
-            df = df.head(self.limit)
+            # Plain substring test per column (no regex compile), OR-ed in one numpy reduce
+            masks = [
+                df[col].str.contains(self.filter_condition, case=False, na=False, regex=False)
+                .to_numpy(dtype=bool)
+                for col in self.filter_columns
+                if col in df.columns
+            ]
+            mask = np.logical_or.reduce(masks) if masks else np.zeros(len(df), dtype=bool)
+            df = df.loc[mask]
+
+        # (2) + (3) Sort descending if requested, then limit
+        sort_col = self.sort_by if self.sort_by and self.sort_by in df.columns else None
+        if (
+            sort_col
+            and 0 < self.limit < len(df) // 4
+            and pd.api.types.is_numeric_dtype(df[sort_col])
+        ):
+            # Top-k by partial partition (O(N)), then sort only those k rows;
+            # NaN ranks last, as with sort_values
+            values = df[sort_col].to_numpy(dtype="float64", na_value=np.nan)
+            values = np.where(np.isnan(values), -np.inf, values)
+            top = np.argpartition(-values, self.limit)[:self.limit]
+            df = df.iloc[top].sort_values(by=sort_col, ascending=False)
+        else:
+            if sort_col:
+                df = df.sort_values(by=sort_col, ascending=False)
+            if self.limit > 0:
+                df = df.head(self.limit)
 
         # (4) Remove spaces
         if self.remove_spaces_column and self.remove_spaces_column in df.columns:
@@ -229,16 +403,18 @@ class SerpAPIFetchManager:
         ---------------
         - For extremely large JSONL, consider a more scalable approach
           (e.g., a DB or partial load).
+        - Lines are read as bytes and parsed by orjson (when installed), which
+          takes UTF-8 bytes directly, skipping the text-mode decode.
         """
         records = {}
         if os.path.exists(self.output_jsonl):
-            with open(self.output_jsonl, "r", encoding="utf-8") as f_in:
+            with open(self.output_jsonl, "rb") as f_in:
                 for line in f_in:
                     line = line.strip()
                     if not line:
                         continue
                     try:
-                        record = json.loads(line)
+                        record = _json_loads(line)
                         pid = record.get("patent_id", "")
                         data = record.get("data", {})
                         records[pid] = data
@@ -246,6 +422,61 @@ class SerpAPIFetchManager:
                         self.logger.error(f"Failed to parse line: {e}")
         return records
 
+    @property
+    def index_path(self) -> str:
+        """
+        Sidecar of the output JSONL: one 'patent_id<TAB>has_pdf' line (has_pdf
+        is '1' or '0') per record, appended in lockstep with the JSONL.
+        """
+        return self.output_jsonl + ".idx"
+
+    def load_existing_index(self) -> Dict[str, bool]:
+        """
+        Returns patent_id -> whether its stored data has a 'pdf' key, read from
+        the sidecar index instead of parsing the whole JSONL.
+
+        The sidecar is trusted only if it is at least as new as output_jsonl
+        (every run writes the JSONL first, then the sidecar). If it is missing
+        or older, e.g. after the JSONL was edited by hand, the JSONL is scanned
+        once via load_existing_records() and the sidecar is rewritten. A
+        sidecar whose JSONL is gone is truncated, and a partial last line left
+        by an interrupted write is cut off before the next run appends.
+
+        Returns
+        -------
+        Dict[str, bool]
+            patent_id -> True if 'pdf' is present in its data. Later lines win.
+        """
+        idx_path = self.index_path
+        if not os.path.exists(self.output_jsonl):
+            # A sidecar without its JSONL is stale; truncate it so the next
+            # append does not land on top of entries for deleted records
+            if os.path.exists(idx_path):
+                open(idx_path, "w").close()
+            return {}
+
+        if os.path.exists(idx_path) and os.path.getmtime(idx_path) >= os.path.getmtime(self.output_jsonl):
+            with open(idx_path, "rb") as f_idx:
+                data = f_idx.read()
+            if data and not data.endswith(b"\n"):
+                # Truncated last line from an interrupted write: drop it, so
+                # the next append starts on a fresh line
+                data = data[:data.rfind(b"\n") + 1]
+                with open(idx_path, "wb") as f_idx:
+                    f_idx.write(data)
+            index = {}
+            for line in data.splitlines():
+                pid, _, has_pdf = line.decode("utf-8").partition("\t")
+                if not has_pdf:
+                    continue
+                index[pid] = has_pdf == "1"
+            return index
+
+        index = {pid: "pdf" in data for pid, data in self.load_existing_records().items()}
+        with open(idx_path, "w", encoding="utf-8") as f_idx:
+            f_idx.writelines(f"{pid}\t{'1' if has_pdf else '0'}\n" for pid, has_pdf in index.items())
+        return index
+
     def _fetch_patent_details(self, raw_id: str) -> dict:
         """
         Calls SerpAPI for one patent, returning a dictionary of results.
@@ -259,85 +490,139 @@ class SerpAPIFetchManager:
         Raises
         ------
         Exception
-            If the SerpAPI call fails (network error, rate limit, etc.).
+            If the SerpAPI call fails (network error, timeout, or an HTTP error
+            status such as 429 rate limit / 401 bad key).
 
         Returns
         -------
         dict
             The parsed JSON response from SerpAPI. 
             Typically includes fields like 'title', 'pdf', 'claims', etc.
+
+        Production Note:
+        ---------------
+        - Requests go through the shared requests.Session, so each worker reuses
+          an open TLS connection instead of handshaking once per patent.
         """
         full_id = f"patent/{raw_id}/en"
-        params = {
-            "engine": "google_patents_details",
-            "patent_id": full_id,
-            "api_key": self.api_key
-        }
-        search = GoogleSearch(params)
-        result = search.get_dict()
-        return result
+        params = self._base_params + (("patent_id", full_id),)
+        self._rate_limiter.wait()
+        response = self._session.get(_SERPAPI_SEARCH_URL, params=params, timeout=_REQUEST_TIMEOUT)
+        response.raise_for_status()
+        return _json_loads(response.content)
+
+    def _fetch_one(self, raw_id: str) -> Tuple[str, Optional[dict], Optional[Exception]]:
+        """
+        Fetches one patent with up to max_retries attempts (run in a worker thread).
+
+        Parameters
+        ----------
+        raw_id : str
+            The local patent ID (e.g., "US11734097B1").
+
+        Returns
+        -------
+        Tuple[str, Optional[dict], Optional[Exception]]
+            (raw_id, {"patent_id": raw_id, "data": response}, None) on success,
+            or (raw_id, None, last_error) once every attempt has failed.
+        """
+        error = None
+        for attempt in range(self.max_retries):
+            try:
+                response = self._fetch_patent_details(raw_id)
+                return raw_id, {"patent_id": raw_id, "data": response}, None
+            except Exception as e:
+                error = e
+                self.logger.error(f"Error fetching {raw_id}, attempt {attempt+1}/{self.max_retries}: {e}")
+                if attempt + 1 < self.max_retries:
+                    time.sleep(self.sleep_seconds)
+        return raw_id, None, error
 
     def fetch_patents_in_bulk(self):
         """
         Main logic to orchestrate the entire fetch flow:
 
         1) Gather patent IDs from CSV(s) via load_patent_ids().
-        2) Load existing records from output_jsonl (if any).
-        3) For each patent_id:
-           - If skip_if_has_pdf=True and 'pdf' is present in existing record, skip fetch.
-           - Otherwise, attempt up to max_retries calls to _fetch_patent_details().
-           - Append each successful result to output_jsonl in JSON Lines format.
-        4) Provide progress updates via tqdm, 
+        2) Load which patents are already stored (and whether with a 'pdf')
+           from the sidecar index via load_existing_index().
+        3) Drop patents that need no fetch:
+           skip_if_has_pdf=True and 'pdf' is present in the existing record.
+        4) Fetch the rest on a pool of `concurrency` threads, each patent with
+           up to max_retries calls to _fetch_patent_details().
+        5) Append each successful result to output_jsonl in JSON Lines format
+           as it completes (completion order, not CSV order), and its
+           'patent_id<TAB>has_pdf' line to the sidecar index.
+        6) Provide progress updates via tqdm, 
            logging error details to serpapi_fetch_errors.log on failure.
+
+        Production Note:
+        ---------------
+        - Only the calling thread writes to output_jsonl, so lines never interleave.
+        - If the loop is interrupted (Ctrl-C, write error), patents still queued
+          are cancelled; only the requests already in flight complete.
+        - Records are serialized straight to bytes by orjson when installed
+          (compact separators; any JSON reader parses them the same).
+        - Encoded lines accumulate in a bytearray that is written once it
+          reaches _FLUSH_THRESHOLD, and once more (plus a single fsync) at the
+          end, even if the loop is interrupted. A crash loses at most the
+          unflushed tail, which the next run simply fetches again.
+        - The sidecar lines are written right after the matching JSONL bytes,
+          so the index never lists a record the JSONL lacks.
         """
         patent_list = self.load_patent_ids()
         num_patents = len(patent_list)
-        existing = self.load_existing_records()
+        existing = self.load_existing_index()
 
-        start_time = time.time()
+        start_time = time.monotonic()
         total_success = 0
         total_fail = 0
-        cumulative_time = 0.0
-
-        mode = "a"  # append to JSONL
-        with open(self.output_jsonl, mode=mode, encoding="utf-8") as f_out:
-            for i, raw_id in enumerate(tqdm(patent_list, total=num_patents, desc="Fetching Patent Data")):
-                iter_start = time.time()
 
-                # If we already have data, skip if skip_if_has_pdf and 'pdf' in existing record
-                if raw_id in existing:
-                    if self.skip_if_has_pdf and "pdf" in existing[raw_id]:
-                        tqdm.write(f"Skipping {raw_id} (found 'pdf' in data).")
+        # If we already have data, skip if skip_if_has_pdf and 'pdf' in existing record
+        if self.skip_if_has_pdf:
+            pending = [raw_id for raw_id in patent_list if not existing.get(raw_id)]
+        else:
+            pending = list(patent_list)
+        if len(pending) < num_patents:
+            self.logger.debug("Skipping %d patents (found 'pdf' in data).", num_patents - len(pending))
+
+        mode = "ab"  # append to JSONL
+        buf = bytearray()
+        idx_buf = bytearray()
+        with open(self.output_jsonl, mode=mode, buffering=_WRITE_BUFFER_SIZE) as f_out, \
+                open(self.index_path, mode=mode) as f_idx, \
+                ThreadPoolExecutor(max_workers=max(1, self.concurrency)) as pool:
+            try:
+                futures = [pool.submit(self._fetch_one, raw_id) for raw_id in pending]
+                for future in tqdm(as_completed(futures), total=len(futures), desc="Fetching Patent Data", mininterval=0.5):
+                    raw_id, record, error = future.result()
+                    if record is None:
+                        total_fail += 1
                         continue
-
-                # Attempt up to max_retries
-                success = False
-                for attempt in range(self.max_retries):
-                    try:
-                        response = self._fetch_patent_details(raw_id)
-                        record = {
-                            "patent_id": raw_id,
-                            "data": response
-                        }
-                        f_out.write(json.dumps(record) + "\n")
-                        success = True
-                        total_success += 1
-                        break
-                    except Exception as e:
-                        self.logger.error(f"Error fetching {raw_id}, attempt {attempt+1}/{self.max_retries}: {e}")
-                        time.sleep(self.sleep_seconds)
-
-                if not success:
-                    total_fail += 1
-
-                # Timing updates
-                iter_time = time.time() - iter_start
-                cumulative_time += iter_time
-                avg_time = cumulative_time / (i + 1)
-                tqdm.write(f"Patent {raw_id} took {iter_time:.2f}s, avg {avg_time:.2f}s")
-
-        total_time = time.time() - start_time
-        print(f"\nDone! Patents: {num_patents}, success={total_success}, fail={total_fail}")
-        if num_patents:
-            print(f"Avg time/patent: {cumulative_time / num_patents:.2f}s")
-        print(f"Total time: {total_time:.2f}s")
\ No newline at end of file
+                    buf += _json_dumps(record)
+                    buf.append(0x0A)
+                    idx_buf += f"{raw_id}\t{'1' if 'pdf' in record['data'] else '0'}\n".encode("utf-8")
+                    total_success += 1
+                    if len(buf) >= _FLUSH_THRESHOLD:
+                        f_out.write(buf)
+                        f_out.flush()
+                        f_idx.write(idx_buf)
+                        f_idx.flush()
+                        buf.clear()
+                        idx_buf.clear()
+            except BaseException:
+                # Drop queued fetches so an interrupt or write error doesn't
+                # spend SerpAPI credits on results nobody will write
+                pool.shutdown(wait=False, cancel_futures=True)
+                raise
+            finally:
+                f_out.write(buf)
+                f_out.flush()
+                os.fsync(f_out.fileno())
+                f_idx.write(idx_buf)
+                f_idx.flush()
+
+        total_time = time.monotonic() - start_time
+        print(f"\nDone! Patents: {num_patents}, fetched={len(pending)}, success={total_success}, fail={total_fail}")
+        if pending:
+            print(f"Avg time/patent: {total_time / len(pending):.2f}s")
+        print(f"Total time: {total_time:.2f}s")
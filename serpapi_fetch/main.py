@@ -21,7 +21,7 @@ Behavior:
    - Reads/merges CSV files
    - Optionally filters and sorts
    - Skips already-fetched patents if "pdf" is detected
-   - Calls SerpAPI with retry logic, appending results to a JSONL file
+   - Calls SerpAPI with retry logic on a bounded thread pool, appending results to a JSONL file
 
 Error Handling:
 ---------------
@@ -109,6 +109,8 @@ def main():
             max_retries=config.max_retries,
             sleep_seconds=config.sleep_seconds,
             skip_if_has_pdf=config.skip_if_has_pdf,
+            concurrency=config.concurrency,
+            max_qps=config.max_qps,
             logger=logger  # pass the same logger
         )
 
@@ -22,8 +22,9 @@ In a production environment:
 import os
 import json
 import logging
+import threading
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Optional
 
 from langchain_openai import ChatOpenAI
 from langchain_community.agent_toolkits.sql.toolkit import SQLDatabaseToolkit
@@ -38,6 +39,13 @@ from .db_manager import DatabaseManager
 from .vectorstore_manager import VectorStoreManager
 from .tools_manager import SchemaDocRAGTool, ExtendedSQLSchemaTool
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is optional
+    _json_loads = json.loads
+
 
 @dataclass
 class Text2SQLAgent:
@@ -52,6 +60,9 @@ class Text2SQLAgent:
     Production Notes:
     - 'schema_docs_path' should always point to up-to-date schema docs, if the DB schema changes.
     - If performance or concurrency is critical, consider multi-threading or queue-based architecture.
+    - Construction is cheap (API key check + LLM client). The SQL toolkit, the
+      schema-doc vectorstore and the agent graph are built on the first
+      query_text() call, so a CLI session that never queries pays nothing.
     - Provide clear instructions in the system prompt to ensure the agent calls SQL tools appropriately.
     """
 
@@ -60,21 +71,18 @@ class Text2SQLAgent:
     schema_docs_path: str
 
     llm: ChatOpenAI = field(init=False)
-    agent_executor: Any = field(init=False)
+    agent_executor: Any = field(init=False, default=None)
+    _doc_source: Optional[dict] = field(init=False, default=None, repr=False)
+    _ready_lock: threading.Lock = field(init=False, default_factory=threading.Lock, repr=False)
 
     def __post_init__(self):
         """
-        Initializes the LLM, toolkits, vectorstore, and sets up 
-        a ReAct agent with thread-level memory.
+        Initializes the LLM; the toolkits, vectorstore and ReAct agent are
+        built lazily by _ensure_ready().
 
         Steps (Production Rationale):
         1) ensure_openai_key -> Secures the OpenAI API Key from env or prompt.
         2) ChatOpenAI       -> Low temperature for deterministic SQL calls.
-        3) SQLDatabaseToolkit -> Tools for listing/querying schema.
-        4) VectorStoreManager -> Builds a local Chroma vectorstore for doc retrieval.
-        5) Merges custom tools -> RAG + ExtendedSQLSchemaTool for schema doc usage.
-        6) create_react_agent -> Provides a chain-of-thought capable agent 
-           with MemorySaver for conversation continuity by thread_id.
         """
         # 1) Ensure the OPENAI_API_KEY environment variable is set
         ensure_openai_key()
@@ -85,6 +93,39 @@ class Text2SQLAgent:
             temperature=0.0
         )
 
+    @property
+    def doc_source(self) -> dict:
+        """
+        The parsed schema_docs.json, read once and cached on the instance
+        (parsed with orjson when installed).
+        """
+        if self._doc_source is None:
+            with open(self.schema_docs_path, "rb") as f:
+                self._doc_source = _json_loads(f.read())
+        return self._doc_source
+
+    def _ensure_ready(self) -> None:
+        """
+        Builds the tools and the agent on first use (thread-safe, runs once).
+
+        Steps (Production Rationale):
+        3) SQLDatabaseToolkit -> Tools for listing/querying schema.
+        4) VectorStoreManager -> Builds (or reopens, if persisted) a Chroma
+           vectorstore for doc retrieval.
+        5) Merges custom tools -> RAG + ExtendedSQLSchemaTool for schema doc usage.
+        6) create_react_agent -> Provides a chain-of-thought capable agent 
+           with MemorySaver for conversation continuity by thread_id.
+        """
+        if self.agent_executor is not None:
+            return
+        with self._ready_lock:
+            if self.agent_executor is None:
+                self.agent_executor = self._build_agent()
+
+    def _build_agent(self) -> Any:
+        """
+        Performs steps 3-6 of _ensure_ready() and returns the compiled agent.
+        """
         # 3) Build the SQL toolkit from the LangChain-Community library
         toolkit = SQLDatabaseToolkit(
             db=self.db_manager.langchain_db,
@@ -104,18 +145,17 @@ class Text2SQLAgent:
         # 4) Build the vectorstore for RAG
         vs_manager = VectorStoreManager(
             schema_docs_path=self.schema_docs_path,
-            collection_name=self.config.collection_name
+            collection_name=self.config.collection_name,
+            schema_docs=self.doc_source,
+            persist_directory=self.config.persist_directory
         )
         vectorstore = vs_manager.vectorstore
 
         # 5) Create custom tools for schema docs RAG and extended schema
-        with open(self.schema_docs_path, "r", encoding="utf-8") as f:
-            doc_source = json.load(f)
-
         rag_tool = SchemaDocRAGTool(vectorstore=vectorstore)
         extended_tool = ExtendedSQLSchemaTool(
             sql_schema_tool=sql_schema_tool,
-            doc_source=doc_source
+            doc_source=self.doc_source
         )
         all_tools = base_tools + [rag_tool, extended_tool]
 
@@ -136,14 +176,14 @@ class Text2SQLAgent:
         """
 
         # Create a ReAct agent with memory for multi-turn dialogue.
-        self.agent_executor = create_react_agent(
+        return create_react_agent(
             model=self.llm,
             tools=all_tools,
             prompt=system_message,
             checkpointer=MemorySaver()  # Use a memory checkpointer for thread-level conversation state
         )
 
-    def query_text(self, query: str, thread_id: str = "default") -> str:
+    def query_text(self, query: str, thread_id: str = "default", debug: bool = False) -> str:
         """
         Provides the final interface for user queries.
         Arguments:
@@ -151,6 +191,9 @@ class Text2SQLAgent:
             thread_id: An identifier for conversation continuity. 
                        If multiple queries share the same thread_id,
                        they share memory context.
+            debug: If True, stream the intermediate agent states and log each
+                   step's latest message at DEBUG level; otherwise the agent
+                   runs with a single invoke() and only the final state is read.
 
         Returns:
             The final agent response as a string.
@@ -160,6 +203,8 @@ class Text2SQLAgent:
         - If you anticipate heavy concurrency, ensure get_openai_callback() usage 
           or other telemetry is efficient and does not block. 
         - Handle potential exceptions around network or token-limit errors gracefully.
+        - The first call also builds the tools and agent (_ensure_ready); a
+          failure there is reported like any other error and retried next call.
         """
         logger = logging.getLogger("text_sql_app")
         logger.info(f"Received query: {query}")
@@ -168,16 +213,24 @@ class Text2SQLAgent:
         config = {"configurable": {"thread_id": thread_id}}
 
         try:
+            self._ensure_ready()
+
             with get_openai_callback() as cb:
-                events = self.agent_executor.stream(
-                    {"messages": [("user", query)]},
-                    config=config,
-                    stream_mode="values"
-                )
-                final_msg = ""
-                for event in events:
-                    msg_obj = event["messages"][-1]
-                    final_msg = msg_obj.content
+                inputs = {"messages": [("user", query)]}
+                if debug:
+                    events = self.agent_executor.stream(
+                        inputs,
+                        config=config,
+                        stream_mode="values"
+                    )
+                    final_msg = ""
+                    for event in events:
+                        msg_obj = event["messages"][-1]
+                        logger.debug(f"Agent step: {msg_obj!r}")
+                        final_msg = msg_obj.content
+                else:
+                    result = self.agent_executor.invoke(inputs, config=config)
+                    final_msg = result["messages"][-1].content
 
                 logger.info(
                     f"Token usage: prompt={cb.prompt_tokens}, "
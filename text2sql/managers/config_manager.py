@@ -8,7 +8,7 @@ Production Context:
 - This file encapsulates the core application configuration, including:
   * OpenAI model settings (excluding the API key),
   * Database path info,
-  * Vectorstore collection naming.
+  * Vectorstore collection naming and on-disk location.
 - Logging is also initialized here, directing logs to both console and file.
 - If OPENAI_API_KEY isn't found in environment variables or a .env file, the user is
   prompted for it interactively, preventing plaintext exposure of credentials in code.
@@ -16,15 +16,34 @@ Production Context:
 
 import os
 import sys
+import queue
+import atexit
 import getpass
 import logging
+import logging.handlers
 import yaml
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
 
 from dotenv import load_dotenv
 
+# libyaml-backed loader when PyYAML was built with it; same safe semantics, C speed.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-@dataclass
+# .env is parsed at most once per process; the resolved OpenAI key is cached.
+_dotenv_loaded = False
+_openai_key: Optional[str] = None
+
+# logs/app.log rotation: size cap per file and number of rotated files kept.
+_LOG_MAX_BYTES = 10_000_000
+_LOG_BACKUP_COUNT = 3
+
+# Background thread that drains the app logger's queue into its real handlers.
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+
+@dataclass(frozen=True, slots=True)
 class OpenAIConfig:
     """
     Holds non-secret config for OpenAI, such as the model name.
@@ -38,7 +57,7 @@ class OpenAIConfig:
     model_name: str = "gpt-4"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DBConfig:
     """
     Configuration for the SQLite database.
@@ -47,17 +66,22 @@ class DBConfig:
     Production Considerations:
     - Ensure the file path is valid and has proper read/write permissions.
     - For large or production-scale usage, a move to Postgres/MySQL might be warranted.
+    - pool_size sets how many SQLite connections the agent keeps open for
+      concurrent tool calls (optional in YAML).
     """
     sqlite_db_path: str
+    pool_size: int = 8
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AppConfig:
     """
     Aggregates the overall application configuration, holding:
     - OpenAI parameters (OpenAIConfig)
     - Database path info (DBConfig)
     - The name of the vectorstore collection.
+    - persist_directory: where the Chroma collection is stored between runs
+      ("" keeps it in memory and re-embeds the schema docs on every start).
 
     Production Considerations:
     - Additional top-level fields can be added for advanced features (caching, concurrency, etc.).
@@ -66,6 +90,7 @@ class AppConfig:
     openai: OpenAIConfig
     db: DBConfig
     collection_name: str = "schema_docs_collection"
+    persist_directory: str = ""
 
 
 def load_config(config_path: str) -> AppConfig:
@@ -80,34 +105,57 @@ def load_config(config_path: str) -> AppConfig:
     - You can add extra validation, e.g. checking if certain keys exist.
     - Keep the YAML minimal and environment-agnostic. If more advanced,
       consider merging environment-specific overrides.
+    - Results are memoized per (config_path, file mtime): repeated calls return
+      the same (frozen) AppConfig instance until the file is modified.
+      load_config.cache_clear() drops the cache.
     """
-    if not os.path.exists(config_path):
-        raise FileNotFoundError(f"Config file not found: {config_path}")
+    try:
+        mtime = os.stat(config_path).st_mtime
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"Config file not found: {config_path}") from e
+
+    return _load_config_cached(config_path, mtime)
 
+
+@lru_cache(maxsize=8)
+def _load_config_cached(config_path: str, mtime: float) -> AppConfig:
+    """
+    Parses config_path into an AppConfig; mtime is only part of the cache key.
+    """
     with open(config_path, "r", encoding="utf-8") as f:
-        raw = yaml.safe_load(f)
+        raw = yaml.load(f, Loader=_YAML_LOADER)
 
     openai_conf = OpenAIConfig(**raw["openai"])
     db_conf = DBConfig(**raw["db"])
     coll_name = raw.get("collection_name", "schema_docs_collection")
+    persist_dir = raw.get("persist_directory", "")
 
     return AppConfig(
         openai=openai_conf,
         db=db_conf,
-        collection_name=coll_name
+        collection_name=coll_name,
+        persist_directory=persist_dir
     )
 
 
+load_config.cache_clear = _load_config_cached.cache_clear
+
+
 def setup_logging(level=logging.INFO) -> logging.Logger:
     """
     Sets up application logging, outputting to both console and logs/app.log.
     If called multiple times, won't re-add handlers due to logger.handlers check.
 
     Production Considerations:
-    - For high-volume logs, consider rotating file handlers (e.g. TimedRotatingFileHandler).
+    - logs/app.log is rotated by size (RotatingFileHandler), so disk use stays
+      bounded at roughly (_LOG_BACKUP_COUNT + 1) * _LOG_MAX_BYTES.
     - In containerized environments, standard output logging might be preferred.
     - Adjust log levels or integrate with monitoring solutions (Splunk, ELK, etc.).
+    - The logger itself only has a QueueHandler: a log call enqueues the record
+      and returns, while a QueueListener thread does the console/file writes.
+      The listener is stopped (and the queue flushed) at interpreter exit.
     """
+    global _log_listener
     logger = logging.getLogger("text_sql_app")
     logger.setLevel(level)
 
@@ -119,13 +167,26 @@ def setup_logging(level=logging.INFO) -> logging.Logger:
         # Console handler
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
 
-        # File handler
+        # File handler (rotated at ~10 MB, keeping 3 backups)
         os.makedirs("logs", exist_ok=True)
-        file_handler = logging.FileHandler("logs/app.log", encoding="utf-8")
+        file_handler = logging.handlers.RotatingFileHandler(
+            "logs/app.log",
+            maxBytes=_LOG_MAX_BYTES,
+            backupCount=_LOG_BACKUP_COUNT,
+            encoding="utf-8",
+            delay=True
+        )
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+
+        # Hand records to a background listener instead of writing inline
+        log_queue = queue.Queue(-1)
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        _log_listener = logging.handlers.QueueListener(
+            log_queue, console_handler, file_handler, respect_handler_level=True
+        )
+        _log_listener.start()
+        atexit.register(_log_listener.stop)
 
     return logger
 
@@ -139,9 +200,30 @@ def ensure_openai_key():
     - This approach is suitable for dev/test. For production, prefer
       an automated and secure key retrieval (CI/CD vault, secrets manager).
     - Loading .env is convenient, but ensure .env is .gitignored.
+    - .env is read on the first call only; later calls just check os.environ.
     """
-    load_dotenv()  # Attempt to load from .env if present
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        load_dotenv()  # Attempt to load from .env if present
+        _dotenv_loaded = True
 
     if not os.environ.get("OPENAI_API_KEY"):
         key = getpass.getpass("Enter your OPENAI_API_KEY: ")
-        os.environ["OPENAI_API_KEY"] = key
\ No newline at end of file
+        os.environ["OPENAI_API_KEY"] = key
+
+
+def get_openai_key() -> str:
+    """
+    Returns the OpenAI API key, resolving it through ensure_openai_key() on the
+    first call (environment, .env, or interactive prompt) and from a module
+    cache afterwards.
+
+    Production Considerations:
+    - Every component that needs the key should call this instead of reading
+      os.environ or prompting on its own, so the user is asked at most once.
+    """
+    global _openai_key
+    if _openai_key is None:
+        ensure_openai_key()
+        _openai_key = os.environ["OPENAI_API_KEY"]
+    return _openai_key
@@ -7,8 +7,9 @@ Explanation:
 -----------
 This module defines a DatabaseManager class that:
 1. Validates a local SQLite DB file path.
-2. Initializes a SQLAlchemy engine with a StaticPool to allow multi-thread access
-   without "check_same_thread" issues.
+2. Initializes a SQLAlchemy engine with a QueuePool of SQLite connections, so
+   concurrent tool calls each get their own connection (readers run in parallel
+   under WAL); check_same_thread=False lets pooled connections move between threads.
 3. Wraps the engine in a LangChain SQLDatabase for easy agent-based SQL queries.
 
 In a production environment, you may:
@@ -19,16 +20,42 @@ In a production environment, you may:
 
 import os
 from dataclasses import dataclass, field
-from sqlalchemy import create_engine, text
-from sqlalchemy.pool import StaticPool
-from typing import List, Any
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.pool import QueuePool
+from typing import List, Any, Optional, Tuple
 
 from langchain_community.utilities.sql_database import SQLDatabase
 
 from .config_manager import DBConfig
 
+# Applied to every new DBAPI connection: WAL so readers never wait on a writer,
+# NORMAL sync (durable under WAL), a 64 MiB page cache, 256 MiB of mmap'd reads
+# and in-memory temp tables for the agent's sorts/GROUP BYs.
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA temp_store=MEMORY",
+)
 
-@dataclass
+# Table listing, built once instead of per list_tables() call.
+_LIST_TABLES_STMT = text("SELECT name FROM sqlite_master WHERE type='table'")
+
+
+def _apply_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+    """
+    SQLAlchemy 'connect' event hook that runs _SQLITE_PRAGMAS on a fresh connection.
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+@dataclass(slots=True)
 class DatabaseManager:
     """
     Manages the creation of a SQLAlchemy engine and a LangChain SQLDatabase object.
@@ -36,15 +63,17 @@ class DatabaseManager:
 
     Production Considerations:
     - Ensure db_config points to a valid SQLite DB file.
-    - For concurrency, StaticPool plus check_same_thread=False is used
-      to avoid threading issues. For actual production, you might consider
-      a more robust pool class if using advanced features.
+    - For concurrency, a QueuePool of db_config.pool_size connections (plus up
+      to twice that in overflow) is used with check_same_thread=False; each
+      checkout is owned by one thread at a time, and WAL lets readers proceed
+      in parallel. A 30 s busy timeout covers the rare writer lock.
     - If running in containerized environments, confirm that the file path
       is mounted properly and has the correct permissions.
     """
     db_config: DBConfig
     engine: Any = field(init=False)
     langchain_db: SQLDatabase = field(init=False)
+    _tables_cache: Optional[Tuple[float, List[str]]] = field(init=False, default=None, repr=False)
 
     def __post_init__(self):
         """
@@ -58,32 +87,66 @@ class DatabaseManager:
           and consider a more advanced DB engine.
         - Additional error-handling logic can be added if file corruption
           or permission issues occur.
+        - Each new connection gets the _SQLITE_PRAGMAS (WAL, NORMAL sync,
+          larger cache, mmap) via a SQLAlchemy 'connect' listener.
         """
-        if not os.path.exists(self.db_config.sqlite_db_path):
+        # A missing file must be reported here: sqlite would silently create it
+        try:
+            os.stat(self.db_config.sqlite_db_path)
+        except FileNotFoundError as e:
             raise FileNotFoundError(
                 f"SQLite DB not found at path: {self.db_config.sqlite_db_path}"
-            )
+            ) from e
 
-        # Create a SQLite engine with a static pool to avoid concurrency issues
-        # across threads while ignoring 'check_same_thread'.
+        # Create a SQLite engine with a connection pool; connections may be
+        # returned and re-checked-out from different threads.
         self.engine = create_engine(
             f"sqlite:///{self.db_config.sqlite_db_path}",
-            connect_args={"check_same_thread": False},
-            poolclass=StaticPool
+            connect_args={"check_same_thread": False, "timeout": 30},
+            poolclass=QueuePool,
+            pool_size=self.db_config.pool_size,
+            max_overflow=2 * self.db_config.pool_size,
+            pool_pre_ping=False
         )
+        event.listen(self.engine, "connect", _apply_sqlite_pragmas)
 
         # Wrap the engine in a LangChain SQLDatabase for agent-friendly usage
         self.langchain_db = SQLDatabase(self.engine)
 
+    def _db_mtime(self) -> float:
+        """
+        Latest modification time of the database file or its WAL file (under
+        WAL, new commits land in '<db>-wal' before being checkpointed).
+        """
+        path = self.db_config.sqlite_db_path
+        mtime = os.path.getmtime(path)
+        wal_path = path + "-wal"
+        if os.path.exists(wal_path):
+            mtime = max(mtime, os.path.getmtime(wal_path))
+        return mtime
+
     def list_tables(self) -> List[str]:
         """
         Return a list of table names in the SQLite database.
 
         Returns:
             A list of table names found in the connected SQLite DB.
+
+        The result is cached and reused while the database (and WAL) file
+        modification time is unchanged; refresh_tables() forces a re-read.
         """
+        mtime = self._db_mtime()
+        if self._tables_cache is not None and self._tables_cache[0] == mtime:
+            return list(self._tables_cache[1])
+
         with self.engine.begin() as conn:
-            rows = conn.execute(
-                text("SELECT name FROM sqlite_master WHERE type='table';")
-            ).fetchall()
-        return [r[0] for r in rows]
\ No newline at end of file
+            tables = list(conn.execute(_LIST_TABLES_STMT).scalars())
+        self._tables_cache = (mtime, tables)
+        return list(tables)
+
+    def refresh_tables(self) -> List[str]:
+        """
+        Drop the cached table list and read it again from sqlite_master.
+        """
+        self._tables_cache = None
+        return self.list_tables()
\ No newline at end of file
@@ -13,12 +13,20 @@ Production Context:
 - Ensure 'vectorstore' and 'doc_source' remain up to date if your database
   or schema docs change.
 - For large/complex docs, consider caching or chunking for performance.
+- Both tools memoize their output per input for the life of the process
+  (the schema and its docs are static while the app runs); call
+  clear_cache() after changing either.
 """
 
 import json
+from collections import OrderedDict
 from typing import Any
+from pydantic import PrivateAttr
 from langchain.tools import BaseTool
-from langchain_community.vectorstores import Chroma
+from langchain_core.vectorstores import VectorStore
+
+# Distinct RAG queries remembered by SchemaDocRAGTool (least recently used evicted).
+_RAG_CACHE_SIZE = 128
 
 
 class SchemaDocRAGTool(BaseTool):
@@ -30,7 +38,8 @@ class SchemaDocRAGTool(BaseTool):
     - The agent calls this tool with a user query about tables or columns,
       and receives top-k relevant schema snippets.
     - 'vectorstore' must be an initialized Chroma instance containing
-      embedded schema docs.
+      embedded schema docs (typed as the langchain_core VectorStore base, so
+      importing this module does not load chromadb).
 
     Production Remarks:
     - If schema_docs is large, chunk or partition it to avoid index blowout.
@@ -43,7 +52,9 @@ class SchemaDocRAGTool(BaseTool):
         "Input: any question about tables or columns. Output: relevant snippet(s)."
     )
 
-    vectorstore: Chroma  # Provided at initialization
+    vectorstore: VectorStore  # Provided at initialization (a Chroma instance)
+
+    _cache: OrderedDict = PrivateAttr(default_factory=OrderedDict)
 
     def _run(self, query: str) -> str:
         """
@@ -52,17 +63,34 @@ class SchemaDocRAGTool(BaseTool):
 
         Returns:
             A string containing snippet(s) of doc text with similarity scores.
+
+        Repeated queries are answered from a bounded LRU cache, skipping the
+        query embedding request and the vector search.
         """
+        cached = self._cache.get(query)
+        if cached is not None:
+            self._cache.move_to_end(query)
+            return cached
+
         docs_and_scores = self.vectorstore.similarity_search_with_score(query, k=3)
         if not docs_and_scores:
-            return "No relevant schema snippet found."
-
-        lines = []
-        for doc, score in docs_and_scores:
-            lines.append(
+            result = "No relevant schema snippet found."
+        else:
+            result = "\n\n".join(
                 f"score={score:.2f}, table_name={doc.metadata.get('table_name', '')}\nContent:\n{doc.page_content}"
+                for doc, score in docs_and_scores
             )
-        return "\n\n".join(lines)
+
+        self._cache[query] = result
+        if len(self._cache) > _RAG_CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return result
+
+    def clear_cache(self) -> None:
+        """
+        Forget memoized search results (e.g. after re-embedding the schema docs).
+        """
+        self._cache.clear()
 
     async def _arun(self, query: str) -> str:
         """
@@ -92,33 +120,58 @@ class ExtendedSQLSchemaTool(BaseTool):
     sql_schema_tool: BaseTool  # Typically the standard 'sql_db_schema' tool
     doc_source: dict           # Dictionary mapping table_name -> {table_comment, columns}
 
+    _cache: dict = PrivateAttr(default_factory=dict)
+    _doc_parts: dict = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context: Any) -> None:
+        """
+        Formats the doc_source block of every table once, at construction.
+        """
+        super().model_post_init(__context)
+        for table_name, info in self.doc_source.items():
+            lines = [f"Table Explanation for {table_name}: {info.get('table_comment', '')}"]
+            lines.append("Column meanings:")
+            for col, desc in info["columns"].items():
+                lines.append(f" - {col}: {desc}")
+            self._doc_parts[table_name] = "\n".join(lines)
+
     def _run(self, table_name: str) -> str:
         """
         1) Use 'sql_schema_tool' to retrieve CREATE TABLE info + sample rows.
         2) Look up doc_source for the same table, merging in business or domain context.
+
+        The combined output is memoized per table name, so repeated lookups
+        skip the schema introspection query. Error strings from the schema
+        tool (e.g. an unknown table) are not cached.
         """
         table_name = table_name.strip()
+        cached = self._cache.get(table_name)
+        if cached is not None:
+            return cached
+
         # 1) Query the DB schema from the underlying tool
         try:
             db_schema_str = self.sql_schema_tool.run(table_name)
         except Exception as e:
             raise Exception(f"Error calling sql_db_schema: {e}")
 
-        # 2) Merge with doc_source business context
-        if table_name in self.doc_source:
-            info = self.doc_source[table_name]
-            lines = [f"Table Explanation for {table_name}: {info.get('table_comment', '')}"]
-            lines.append("Column meanings:")
-            for col, desc in info["columns"].items():
-                lines.append(f" - {col}: {desc}")
-            doc_part = "\n".join(lines)
-        else:
+        # 2) Merge with doc_source business context (pre-formatted in model_post_init)
+        doc_part = self._doc_parts.get(table_name)
+        if doc_part is None:
             doc_part = f"(No extended doc found for table '{table_name}')."
 
         # Return a combined string with both DB schema + doc commentary
         combined = f"{db_schema_str}\n\n=== Additional Business Doc ===\n{doc_part}"
+        if not db_schema_str.startswith("Error:"):
+            self._cache[table_name] = combined
         return combined
 
+    def clear_cache(self) -> None:
+        """
+        Forget memoized schema output (e.g. after a schema migration).
+        """
+        self._cache.clear()
+
     async def _arun(self, table_name: str) -> str:
         """
         Async wrapper if the caller requires awaitable usage.
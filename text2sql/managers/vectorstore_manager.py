@@ -9,6 +9,8 @@ This module defines a VectorStoreManager class responsible for:
 1. Reading local schema documentation from a JSON file (schema_docs.json).
 2. Converting each table's metadata into a Document object.
 3. Building a Chroma vector store using OpenAIEmbeddings for semantic search.
+4. Optionally persisting that store on disk, keyed by a hash of the schema docs,
+   so later runs reuse the embeddings instead of recomputing them.
 
 In a production setting, this pattern is useful when you want to retrieve
 structured knowledge (like table schemas) by semantic similarity queries.
@@ -17,18 +19,29 @@ and the agent can perform a similarity search on your schema docs to retrieve
 the relevant snippet without building an extremely large context prompt.
 """
 
-import os
-import getpass
+import hashlib
 import json
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any, List, Optional
 
 from langchain.docstore.document import Document
-from langchain_community.vectorstores import Chroma
-from langchain_openai import OpenAIEmbeddings
 
+if TYPE_CHECKING:
+    # Imported lazily in _build_vectorstore: chromadb and the embeddings client
+    # are heavy, and the vectorstore is only built on the first agent query.
+    from langchain_community.vectorstores import Chroma
 
-@dataclass
+from .config_manager import get_openai_key
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is optional
+    _json_loads = json.loads
+
+
+@dataclass(slots=True)
 class VectorStoreManager:
     """
     Creates a Chroma vector store from a schema_docs.json file.
@@ -38,11 +51,20 @@ class VectorStoreManager:
     - If the JSON is extremely large, you may need streaming or chunking 
       to keep memory usage feasible.
     - For security, OPENAI_API_KEY is retrieved from environment or interactive prompt
-      rather than hard-coded in any config.
+      (via config_manager.get_openai_key) rather than hard-coded in any config.
+    - schema_docs may be passed in already parsed, so callers that also need
+      the dictionary read the JSON file only once.
+    - With persist_directory set, the collection is stored on disk under a name
+      derived from collection_name and a hash of the schema docs plus the
+      embedding model: an unchanged schema reuses the stored embeddings (no
+      embedding calls), while any edit to the docs or a different model yields
+      a new collection that is embedded once.
     """
     schema_docs_path: str
     collection_name: str
-    vectorstore: Chroma = field(init=False)
+    schema_docs: Optional[dict] = None
+    persist_directory: str = ""
+    vectorstore: "Chroma" = field(init=False)
 
     def __post_init__(self):
         """
@@ -52,35 +74,20 @@ class VectorStoreManager:
         """
         self.vectorstore = self._build_vectorstore()
 
-    def _build_vectorstore(self) -> Chroma:
+    @staticmethod
+    def _build_documents(schema_docs: dict) -> List[Document]:
         """
-        Reads schema_docs_path JSON, then builds a Chroma vectorstore using OpenAIEmbeddings.
-
-        Returns:
-            A Chroma instance populated with embeddings for each table's metadata.
-
-        Production-level notes:
-        - If performance is critical, consider caching the Chroma index on disk.
-        - If schema_docs.json is updated frequently, you may need an update mechanism.
-        - If you have large amounts of text, consider chunking or partial loading.
+        Formats each table's schema info into a Document for embedding. Only
+        needed when embeddings are computed; a reused persisted collection
+        skips it.
         """
-        # Confirm the presence of schema_docs.json
-        if not os.path.exists(self.schema_docs_path):
-            raise FileNotFoundError(f"schema_docs.json not found at {self.schema_docs_path}")
-
-        # Load the schema documentation as a Python dictionary
-        with open(self.schema_docs_path, "r", encoding="utf-8") as f:
-            schema_docs = json.load(f)
-
         # Build a list of Document objects, each representing a table's schema info
         doc_list = []
         for table_name, info in schema_docs.items():
             table_comment = info.get("table_comment", "")
-            cols = info.get("columns", {})
-            col_texts = []
-            for col, desc in cols.items():
-                col_texts.append(f"{col}: {desc}")
-            col_section = "\n".join(col_texts)
+            col_section = "\n".join(
+                f"{col}: {desc}" for col, desc in info.get("columns", {}).items()
+            )
 
             # Create a text block that includes table name, comment, and columns
             text_chunk = (
@@ -92,21 +99,61 @@ class VectorStoreManager:
             doc_list.append(
                 Document(page_content=text_chunk, metadata={"table_name": table_name})
             )
+        return doc_list
+
+    def _build_vectorstore(self) -> "Chroma":
+        """
+        Reads schema_docs_path JSON, then builds a Chroma vectorstore using OpenAIEmbeddings.
+
+        Returns:
+            A Chroma instance populated with embeddings for each table's metadata.
 
-        # Ensure we have an OpenAI API key. If not set, prompt the user for it.
-        _api_key = os.environ.get("OPENAI_API_KEY")
-        if not _api_key:
-            _api_key = getpass.getpass("Enter your OPENAI_API_KEY: ")
-            os.environ["OPENAI_API_KEY"] = _api_key
+        Production-level notes:
+        - The Chroma index is cached on disk when persist_directory is set
+          (see the class notes); otherwise it lives in memory for this process.
+        - If you have large amounts of text, consider chunking or partial loading.
+        - Chroma and OpenAIEmbeddings are imported here rather than at module
+          load, so importing this module stays cheap.
+        """
+        from langchain_community.vectorstores import Chroma
+        from langchain_openai import OpenAIEmbeddings
+
+        schema_docs = self.schema_docs
+        if schema_docs is None:
+            # Load the schema documentation as a Python dictionary
+            # (raw bytes: orjson decodes the UTF-8 itself)
+            try:
+                with open(self.schema_docs_path, "rb") as f:
+                    schema_docs = _json_loads(f.read())
+            except FileNotFoundError as e:
+                raise FileNotFoundError(f"schema_docs.json not found at {self.schema_docs_path}") from e
+
+        # Ensure we have an OpenAI API key (cached; prompts at most once per process).
+        _api_key = get_openai_key()
 
         # Create the embeddings object. In production, you might customize 
         # model_name or other parameters in OpenAIEmbeddings.
         embeddings = OpenAIEmbeddings(openai_api_key=_api_key)
 
+        if self.persist_directory:
+            # Reuse the on-disk collection for this exact schema and embedding
+            # model, embedding only on first use
+            digest = hashlib.sha256(
+                json.dumps({"model": embeddings.model, "docs": schema_docs}, sort_keys=True).encode("utf-8")
+            ).hexdigest()[:16]
+            vectorstore = Chroma(
+                collection_name=f"{self.collection_name}_{digest}",
+                embedding_function=embeddings,
+                persist_directory=self.persist_directory
+            )
+            if not vectorstore.get(limit=1)["ids"]:
+                vectorstore.add_documents(self._build_documents(schema_docs))
+            return vectorstore
+
         # Build a Chroma instance from the documents
         # 'collection_name' logically groups these embeddings for semantic queries.
         return Chroma.from_documents(
-            documents=doc_list,
+            documents=self._build_documents(schema_docs),
             embedding=embeddings,
             collection_name=self.collection_name
         )
\ No newline at end of file